@@ -1,5 +1,6 @@
 import ScenarioGUI.gui_classes.gui_structure_classes as elements
 
+from .gui_classes.gui_calculation_pipeline import ArtifactCache, CalculationPipeline
 from .gui_classes.gui_combine_window import MainWindow
 from .gui_classes.gui_structure import GuiStructure
 from .translation_csv_to_py import translate_csv_2_class
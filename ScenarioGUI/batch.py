@@ -0,0 +1,281 @@
+"""
+script to calculate the scenarios of project files without the GUI.
+All scenarios without results are calculated in parallel worker processes and the results are written back
+into the project files.
+
+Examples
+--------
+>>> python -m ScenarioGUI.batch --function my_package.calculation:data_2_results --config gui_config.ini project_1.scenario project_2.scenario
+>>> python -m ScenarioGUI.batch -f my_package.calculation:data_2_results --gui-structure my_package.gui:GUI --result-class my_package.results:Results old.scenario
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from os.path import splitext
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import PySide6.QtWidgets as QtW
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.gui_classes.gui_backup_journal import read_journal
+from ScenarioGUI.gui_classes.gui_binary_format import read_binary, write_binary
+from ScenarioGUI.gui_classes.gui_combine_window import normal_export, normal_import
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+from ScenarioGUI.gui_classes.gui_project_snapshot import write_atomic
+from ScenarioGUI.gui_classes.gui_structure_classes import Page
+from ScenarioGUI.gui_classes.translation_class import Translations
+from ScenarioGUI.gui_classes.gui_worker_pool import WorkerPool
+from ScenarioGUI.utils import load as load_config
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from ScenarioGUI.gui_classes.gui_combine_window import JsonDict
+    from ScenarioGUI.gui_classes.gui_structure import GuiStructure
+
+
+def load_object(path: str) -> object:
+    """
+    This function imports an object from a string like 'package.module:name'.
+
+    Parameters
+    ----------
+    path : str
+        module and name of the object separated by ':'
+
+    Returns
+    -------
+    object
+    """
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+APP: QtW.QApplication | None = None
+
+
+def default_values(gui_structure_class: type[GuiStructure], translations_class: type[Translations] = Translations) -> dict:
+    """
+    This function creates the default values of all options and aims of a GuiStructure without a main window.
+    The pages are created lazily, so only the widgets of the options which can not be used without them are created.
+
+    Parameters
+    ----------
+    gui_structure_class : type[GuiStructure]
+        GuiStructure class of the GUI
+    translations_class : type[Translations]
+        Translations class of the GUI
+
+    Returns
+    -------
+    dict
+        attributes of a DataStorage with the default values
+    """
+    global APP
+    # the pages and aims still need an application, so an offscreen one is created if there is none
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    APP = QtW.QApplication.instance() or QtW.QApplication()
+    lazy = Page.LAZY
+    Page.LAZY = True
+    try:
+        central_widget = QtW.QWidget()
+        translations = translations_class()
+        gui_structure = gui_structure_class(central_widget, translations)
+        stacked_widget, vertical_layout_menu = QtW.QStackedWidget(central_widget), QtW.QVBoxLayout()
+        _ = [page.create_page(central_widget, stacked_widget, vertical_layout_menu) for page in gui_structure.list_of_pages]
+        gui_structure.option_language.set_entries(translations.languages)
+        return vars(DataStorage(gui_structure))
+    finally:
+        Page.LAZY = lazy
+
+
+def is_calculated(results: dict | None, result_class: type | None) -> bool:
+    """
+    This function checks if the results of a scenario are available.
+
+    Parameters
+    ----------
+    results : dict | None
+        to_dict payload of the results
+    result_class : type | None
+        results class with a from_dict function to check if the results can still be loaded (None to not check them)
+
+    Returns
+    -------
+    bool
+        True if the results are available and can be loaded with the result_class
+    """
+    if results is None:
+        return False
+    if result_class is None:
+        return True
+    try:
+        result_class.from_dict(results)  # type: ignore
+    except Exception as err:
+        globs.LOGGER.warning(f"results can not be loaded and are calculated again: {err}")
+        return False
+    return True
+
+
+def calculate_projects(
+    files: list[str | Path],
+    data_2_results_function: Callable[[DataStorage], tuple[object, Callable[[], None]]],
+    *,
+    n_workers: int | None = None,
+    import_functions: dict[str, Callable[[Path], JsonDict]] | None = None,
+    export_functions: dict[str, Callable[[Path, JsonDict], None]] | None = None,
+    gui_structure: GuiStructure | type[GuiStructure] | None = None,
+    translations: type[Translations] = Translations,
+    result_class: type | None = None,
+    version_import_functions: dict[str, Callable[[JsonDict], JsonDict]] | None = None,
+) -> int:
+    """
+    This function calculates all scenarios without results of the project files and saves the results in these files.
+    Without a gui_structure, the scenarios only have the values stored in the files, so files of another version
+    can only be calculated if there is a version import function for them.
+    With a gui_structure, options which are not in the files get their default values and values of options
+    which do not exist anymore are ignored.
+
+    Parameters
+    ----------
+    files : list[str | Path]
+        project files
+    data_2_results_function : Callable
+        function to create the results class and a function to be called in the worker process
+    n_workers : int | None
+        number of worker processes (default: number of cores)
+    import_functions : dict[str, Callable[[Path], JsonDict]] | None
+        additional import functions per file extension
+    export_functions : dict[str, Callable[[Path, JsonDict], None]] | None
+        additional export functions per file extension
+    gui_structure : GuiStructure | type[GuiStructure] | None
+        GuiStructure class of the GUI, so options which are not in the files get their default values,
+        or a GuiStructure instance, so these options get the values of its widgets (like in the GUI)
+    translations : type[Translations]
+        Translations class of the GUI, to create the GuiStructure class
+    result_class : type | None
+        results class with a from_dict function. Results in the files which can not be loaded with it
+        (e.g. of another version) are calculated again
+    version_import_functions : dict[str, Callable[[JsonDict], JsonDict]] | None
+        functions to import the files of older versions per version (like MainWindow.add_other_version_import_function)
+
+    Returns
+    -------
+    int
+        number of calculated scenarios
+
+    Raises
+    ------
+    ValueError
+        if a file has been saved with another version, without a gui_structure or a version import function for it
+    """
+    if gui_structure is None:
+        defaults = None
+    else:
+        defaults = default_values(gui_structure, translations) if isinstance(gui_structure, type) else vars(DataStorage(gui_structure))
+    import_functions = {
+        globs.FILE_EXTENSION: normal_import,
+        f"{globs.FILE_EXTENSION}BackUp": read_journal,
+        f"{globs.FILE_EXTENSION}Bin": read_binary,
+        **(import_functions or {}),
+    }
+    export_functions = {
+        globs.FILE_EXTENSION: normal_export,
+        f"{globs.FILE_EXTENSION}BackUp": normal_export,
+        f"{globs.FILE_EXTENSION}Bin": write_binary,
+        **(export_functions or {}),
+    }
+    version_import_functions = version_import_functions or {}
+    projects: list[JsonDict] = []
+    for file in files:
+        saving: JsonDict = import_functions[splitext(file)[1].replace(".", "")](Path(file))
+        if saving["version"] in version_import_functions:
+            saving = version_import_functions[saving["version"]](saving)
+        elif gui_structure is None and saving["version"] != globs.VERSION:
+            raise ValueError(
+                f"{file} has been saved with version {saving['version']} instead of {globs.VERSION}. "
+                "Pass the gui_structure (--gui-structure) or a version import function, so the scenarios get values for all options."
+            )
+        projects.append(saving)
+
+    def create_data_storage(values: dict) -> DataStorage:
+        if defaults is None:
+            return DataStorage.from_values(values)
+        return DataStorage.from_values({**defaults, **{key: value for key, value in values.items() if key in defaults}})
+
+    # create a DataStorage of every scenario which has not been calculated
+    tasks: list[tuple[JsonDict, int, DataStorage]] = [
+        (saving, idx, create_data_storage(values))
+        for saving in projects
+        for idx, (values, results) in enumerate(zip(saving["values"], saving["results"]))
+        if not is_calculated(results, result_class)
+    ]
+    pool = WorkerPool(data_2_results_function, n_workers if n_workers is not None else os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(pool.size) as executor:
+            outputs = list(
+                executor.map(
+                    lambda task: pool.run(task[2], getattr(task[2], "time_out", None), statistics=partial(setattr, task[2], "run_statistics")), tasks
+                )
+            )
+    finally:
+        pool.shutdown()
+    for (saving, idx, d_s), (debug_message, results) in zip(tasks, outputs):
+        saving["results"][idx] = None if results is None else results.to_dict()
+        list_statistics = saving.setdefault("statistics", [None] * len(saving["names"]))
+        list_statistics[idx] = None if d_s.run_statistics is None else d_s.run_statistics.to_dict()
+        saving["values"][idx]["debug_message"] = f"{debug_message}"
+        if debug_message:
+            globs.LOGGER.error(f"{saving['names'][idx]}: {debug_message}")
+    for file, saving in zip(files, projects):
+        # the arrays of a binary project file can be memory-mapped, so the file is replaced instead of overwritten
+        export_function = export_functions[splitext(file)[1].replace(".", "")]
+        write_atomic(Path(file), lambda temporary, function=export_function, data=saving: function(temporary, data))
+        globs.LOGGER.info(f"{file}: {sum(task[0] is saving for task in tasks)} scenarios calculated")
+    return len(tasks)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    This function runs the batch calculation from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        command line arguments (default: sys.argv)
+
+    Returns
+    -------
+    int
+        number of calculated scenarios
+    """
+    parser = argparse.ArgumentParser(prog="python -m ScenarioGUI.batch", description="Calculate all scenarios without results of project files.")
+    parser.add_argument("files", nargs="+", help="project files")
+    parser.add_argument("-f", "--function", required=True, help="data_2_results_function as 'package.module:name'")
+    parser.add_argument("-c", "--config", help="gui_config.ini of the GUI (sets e.g. the file extension)")
+    parser.add_argument("-n", "--workers", type=int, default=None, help="number of worker processes (default: number of cores)")
+    parser.add_argument("-g", "--gui-structure", help="GuiStructure class as 'package.module:name' to get the default values of options missing in the files")
+    parser.add_argument("-t", "--translations", help="Translations class of the GUI as 'package.module:name' (default: the one of ScenarioGUI)")
+    parser.add_argument("-r", "--result-class", help="results class as 'package.module:name' to calculate results which can not be loaded again")
+    args = parser.parse_args(argv)
+    if args.config is not None:
+        load_config(Path(args.config))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return calculate_projects(
+        args.files,
+        load_object(args.function),
+        n_workers=args.workers,
+        gui_structure=None if args.gui_structure is None else load_object(args.gui_structure),
+        translations=Translations if args.translations is None else load_object(args.translations),
+        result_class=None if args.result_class is None else load_object(args.result_class),
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,83 @@
+"""
+script to convert project files between the JSON and the binary project format.
+By default, JSON project files are converted to binary project files next to them and binary project files to JSON.
+
+Examples
+--------
+>>> python -m ScenarioGUI.convert --config gui_config.ini project_1.scenario project_2.scenario
+>>> python -m ScenarioGUI.convert --config gui_config.ini project_1.scenarioBin --output project_1.scenario
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+from os.path import splitext
+from pathlib import Path
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.gui_classes.gui_backup_journal import read_journal
+from ScenarioGUI.gui_classes.gui_binary_format import read_binary, write_binary
+from ScenarioGUI.gui_classes.gui_combine_window import normal_export, normal_import
+from ScenarioGUI.gui_classes.gui_project_snapshot import write_atomic
+from ScenarioGUI.utils import load as load_config
+
+
+def convert_project(file: str | Path, output: str | Path | None = None) -> Path:
+    """
+    This function converts a project file. The format of the output is chosen by its file extension.
+
+    Parameters
+    ----------
+    file : str | Path
+        project file (JSON, backup or binary project file)
+    output : str | Path | None
+        converted file (default: the file with the binary extension, or the JSON extension for a binary file)
+
+    Returns
+    -------
+    Path
+        converted file
+    """
+    binary = f"{globs.FILE_EXTENSION}Bin"
+    import_functions = {globs.FILE_EXTENSION: normal_import, f"{globs.FILE_EXTENSION}BackUp": read_journal, binary: read_binary}
+    export_functions = {globs.FILE_EXTENSION: normal_export, binary: write_binary}
+    file_extension = splitext(file)[1].replace(".", "")
+    if output is None:
+        output = Path(file).with_suffix(f".{globs.FILE_EXTENSION if file_extension == binary else binary}")
+    # the arrays are read into memory, so the file itself can be the output
+    saving = read_binary(Path(file), memory_map=False) if file_extension == binary else import_functions[file_extension](Path(file))
+    export_function = export_functions[splitext(output)[1].replace(".", "")]
+    write_atomic(Path(output), lambda temporary: export_function(temporary, saving))
+    globs.LOGGER.info(f"{file} -> {output}")
+    return Path(output)
+
+
+def main(argv: list[str] | None = None) -> list[Path]:
+    """
+    This function converts the project files from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        command line arguments (default: sys.argv)
+
+    Returns
+    -------
+    list[Path]
+        converted files
+    """
+    parser = argparse.ArgumentParser(prog="python -m ScenarioGUI.convert", description="Convert project files between the JSON and the binary format.")
+    parser.add_argument("files", nargs="+", help="project files")
+    parser.add_argument("-o", "--output", help="converted file (only for a single project file)")
+    parser.add_argument("-c", "--config", help="gui_config.ini of the GUI (sets e.g. the file extension)")
+    args = parser.parse_args(argv)
+    if args.output is not None and len(args.files) > 1:
+        parser.error("--output can only be used with a single project file")
+    if args.config is not None:
+        load_config(Path(args.config))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return [convert_project(file, args.output) for file in args.files]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
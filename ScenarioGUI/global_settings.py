@@ -5,18 +5,50 @@ from __future__ import annotations
 
 import logging
 from configparser import ConfigParser, NoSectionError
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as distribution_version
 from pathlib import Path
 
 path = Path(__file__).parent.absolute()
 
 
 def get_path_for_file(start_path: Path, filename: str) -> Path:
-    path_i = start_path.absolute()
-    for _ in range(6):
-        items = [item.parent for item in path_i.glob(f"**/{filename}")]
+    """
+    This function finds the folder of the file in the start path or in one of its (up to five) parents.
+    The folders themselves are checked first, so the slow recursive search in their sub folders is only done if the
+    file is not found directly. The found folders are cached.
+
+    Parameters
+    ----------
+    start_path : Path
+        folder to start the search from
+    filename : str
+        name of the file (or folder) to be found
+
+    Returns
+    -------
+    Path
+        folder which contains the file
+
+    Raises
+    ------
+    FileNotFoundError
+        if the file is not found
+    """
+    return _find_path(start_path.absolute(), filename)
+
+
+@lru_cache(maxsize=None)
+def _find_path(start_path: Path, filename: str) -> Path:
+    folders = [start_path, *start_path.parents][:6]
+    for folder in folders:
+        if folder.joinpath(filename).exists():
+            return folder
+    for folder in folders:
+        items = [item.parent for item in folder.glob(f"**/{filename}")]
         if items:
             return items[0]
-        path_i = path_i.parent
     raise FileNotFoundError
 
 
@@ -50,7 +82,39 @@ def find_version(version_path: Path) -> str:
         return "0.0.0"
 
 
-VERSION = find_version(get_path_for_file(Path(__file__).parent.absolute(), "setup.cfg"))
+@lru_cache(maxsize=None)
+def get_version(distribution: str | None, source_folder: Path | None = None) -> str:
+    """
+    This function gets the version without searching the file system. The version in the setup.cfg of the
+    source folder (e.g. of a source checkout) is used first, then the one of the installed distribution.
+    The versions are cached.
+
+    Parameters
+    ----------
+    distribution : str | None
+        name of the installed distribution (None if it is not installed)
+    source_folder : Path | None
+        folder which can contain the setup.cfg
+
+    Returns
+    -------
+    str
+        version or "0.0.0" if it is not found
+    """
+    if source_folder is not None and source_folder.joinpath("setup.cfg").exists():
+        config = ConfigParser()
+        config.read(source_folder.joinpath("setup.cfg"))
+        if config.has_option("metadata", "version"):
+            return config.get("metadata", "version")
+    if distribution is None:
+        return "0.0.0"
+    try:
+        return distribution_version(distribution)
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+VERSION = get_version("ScenarioGUI", path.parent)
 LOGGER = logging.getLogger()
 LOGGER.setLevel(logging.INFO)
 
@@ -0,0 +1,140 @@
+"""
+This document contains the background saver, which writes the project and backup files in a SavingThread.
+"""
+from __future__ import annotations
+
+import datetime
+import time
+from functools import partial as ft_partial
+from typing import TYPE_CHECKING
+
+import PySide6.QtCore as QtC
+
+import ScenarioGUI.global_settings as globs
+
+from .gui_saving_thread import SavingThread
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+class BackgroundSaver(QtC.QObject):
+    """
+    class of a single background saver, which only keeps the latest pending save per target file.
+    The saves are debounced, so a burst of changes writes the file only once, and the pending saves are run together
+    in one SavingThread at a time.
+    """
+
+    saved = QtC.Signal(str, float)  # target and duration in seconds of a successful save
+    failed = QtC.Signal(str, str)  # target and name of the error of a failed save
+
+    def __init__(self, delay: int = 500, start_threads: bool = True, parent: QtC.QObject | None = None):
+        """
+        This function initialises the background saver.
+
+        Parameters
+        ----------
+        delay : int
+            time in milliseconds without a new save before the debounced saves are written
+        start_threads : bool
+            False if the saves should only be written by flush (e.g. in the tests)
+        parent : QtC.QObject | None
+            parent object
+        """
+        super().__init__(parent)
+        self.delay = delay
+        self.start_threads = start_threads
+        self.pending: dict[str, Callable[[], None]] = {}
+        self.thread: SavingThread | None = None
+        self.running: bool = False
+        self.last_save_time: datetime.datetime | None = None
+        self.last_save_duration: float | None = None
+        self.timer = QtC.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.start)
+
+    def save(self, target: str | Path, func: Callable[[], None], debounce: bool = True) -> None:
+        """
+        This function adds a save of the target file. A pending save of the same target is replaced.
+
+        Parameters
+        ----------
+        target : str | Path
+            file which is written by the function
+        func : Callable[[], None]
+            function which writes the file
+        debounce : bool
+            True if the save should wait for further saves, False if it should be written as soon as possible
+
+        Returns
+        -------
+        None
+        """
+        self.pending[f"{target}"] = func
+        if not self.start_threads:
+            return
+        if debounce:
+            self.timer.start(self.delay)
+            return
+        self.timer.stop()
+        self.start()
+
+    def start(self) -> None:
+        """
+        This function starts a SavingThread with the pending saves. If a thread is still running, the pending saves are
+        started after it has finished.
+
+        Returns
+        -------
+        None
+        """
+        if not self.pending or self.running:
+            return
+        pending, self.pending = self.pending, {}
+        self.running = True
+        self.thread = SavingThread(datetime.datetime.now(), ft_partial(self._run, pending), self)
+        self.thread.finished.connect(self._finished)
+        self.thread.start()
+
+    def _finished(self) -> None:
+        self.running = False
+        self.start() if not self.timer.isActive() else None
+
+    def _run(self, pending: dict[str, Callable[[], None]]) -> None:
+        for target, func in pending.items():
+            start = time.perf_counter()
+            try:
+                func()
+            except Exception as error:
+                # an unexpected error (e.g. of the serialisation) would otherwise end the SavingThread without any notice
+                globs.LOGGER.exception(f"saving {target} failed") if not isinstance(error, OSError) else None
+                self.failed.emit(target, type(error).__name__)
+                continue
+            self.last_save_time, self.last_save_duration = datetime.datetime.now(), time.perf_counter() - start
+            self.saved.emit(target, self.last_save_duration)
+
+    def flush(self) -> None:
+        """
+        This function waits for the running SavingThread and writes the pending saves directly.
+
+        Returns
+        -------
+        None
+        """
+        self.timer.stop()
+        self.thread.wait() if self.thread is not None else None
+        pending, self.pending = self.pending, {}
+        self._run(pending)
+
+    def cancel(self) -> None:
+        """
+        This function removes the pending saves and waits for the running SavingThread.
+
+        Returns
+        -------
+        None
+        """
+        self.timer.stop()
+        self.pending.clear()
+        self.thread.wait() if self.thread is not None else None
@@ -0,0 +1,240 @@
+"""
+This document contains the journal of the backup file. Instead of writing the whole project on every automatic save,
+only the changes of the scenarios since the previous save are appended to the backup file.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from json import JSONDecodeError, dumps, load, loads
+from typing import TYPE_CHECKING
+
+from .gui_project_snapshot import json_default, write_atomic
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from .gui_project_snapshot import ProjectSnapshot, ScenarioSnapshot
+
+JOURNAL_VERSION: int = 1
+
+
+def _results(scenario: ScenarioSnapshot) -> dict | None:
+    return None if scenario.results is None else scenario.results.to_dict()
+
+
+def _statistics(scenario: ScenarioSnapshot) -> dict | None:
+    return None if scenario.statistics is None else scenario.statistics.to_dict()
+
+
+class BackupJournal:
+    """
+    class of the backup file as an append-only journal with one JSON record per line.
+    The first line is a snapshot of the whole project, in which every scenario has a key. Every following line is a
+    change of a single scenario (name, values, results or statistics), the removal of scenarios, a new order of the
+    scenarios or new file names. A scenario is seen as changed if its values, results or statistics object has
+    been replaced, so the costs of a save only depend on the number of changed scenarios.
+    The journal is compacted into a new snapshot if it has too many records or has grown larger than the snapshot.
+    """
+
+    def __init__(self, file: Path, max_records: int = 1_000, max_growth: float = 1.0):
+        """
+        This function initialises the journal.
+
+        Parameters
+        ----------
+        file : Path
+            backup file
+        max_records : int
+            maximal number of records after the snapshot before the journal is compacted
+        max_growth : float
+            maximal size of the records relative to the size of the snapshot before the journal is compacted
+        """
+        self.file = file
+        self.max_records = max_records
+        self.max_growth = max_growth
+        self.records: int = 0  # number of records after the snapshot
+        self.size_snapshot: int = 0
+        self.size_records: int = 0
+        self.valid: bool = False  # True if the file contains the state which is stored below
+        self._stat: tuple[int, int] | None = None  # modification time and size of the file after the last write
+        self._keys: dict[int, int] = {}  # key of the scenario by the id of its values
+        self._written: dict[int, ScenarioSnapshot] = {}  # written state by key
+        self._order: list[int] = []
+        self._meta: dict = {}
+        self._next_key: int = 0
+        self._lock = threading.Lock()
+
+    def _file_stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def needs_compaction(self) -> bool:
+        """
+        This function checks if the next save has to write a new snapshot.
+        This is also the case if the file has been removed or written by someone else.
+
+        Returns
+        -------
+        bool
+            True if a snapshot has to be written
+        """
+        if not self.valid or self._file_stat() != self._stat:
+            return True
+        return self.records >= self.max_records or self.size_records > self.max_growth * self.size_snapshot
+
+    def save(self, snapshot: ProjectSnapshot) -> None:
+        """
+        This function saves the changes of the scenarios since the previous save, or a new snapshot if the journal
+        has to be compacted.
+
+        Parameters
+        ----------
+        snapshot : ProjectSnapshot
+            snapshot of the project
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OSError
+            if the file could not be written. The next save will write a new snapshot.
+        """
+        with self._lock:
+            try:
+                if self.needs_compaction():
+                    self._write_snapshot(snapshot)
+                    return
+                records, keys, changed = self._create_records(snapshot)
+                # if most of the scenarios have changed, a snapshot is not larger than the records
+                if 2 * changed > len(snapshot.scenarios):
+                    self._write_snapshot(snapshot)
+                    return
+                self._append(records)
+                self._set_state(snapshot, keys)
+            except OSError:
+                self.valid = False
+                raise
+
+    def _create_records(self, snapshot: ProjectSnapshot) -> tuple[list[dict], list[int], int]:
+        keys = [self._keys.get(id(scenario.values), -1) for scenario in snapshot.scenarios]
+        keys = [key if key in self._written and self._written[key].values is scenario.values else -1 for key, scenario in zip(keys, snapshot.scenarios)]
+        used = set(keys)
+        new_keys: list[int] = []
+        for idx, key in enumerate(keys):
+            if key >= 0:
+                continue
+            # a replaced DataStorage (e.g. by save_scenario) keeps the key of the scenario at its position
+            if idx < len(self._order) and self._order[idx] not in used:
+                keys[idx] = self._order[idx]
+            else:
+                keys[idx] = self._next_key + len(new_keys)
+                new_keys.append(keys[idx])
+            used.add(keys[idx])
+        scenario_records: list[dict] = []
+        for scenario, key in zip(snapshot.scenarios, keys):
+            written = self._written.get(key)
+            if written is None or written.values is not scenario.values:
+                record = {"key": key, "name": scenario.name, "values": scenario.values}
+                record.update(results=_results(scenario), statistics=_statistics(scenario))
+            else:
+                record = {"key": key}
+                record.update({"name": scenario.name} if scenario.name != written.name else {})
+                record.update({"results": _results(scenario)} if scenario.results is not written.results else {})
+                record.update({"statistics": _statistics(scenario)} if scenario.statistics is not written.statistics else {})
+            scenario_records.append(record) if len(record) > 1 else None
+        current = set(keys)
+        removed = [key for key in self._order if key not in current]
+        records = [{"meta": snapshot.meta}] if snapshot.meta != self._meta else []
+        records += [{"remove": removed}] if removed else []
+        records += scenario_records
+        # new scenarios are appended at the end, every other change of the order is written explicitly
+        if [key for key in self._order if key in current] + new_keys != keys:
+            records.append({"order": keys})
+        return records, keys, len(scenario_records)
+
+    def _append(self, records: list[dict]) -> None:
+        if not records:
+            return
+        text = "".join(f"{dumps(record, default=json_default)}\n" for record in records)
+        with open(self.file, "a") as file:
+            file.write(text)
+        self.records += len(records)
+        self.size_records += len(text)
+        self._stat = self._file_stat()
+
+    def _write_snapshot(self, snapshot: ProjectSnapshot) -> None:
+        self.valid = False
+        keys = list(range(len(snapshot.scenarios)))
+        text = f"{dumps({**snapshot.to_dict(), 'journal': JOURNAL_VERSION, 'keys': keys}, default=json_default)}\n"
+        # the previous journal is only replaced once the snapshot is completely written
+        write_atomic(self.file, lambda location: location.write_text(text))
+        self.records, self.size_records, self.size_snapshot = 0, 0, len(text)
+        self._stat = self._file_stat()
+        self._next_key = 0
+        self._set_state(snapshot, keys)
+        self.valid = True
+
+    def _set_state(self, snapshot: ProjectSnapshot, keys: list[int]) -> None:
+        self._keys = {id(scenario.values): key for scenario, key in zip(snapshot.scenarios, keys)}
+        self._written = dict(zip(keys, snapshot.scenarios))
+        self._order = keys
+        self._meta = snapshot.meta
+        self._next_key = max(self._next_key, max(keys, default=-1) + 1)
+
+
+def read_journal(location: Path) -> dict:
+    """
+    This function reads the backup journal and replays its records on the snapshot.
+    An incomplete last record of an interrupted save is ignored. Backup files of previous versions, which contain the
+    whole project as JSON, are read as well.
+
+    Parameters
+    ----------
+    location : Path
+        path to the backup file
+
+    Returns
+    -------
+    dict
+        project data like the one of the JSON project files
+    """
+    with open(location) as file:
+        try:
+            saving = loads(file.readline())
+        except JSONDecodeError:
+            saving = None
+        if not isinstance(saving, dict) or "journal" not in saving:
+            file.seek(0)
+            return load(file)
+        fields = ("name", "values", "results", "statistics")
+        scenarios = {
+            key: dict(zip(fields, values))
+            for key, *values in zip(saving.pop("keys"), saving["names"], saving["values"], saving["results"], saving["statistics"])
+        }
+        order = list(scenarios)
+        for line in file:
+            try:
+                record = loads(line)
+            except JSONDecodeError:  # the last save has been interrupted
+                break
+            if "meta" in record:
+                saving.update(record["meta"])
+            elif "remove" in record:
+                removed = set(record["remove"])
+                order = [key for key in order if key not in removed]
+            elif "order" in record:
+                order = record["order"]
+            else:
+                key = record.pop("key")
+                if key not in scenarios:
+                    order.append(key)
+                scenarios.setdefault(key, {}).update(record)
+    saving.pop("journal")
+    saving.update({f"{field}s" if field == "name" else field: [scenarios[key][field] for key in order] for field in fields})
+    return saving
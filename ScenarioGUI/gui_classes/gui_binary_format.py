@@ -0,0 +1,410 @@
+"""
+This document contains the compact binary project format. The file is a container of chunks:
+
+- TREE: the project data (like the JSON project files) in a compact tagged encoding
+- ARRS: the table with the data type, shape and offset of every NumPy array in the project data
+- DATA: the raw buffers of the arrays, which are aligned, so they can be memory-mapped on load
+- RIDX: the offset index with the offset and length of the results payload of every scenario in the RSLT chunk
+- RSLT: the results payloads, which are referenced from the project data, so they can be decoded when they are needed
+
+Every chunk starts with a 4 byte tag, the number of padding bytes (uint32) and the length of the payload (uint64).
+Chunks with an unknown tag are skipped, so new chunks can be added without breaking older readers.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from typing import TYPE_CHECKING, BinaryIO
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+    from pathlib import Path
+
+MAGIC: bytes = b"SGUIBIN\x01"
+ALIGNMENT: int = 64
+# a memory-mapped file cannot be replaced on Windows, so it would not be possible to save the project again
+MEMORY_MAP: bool = sys.platform != "win32"
+
+_CHUNK = struct.Struct("<4sIQ")
+_LENGTH = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+
+class BinaryFormatError(ValueError):
+    """
+    error if a file is not a valid binary project file
+    """
+
+
+class _Reference(int):
+    """
+    reference to a payload which is encoded separately
+    """
+
+
+class _Encoder:
+    """
+    encoder of the project data, which collects the NumPy arrays and the separate payloads
+    """
+
+    def __init__(self):
+        self.parts: list[bytes] = []
+        self.arrays: list[np.ndarray] = []
+        self.payloads: list[bytes] = []
+
+    def payload(self, value: object) -> _Reference:
+        parts, self.parts = self.parts, []
+        self.encode(value)
+        self.payloads.append(b"".join(self.parts))
+        self.parts = parts
+        return _Reference(len(self.payloads) - 1)
+
+    def _str(self, value: str) -> None:
+        data = value.encode()
+        self.parts += [_LENGTH.pack(len(data)), data]
+
+    def encode(self, value: object) -> None:  # noqa: PLR0911
+        if value is None:
+            self.parts.append(b"N")
+            return
+        if isinstance(value, (bool, np.bool_)):
+            self.parts.append(b"T" if value else b"F")
+            return
+        if isinstance(value, _Reference):
+            self.parts += [b"r", _LENGTH.pack(value)]
+            return
+        if isinstance(value, (int, np.integer)):
+            if -(2**63) <= value < 2**63:
+                self.parts += [b"i", _INT.pack(int(value))]
+                return
+            self.parts.append(b"I")
+            self._str(f"{value}")
+            return
+        if isinstance(value, (float, np.floating)):
+            self.parts += [b"d", _FLOAT.pack(float(value))]
+            return
+        if isinstance(value, str):
+            self.parts.append(b"s")
+            self._str(value)
+            return
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            self.parts += [b"a", _LENGTH.pack(len(self.arrays))]
+            self.arrays.append(value)
+            return
+        if isinstance(value, (list, tuple, np.ndarray)):
+            self.parts += [b"l", _LENGTH.pack(len(value))]
+            _ = [self.encode(item) for item in value]  # type: ignore
+            return
+        if isinstance(value, dict):
+            self.parts += [b"m", _LENGTH.pack(len(value))]
+            for key, item in value.items():
+                self._str(key if isinstance(key, str) else f"{key}")
+                self.encode(item)
+            return
+        raise TypeError(f"Object of type {type(value).__name__} can not be stored in the binary project format")
+
+
+class _Decoder:
+    """
+    decoder of the project data, which replaces the array and payload references with the arrays and payloads
+    """
+
+    def __init__(self, data: bytes | np.ndarray, arrays: Sequence[np.ndarray] | None = None, payloads: Sequence[object] | None = None):
+        self.data = memoryview(data)  # type: ignore
+        self.pos: int = 0
+        self.arrays = [] if arrays is None else arrays
+        self.payloads = [] if payloads is None else payloads
+
+    def _unpack(self, fmt: struct.Struct) -> int | float:
+        value = fmt.unpack_from(self.data, self.pos)[0]
+        self.pos += fmt.size
+        return value
+
+    def _str(self) -> str:
+        length = self._unpack(_LENGTH)
+        if self.pos + length > len(self.data):
+            raise BinaryFormatError(f"String at position {self.pos} exceeds the data")
+        value = bytes(self.data[self.pos : self.pos + length]).decode()
+        self.pos += length
+        return value
+
+    def decode(self) -> object:  # noqa: PLR0911
+        tag = bytes(self.data[self.pos : self.pos + 1])
+        self.pos += 1
+        if tag == b"N":
+            return None
+        if tag in (b"T", b"F"):
+            return tag == b"T"
+        if tag == b"i":
+            return self._unpack(_INT)
+        if tag == b"I":
+            return int(self._str())
+        if tag == b"d":
+            return self._unpack(_FLOAT)
+        if tag == b"s":
+            return self._str()
+        if tag == b"a":
+            return self.arrays[self._unpack(_LENGTH)]  # type: ignore
+        if tag == b"r":
+            return self.payloads[self._unpack(_LENGTH)]  # type: ignore
+        if tag == b"l":
+            return [self.decode() for _ in range(self._unpack(_LENGTH))]
+        if tag == b"m":
+            return {self._str(): self.decode() for _ in range(self._unpack(_LENGTH))}
+        raise BinaryFormatError(f"Unknown tag {tag!r} at position {self.pos - 1}")
+
+
+def encode(value: object) -> tuple[bytes, list[np.ndarray]]:
+    """
+    This function encodes the value in the compact tagged encoding. The NumPy arrays are not encoded, but referenced
+    by their index in the returned list.
+
+    Parameters
+    ----------
+    value : object
+        value with None, bool, int, float, str, list, tuple, dict and NumPy values
+
+    Returns
+    -------
+    tuple[bytes, list[np.ndarray]]
+        encoded value and arrays
+
+    Raises
+    ------
+    TypeError
+        if the value contains an object which can not be encoded
+    """
+    encoder = _Encoder()
+    encoder.encode(value)
+    return b"".join(encoder.parts), encoder.arrays
+
+
+def decode(data: bytes | np.ndarray, arrays: Sequence[np.ndarray] | None = None, payloads: Sequence[object] | None = None) -> object:
+    """
+    This function decodes a value which has been encoded by the encode function.
+
+    Parameters
+    ----------
+    data : bytes | np.ndarray
+        encoded value (or a uint8 array with it)
+    arrays : Sequence[np.ndarray] | None
+        arrays which are referenced by the encoded value
+    payloads : Sequence[object] | None
+        separately stored payloads which are referenced by the encoded value
+
+    Returns
+    -------
+    object
+        decoded value, in which tuples are lists (like in JSON)
+
+    Raises
+    ------
+    BinaryFormatError
+        if the data is truncated or corrupt
+    """
+    try:
+        return _Decoder(data, arrays, payloads).decode()
+    except BinaryFormatError:
+        raise
+    except (struct.error, IndexError, TypeError, ValueError) as err:
+        raise BinaryFormatError(f"Corrupt data: {err}") from err
+
+
+class _Arrays:
+    """
+    sequence of the arrays of a binary project file, which are created as views of the file buffer when they are used
+    """
+
+    def __init__(self, buffer: np.ndarray, start: int, length: int, table: list[list]):
+        self.buffer = buffer
+        self.start = start
+        self.length = length
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        dtype, shape, offset = self.table[index]
+        length = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        if offset < 0 or offset + length > self.length:
+            raise BinaryFormatError(f"Array {index} exceeds the DATA chunk")
+        start = self.start + offset
+        return self.buffer[start : start + length].view(dtype).reshape(shape)
+
+
+class LazyPayload:
+    """
+    lightweight handle of a payload of a binary project file (e.g. the results of a scenario), which is only decoded
+    when it is loaded
+    """
+
+    def __init__(self, data: np.ndarray, arrays: Sequence[np.ndarray]):
+        """
+        This function initialises the handle.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            uint8 view of the encoded payload in the file buffer
+        arrays : Sequence[np.ndarray]
+            arrays of the file
+        """
+        self.data = data
+        self.arrays = arrays
+
+    def load(self) -> object:
+        """
+        This function decodes the payload. It is decoded again by every call, so the handle stays lightweight.
+
+        Returns
+        -------
+        object
+            decoded payload
+        """
+        return decode(self.data, self.arrays)
+
+
+def _write_chunk(file: BinaryIO, tag: bytes, payload: bytes | None = None, length: int = 0) -> None:
+    length = length if payload is None else len(payload)
+    padding = -(file.tell() + _CHUNK.size) % ALIGNMENT
+    file.write(_CHUNK.pack(tag, padding, length) + b"\x00" * padding)
+    file.write(payload) if payload is not None else None
+
+
+def write_binary(file_path: Path, data: dict) -> None:
+    """
+    This function writes the project data in the binary project format.
+
+    Parameters
+    ----------
+    file_path : Path
+        path to the file
+    data : dict
+        project data like the JsonDict of the JSON project files
+
+    Returns
+    -------
+    None
+    """
+    encoder = _Encoder()
+    if "results" in data:
+        # the results are stored as separate payloads, so they can be decoded when their scenario is used
+        data = {**data, "results": [None if results is None else encoder.payload(results) for results in data["results"]]}
+    encoder.encode(data)
+    tree = b"".join(encoder.parts)
+    index: list[list[int]] = []
+    length = 0
+    for payload in encoder.payloads:
+        index.append([length, len(payload)])
+        length += len(payload)
+    arrays = [np.require(array, requirements="C") for array in encoder.arrays]
+    offsets: list[int] = []
+    length = 0
+    for array in arrays:
+        length += -length % ALIGNMENT
+        offsets.append(length)
+        length += array.nbytes
+    table, _ = encode([[array.dtype.str, list(array.shape), offset] for array, offset in zip(arrays, offsets)])
+    with open(file_path, "wb") as file:
+        file.write(MAGIC)
+        _write_chunk(file, b"TREE", tree)
+        _write_chunk(file, b"RIDX", encode(index)[0])
+        _write_chunk(file, b"RSLT", b"".join(encoder.payloads))
+        _write_chunk(file, b"ARRS", table)
+        _write_chunk(file, b"DATA", length=length)
+        start = file.tell()
+        for array, offset in zip(arrays, offsets):
+            file.write(b"\x00" * (start + offset - file.tell()))
+            file.write(array.reshape(-1).view(np.uint8))
+
+
+def read_chunks(file: BinaryIO) -> dict[bytes, tuple[int, int]]:
+    """
+    This function reads the positions of the chunks of a binary project file.
+
+    Parameters
+    ----------
+    file : BinaryIO
+        file opened in binary mode
+
+    Returns
+    -------
+    dict[bytes, tuple[int, int]]
+        start and length of the payload by the tag of the chunk
+
+    Raises
+    ------
+    BinaryFormatError
+        if the file is not a binary project file or it is truncated
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise BinaryFormatError(f"{file.name} is not a binary project file")
+    size = file.seek(0, 2)
+    file.seek(len(MAGIC))
+    chunks: dict[bytes, tuple[int, int]] = {}
+    header = file.read(_CHUNK.size)
+    while len(header) == _CHUNK.size:
+        tag, padding, length = _CHUNK.unpack(header)
+        chunks[tag] = (file.tell() + padding, length)
+        if chunks[tag][0] + length > size:
+            raise BinaryFormatError(f"{file.name} is truncated in the {tag!r} chunk")
+        file.seek(file.tell() + padding + length)
+        header = file.read(_CHUNK.size)
+    if header:
+        raise BinaryFormatError(f"{file.name} is truncated after the last chunk")
+    return chunks
+
+
+def read_binary(location: Path, memory_map: bool = MEMORY_MAP, lazy: bool = False) -> dict:
+    """
+    This function reads a file in the binary project format.
+
+    Parameters
+    ----------
+    location : Path
+        path to the file
+    memory_map : bool
+        True if the file should be memory-mapped (copy-on-write) instead of being read into memory
+    lazy : bool
+        True if the results should be LazyPayload handles, which are only decoded when they are loaded
+
+    Returns
+    -------
+    dict
+        project data like the JsonDict of the JSON project files, in which the arrays are NumPy arrays
+
+    Raises
+    ------
+    BinaryFormatError
+        if the file is not a binary project file or it is truncated or corrupt
+    """
+    with open(location, "rb") as file:
+        chunks = read_chunks(file)
+        missing = [tag for tag in (b"TREE", b"ARRS", b"DATA") if tag not in chunks]
+        if missing:
+            raise BinaryFormatError(f"{file.name} misses the chunks {missing}")
+        # the mapping stays valid if the file is replaced (e.g. by saving the project again)
+        if memory_map:
+            buffer: np.ndarray = np.memmap(file, np.uint8, "c")
+        else:
+            file.seek(0)
+            buffer = np.frombuffer(bytearray(file.read()), np.uint8)
+
+    def payload(tag: bytes, offset: int = 0, length: int | None = None) -> np.ndarray:
+        if tag not in chunks:
+            raise BinaryFormatError(f"{location} misses the chunk {tag!r}")
+        start, length_chunk = chunks[tag]
+        if offset < 0 or offset + (0 if length is None else length) > length_chunk:
+            raise BinaryFormatError(f"Payload exceeds the {tag!r} chunk of {location}")
+        return buffer[start + offset : start + offset + (length_chunk if length is None else length)]
+
+    arrays = _Arrays(buffer, *chunks[b"DATA"], decode(payload(b"ARRS")))  # type: ignore
+    # files without an offset index contain the results in the project data
+    index = decode(payload(b"RIDX")) if b"RIDX" in chunks else []
+    payloads: list[object] = [LazyPayload(payload(b"RSLT", offset, length), arrays) for offset, length in index]  # type: ignore
+    payloads = payloads if lazy else [lazy_payload.load() for lazy_payload in payloads]  # type: ignore
+    return decode(payload(b"TREE"), arrays, payloads)  # type: ignore
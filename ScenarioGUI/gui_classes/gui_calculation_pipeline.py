@@ -0,0 +1,308 @@
+"""
+This document contains the staged calculation pipeline, which can be used as data_2_results_function.
+The outputs of the stages (e.g. a preprocessed load profile) are cached by the values of the options they depend on,
+so a changed option only reruns the stages which depend on it and the stages after them.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import ScenarioGUI.global_settings as globs
+
+from .gui_project_snapshot import write_atomic
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from .gui_data_storage import DataStorage
+
+
+class Stage(NamedTuple):
+    """
+    stage of the calculation pipeline
+    """
+
+    name: str
+    function: Callable[[DataStorage, dict[str, object]], object]
+    options: list[str]
+    version: str = ""
+
+    @property
+    def identifier(self) -> str:
+        """name and version of the stage together with the name of its function, which are part of the cache keys"""
+        function = f"{getattr(self.function, '__module__', '')}.{getattr(self.function, '__qualname__', type(self.function).__qualname__)}"
+        return f"{self.name}:{function}:{self.version}"
+
+
+class ArtifactCache:
+    """
+    class of the cache of the stage outputs (artifacts) with a limited size in memory and optionally on disk.
+    In both, the least recently used artifacts are removed first.
+    """
+
+    def __init__(self, memory_size: int = 100_000_000, folder: Path | None = None, disk_size: int = 1_000_000_000):
+        """
+        This function initialises the artifact cache.
+
+        Parameters
+        ----------
+        memory_size : int
+            maximal size of the artifacts in memory in bytes (size of the pickled artifacts)
+        folder : Path | None
+            folder of the artifacts on disk (None to only cache in memory)
+        disk_size : int
+            maximal size of the folder in bytes
+        """
+        self.memory_size = memory_size
+        self.folder = folder
+        self.disk_size = disk_size
+        self._memory: OrderedDict[str, tuple[object, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True) if self.folder is not None else None
+
+    def __getstate__(self) -> dict:
+        # the artifacts in memory and the lock are not passed to other processes
+        return {**self.__dict__, "_memory": OrderedDict(), "_lock": None}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """
+        This function returns the artifact of the key.
+
+        Parameters
+        ----------
+        key : str
+            key of the artifact
+
+        Returns
+        -------
+        tuple[bool, object]
+            True if the artifact has been found and the artifact
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return True, self._memory[key][0]
+        if self.folder is None:
+            return False, None
+        file = self.folder.joinpath(f"{key}.pkl")
+        try:
+            with open(file, "rb") as f:
+                data = f.read()
+            artifact = pickle.loads(data)
+            # mark the entry as recently used
+            os.utime(file)
+        except OSError:
+            return False, None
+        except Exception as err:
+            # a truncated or foreign file can raise nearly any error while it is unpickled, so it is calculated again
+            globs.LOGGER.warning(f"artifact {key} could not be loaded: {err}")
+            return False, None
+        self._add_2_memory(key, artifact, len(data))
+        return True, artifact
+
+    def put(self, key: str, artifact: object) -> None:
+        """
+        This function stores the artifact in memory and on disk and removes the least recently used artifacts if the
+        cache is too big. Artifacts which can not be pickled are not cached.
+
+        Parameters
+        ----------
+        key : str
+            key of the artifact
+        artifact : object
+            output of a stage
+
+        Returns
+        -------
+        None
+        """
+        try:
+            data = pickle.dumps(artifact, pickle.HIGHEST_PROTOCOL)
+        except Exception as err:
+            globs.LOGGER.warning(f"artifact could not be cached: {err}")
+            return
+        self._add_2_memory(key, artifact, len(data))
+        if self.folder is None or len(data) > self.disk_size:
+            return
+        try:
+            # every writer uses its own temporary file, since the worker processes can store the same artifact at once
+            write_atomic(self.folder.joinpath(f"{key}.pkl"), lambda location: location.write_bytes(data))
+        except OSError as err:
+            globs.LOGGER.warning(f"artifact could not be cached: {err}")
+            return
+        self.evict()
+
+    def _add_2_memory(self, key: str, artifact: object, size: int) -> None:
+        if size > self.memory_size:
+            return
+        with self._lock:
+            self._memory[key] = (artifact, size)
+            self._memory.move_to_end(key)
+            total = sum(entry[1] for entry in self._memory.values())
+            while total > self.memory_size:
+                _, (_, entry_size) = self._memory.popitem(last=False)
+                total -= entry_size
+
+    def evict(self) -> None:
+        """
+        This function removes the least recently used artifacts on disk until the folder is smaller than its maximal size.
+
+        Returns
+        -------
+        None
+        """
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in os.scandir(self.folder) if entry.name.endswith(".pkl")]
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, entry in sorted(entries, key=lambda entry: entry[0]):
+            if size <= self.disk_size:
+                return
+            try:
+                os.remove(entry.path)
+            except OSError:  # pragma: no cover
+                continue
+            size -= entry_size
+
+    def clear(self) -> None:
+        """
+        This function removes all artifacts of the cache.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.folder is not None:
+            _ = [os.remove(entry.path) for entry in os.scandir(self.folder) if entry.name.endswith(".pkl")]  # type: ignore
+
+
+class CalculationPipeline:
+    """
+    class of a calculation in stages, which can be used as data_2_results_function of the MainWindow.
+    Every stage gets the DataStorage and the outputs of the previous stages and declares the names of the options it
+    depends on. The output of a stage is cached by the values of these options and the outputs of the previous stages,
+    so only the stages from the first one with a changed option onwards are calculated again.
+    Finally, the data_2_results_function gets the DataStorage and the outputs of all stages.
+
+    Examples
+    --------
+    >>> pipeline = CalculationPipeline(data_2_results)
+    >>> pipeline.add_stage("load", preprocess_load, ["option_load", "option_peak"])
+    >>> pipeline.add_stage("response", calculate_response_factors, ["option_borefield"])
+    >>> main_window = MainWindow(..., data_2_results_function=pipeline)
+    """
+
+    def __init__(
+        self,
+        data_2_results_function: Callable[[DataStorage, dict[str, object]], tuple[object, Callable[[], None]]],
+        cache: ArtifactCache | None = None,
+    ):
+        """
+        This function initialises the pipeline.
+
+        Parameters
+        ----------
+        data_2_results_function : Callable
+            function which gets the DataStorage and the outputs of all stages (by their name) and returns the results
+            class and the function to be called, like the data_2_results_function of the MainWindow
+        cache : ArtifactCache | None
+            cache of the stage outputs (default: 100 MB in memory)
+        """
+        self.data_2_results_function = data_2_results_function
+        self.cache: ArtifactCache = ArtifactCache() if cache is None else cache
+        self.stages: list[Stage] = []
+        self.n_calculations: Counter[str] = Counter()  # number of calculations per stage (in this process)
+
+    def add_stage(self, name: str, function: Callable[[DataStorage, dict[str, object]], object], options: list[str], version: str = "") -> None:
+        """
+        This function adds a stage after the already added ones.
+
+        Parameters
+        ----------
+        name : str
+            name of the stage, which is the key of its output for the next stages
+        function : Callable[[DataStorage, dict[str, object]], object]
+            function which gets the DataStorage and the outputs of the previous stages and returns the output
+            of the stage. It should only use the declared options of the DataStorage.
+        options : list[str]
+            names of the options the stage depends on
+        version : str
+            version of the stage, which should be changed together with the function, since the cached outputs
+            of another version (e.g. on disk) are not used
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            if a stage with the same name already exists
+        """
+        if any(stage.name == name for stage in self.stages):
+            raise ValueError(f"the pipeline has already a stage {name}")
+        self.stages.append(Stage(name, function, list(options), f"{version}"))
+
+    def calculate_stages(self, d_s: DataStorage) -> dict[str, object]:
+        """
+        This function calculates the outputs of all stages or takes them from the cache.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage to be calculated
+
+        Returns
+        -------
+        dict[str, object]
+            outputs of the stages by their name
+
+        Raises
+        ------
+        ValueError
+            if a stage depends on an option which is not in the DataStorage (e.g. a misspelled name), since its output
+            would never be calculated again
+        """
+        known = set(d_s.list_options_aims)
+        for stage in self.stages:
+            unknown = [name for name in stage.options if name not in known]
+            if unknown:
+                raise ValueError(f"the stage {stage.name} depends on the unknown options {unknown}")
+        artifacts: dict[str, object] = {}
+        key = ""
+        for stage in self.stages:
+            # the key depends on the keys of the previous stages, so a changed option also changes all following keys
+            key = hashlib.sha256(f"{key}{stage.identifier}{d_s.fingerprint(stage.options)}".encode()).hexdigest()
+            found, artifact = self.cache.get(key)
+            if not found:
+                artifact = stage.function(d_s, artifacts)
+                self.n_calculations[stage.name] += 1
+                self.cache.put(key, artifact)
+            artifacts[stage.name] = artifact
+        return artifacts
+
+    def __call__(self, d_s: DataStorage) -> tuple[object, Callable[[], None]]:
+        """
+        This function calculates the stages and creates the results class and the function to be called.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage to be calculated
+
+        Returns
+        -------
+        tuple[object, Callable[[], None]]
+            results class and function to be called
+        """
+        return self.data_2_results_function(d_s, self.calculate_stages(d_s))
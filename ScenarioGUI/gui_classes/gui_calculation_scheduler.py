@@ -0,0 +1,231 @@
+"""
+This document contains the scheduler of the calculation threads, which decides which calculation is started next
+and how many calculations run at the same time.
+"""
+from __future__ import annotations
+
+import heapq
+import time
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import PySide6.QtWidgets as QtW
+
+    from .gui_calculation_thread import CalcProblem
+
+
+class CalculationScheduler:
+    """
+    class with a priority queue of the calculations which are waiting to be started.
+    The calculation of the selected scenario is started first, the others in the order they have been added.
+    Outdated queue entries (after a re-prioritization) are skipped when they are popped.
+    """
+
+    HIGH: int = 0
+    NORMAL: int = 1
+
+    def __init__(self, max_running: int = 1) -> None:
+        """
+        This function initialises the scheduler.
+
+        Parameters
+        ----------
+        max_running : int
+            maximal number of calculations running at the same time
+        """
+        self.max_running: int = max(max_running, 1)
+        self.threads: list[CalcProblem] = []  # all calculations of the current batch in the order they are added
+        self.running: list[CalcProblem] = []
+        self.n_finished: int = 0
+        self.start_time: float = time.monotonic()  # start of the current batch
+        self._queue: list[list] = []  # heap of [priority, counter, thread or None]
+        self._entries: dict[int, list] = {}  # queue entry of every waiting thread by id of its item
+        self._items: dict[int, QtW.QListWidgetItem] = {}  # items of the current batch by their id
+        self._counter = count()
+
+    def _push(self, thread: CalcProblem, priority: int) -> None:
+        entry = [priority, next(self._counter), thread]
+        self._entries[id(thread.item)] = entry
+        heapq.heappush(self._queue, entry)
+
+    def add(self, thread: CalcProblem, priority: bool = False) -> None:
+        """
+        This function adds a calculation to the queue.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread
+        priority : bool
+            True if the calculation should be started before all the other waiting ones
+
+        Returns
+        -------
+        None
+        """
+        self.start_time = time.monotonic() if not self.threads else self.start_time
+        self.threads.append(thread)
+        self._items[id(thread.item)] = thread.item
+        self._push(thread, self.HIGH if priority else self.NORMAL)
+
+    def prioritize(self, item: QtW.QListWidgetItem) -> None:
+        """
+        This function moves the waiting calculation of the item to the front of the queue.
+
+        Parameters
+        ----------
+        item : QtW.QListWidgetItem
+            list widget item of the selected scenario
+
+        Returns
+        -------
+        None
+        """
+        entry = self._entries.get(id(item))
+        if entry is None or entry[0] == self.HIGH:
+            return
+        thread = entry[2]
+        # the old entry is skipped as soon as it is popped
+        entry[2] = None
+        self._push(thread, self.HIGH)
+
+    def next_threads(self, chunk_size: int = 1) -> list[CalcProblem]:
+        """
+        This function returns the calculations which can be started now and marks them as running.
+
+        Parameters
+        ----------
+        chunk_size : int
+            number of calculations which are started together. No calculation is started until a whole chunk
+            (or all the waiting calculations if there are fewer) can be started.
+
+        Returns
+        -------
+        list[CalcProblem]
+            calculation threads to be started
+        """
+        if self.max_running - len(self.running) < min(chunk_size, len(self._entries)):
+            return []
+        threads = []
+        while self._queue and len(self.running) < self.max_running:
+            _, _, thread = heapq.heappop(self._queue)
+            if thread is None:
+                continue
+            del self._entries[id(thread.item)]
+            self.running.append(thread)
+            threads.append(thread)
+        return threads
+
+    def finish(self, thread: CalcProblem) -> bool:
+        """
+        This function marks the calculation as finished.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            finished calculation thread
+
+        Returns
+        -------
+        bool
+            False if the calculation was already finished or is not part of the current batch
+        """
+        if thread in self.running:
+            self.running.remove(thread)
+        else:
+            entry = self._entries.get(id(thread.item))
+            if entry is None or entry[2] is not thread:
+                return False
+            # a waiting calculation was finished (e.g. stopped) before it has been started
+            entry[2] = None
+            del self._entries[id(thread.item)]
+        self.n_finished += 1
+        return True
+
+    def resize(self, max_running: int) -> None:
+        """
+        This function sets the maximal number of calculations running at the same time.
+        Running calculations above the new number are finished, but no new ones are started until
+        the number of running calculations is below the new maximum.
+
+        Parameters
+        ----------
+        max_running : int
+            maximal number of calculations running at the same time
+
+        Returns
+        -------
+        None
+        """
+        self.max_running = max(max_running, 1)
+
+    def is_calculating(self, item: QtW.QListWidgetItem) -> bool:
+        """
+        This function checks if the scenario of the item is part of the current batch.
+
+        Parameters
+        ----------
+        item : QtW.QListWidgetItem
+            list widget item of the scenario
+
+        Returns
+        -------
+        bool
+        """
+        return id(item) in self._items
+
+    def running_thread(self, item: QtW.QListWidgetItem) -> CalcProblem | None:
+        """
+        This function returns the running calculation of the item.
+
+        Parameters
+        ----------
+        item : QtW.QListWidgetItem
+            list widget item of the scenario
+
+        Returns
+        -------
+        CalcProblem | None
+            running calculation thread or None if the scenario is not calculated at the moment
+        """
+        return next((thread for thread in self.running if thread.item is item), None)
+
+    @property
+    def progress(self) -> float:
+        """number of finished calculations including the progress of the running ones"""
+        return self.n_finished + sum(thread.progress for thread in self.running)
+
+    def remaining_time(self) -> float | None:
+        """
+        This function estimates the remaining time of the current batch from the throughput of the calculations so far.
+
+        Returns
+        -------
+        float | None
+            remaining time in seconds or None if there is no progress yet
+        """
+        progress = self.progress
+        if progress <= 0:
+            return None
+        return (time.monotonic() - self.start_time) * (len(self.threads) - progress) / progress
+
+    @property
+    def done(self) -> bool:
+        """True if all the calculations of the current batch are finished"""
+        return self.n_finished >= len(self.threads)
+
+    def clear(self) -> None:
+        """
+        This function removes the calculations of the finished batch.
+
+        Returns
+        -------
+        None
+        """
+        self.threads = []
+        self.running = []
+        self.n_finished = 0
+        self._queue = []
+        self._entries = {}
+        self._items = {}
@@ -0,0 +1,132 @@
+"""
+This document contains the supervisor of the calculation threads, which enforces the time out of
+every calculation without blocking the GUI thread.
+"""
+from __future__ import annotations
+
+import math
+import time
+
+import PySide6.QtCore as QtC
+
+from .gui_calculation_thread import CalcProblem
+
+
+class CalculationSupervisor(QtC.QObject):
+    """
+    class with a timer-driven deadline table of the running calculations.
+    Every time the timer fires, the calculations which exceeded their time out are stopped.
+    """
+
+    statusChanged = QtC.Signal(list)
+    interval: int = 250  # ms
+
+    def __init__(self, parent=None) -> None:
+        """
+        This function initialises the supervisor.
+
+        Parameters
+        ----------
+        parent :
+            Parent class of the supervisor
+        """
+        super().__init__(parent)
+        self.start_times: dict[CalcProblem, float] = {}
+        self.timer = QtC.QTimer(self)
+        self.timer.setInterval(self.interval)
+        self.timer.timeout.connect(self.check)
+
+    def add(self, thread: CalcProblem) -> None:
+        """
+        This function adds a started calculation to the deadline table.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            started calculation thread
+
+        Returns
+        -------
+        None
+        """
+        self.start_times[thread] = time.monotonic()
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def remove(self, thread: CalcProblem) -> None:
+        """
+        This function removes a calculation from the deadline table.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread
+
+        Returns
+        -------
+        None
+        """
+        self.start_times.pop(thread, None)
+        if not self.start_times:
+            self.timer.stop()
+
+    def status(self) -> list[tuple[CalcProblem, float, float]]:
+        """
+        This function returns the elapsed and remaining time of every running calculation.
+        The remaining time of a calculation without a time out is infinite.
+
+        Returns
+        -------
+        list[tuple[CalcProblem, float, float]]
+            list of the calculation thread with its elapsed and remaining time in seconds
+        """
+        now = time.monotonic()
+        status = []
+        for thread, start in self.start_times.items():
+            time_out = thread.d_s.time_out  # type: ignore
+            status.append((thread, now - start, math.inf if time_out is None else max(time_out - (now - start), 0.0)))
+        return status
+
+    def check(self) -> None:
+        """
+        This function stops all calculations which exceeded their time out and removes the finished ones.
+
+        Returns
+        -------
+        None
+        """
+        for thread, _, remaining in self.status():
+            if thread.calculated:
+                self.remove(thread)
+                continue
+            # the worker pool and the other backends enforce the time out of their calculations themselves
+            if remaining > 0 or not thread.USE_MULTITHREADING or thread.backend is not None:
+                continue
+            self.remove(thread)
+            self.time_out(thread)
+        self.statusChanged.emit(self.status())
+
+    @staticmethod
+    def time_out(thread: CalcProblem) -> None:
+        """
+        This function stops the calculation thread and sets the run time error as debug message.
+        If all the scenarios of a batch calculation are stopped, the batch thread is stopped as well.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread which exceeded its time out
+
+        Returns
+        -------
+        None
+        """
+        thread.d_s.debug_message = f"{RuntimeError(f'RuntimeError: run time > {thread.d_s.time_out}s')}"  # type: ignore
+        thread.d_s.results = None
+        thread.calculated = True
+        thread.item.setData(CalcProblem.role, thread.d_s)
+        thread.any_signal.emit(thread)
+        thread.terminate()
+        # the batch thread would otherwise keep calculating results which are not used anymore
+        if thread.batch is not None and all(member.calculated for member in thread.batch.members):
+            thread.batch.terminate()
@@ -5,10 +5,14 @@ aims in the GUI.
 from __future__ import annotations
 
 import multiprocessing as mp
+import time
 from typing import TYPE_CHECKING
 
 import PySide6.QtCore as QtC
 
+from .gui_run_statistics import RunProfiler, RunStatistics
+from .gui_worker_pool import calculation_kwargs
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
     from functools import partial
@@ -16,6 +20,8 @@ if TYPE_CHECKING:  # pragma: no cover
     import PySide6.QtWidgets as QtW
 
     from .gui_data_storage import DataStorage
+    from .gui_execution_backend import ExecutionBackend
+    from .gui_worker_pool import WorkerPool
 
 
 class CalcProblem(QtC.QThread):
@@ -24,6 +30,8 @@ class CalcProblem(QtC.QThread):
     """
 
     any_signal = QtC.Signal(tuple)
+    progress_signal = QtC.Signal(float)
+    partial_results_signal = QtC.Signal(object)
     role: int = 1
     USE_MULTITHREADING: bool = True
 
@@ -37,6 +45,8 @@ class CalcProblem(QtC.QThread):
             [DataStorage],
             tuple[object, partial[[], None]] | tuple[object, Callable[[], None]],
         ],
+        worker_pool: WorkerPool | None = None,
+        backend: ExecutionBackend | None = None,
     ) -> None:
         """
         This function initialises the calculation class.
@@ -51,13 +61,72 @@ class CalcProblem(QtC.QThread):
             Parent class of the calculation problem
         data_2_results_function : Callable
             function to create the results class and a function to be called in the thread
+        worker_pool : WorkerPool | None
+            pool of worker processes which is used if multithreading is not used.
+            If None, a new process is started for this calculation.
+        backend : ExecutionBackend | None
+            backend which calculates the scenario instead of this thread or the worker pool (e.g. remote workers).
+            The backend enforces the time out of the calculation itself.
         """
         super().__init__(parent)  # init parent class
         # set datastorage and index
         self.d_s = d_s
         self.item = item
         self.data_2_results_function = data_2_results_function
+        self.worker_pool = worker_pool
+        self.backend = backend
         self.calculated = False
+        self.progress: float = 0.0  # fraction of the calculation which is finished
+        self.partial_results: object | None = None  # latest snapshot of the results of the running calculation
+        self.batch: CalcBatchProblem | None = None  # batch calculation which calculates this scenario together with others
+        self.statistics: RunStatistics | None = None  # run statistics measured by the worker or the backend
+
+    def report_statistics(self, statistics: RunStatistics) -> None:
+        """
+        This function stores the run statistics measured by the worker process or the backend.
+
+        Parameters
+        ----------
+        statistics : RunStatistics
+            run statistics of the calculation
+
+        Returns
+        -------
+        None
+        """
+        self.statistics = statistics
+
+    def report_progress(self, progress: float) -> None:
+        """
+        This function stores the progress of the calculation and emits it as signal.
+
+        Parameters
+        ----------
+        progress : float
+            fraction of the calculation which is finished
+
+        Returns
+        -------
+        None
+        """
+        self.progress = progress
+        self.progress_signal.emit(progress)
+
+    def report_partial_results(self, results: object) -> None:
+        """
+        This function stores a snapshot of the results of the running calculation and emits the thread as signal.
+
+        Parameters
+        ----------
+        results : object
+            partial results of the calculation
+
+        Returns
+        -------
+        None
+        """
+        self.partial_results = results
+        self.partial_results_signal.emit(self)
 
     def run(self) -> None:
         """
@@ -65,18 +134,36 @@ class CalcProblem(QtC.QThread):
         For each aim in the GUI, a new if statement is used. Here, one can put all the code
         needed to run the simulation/calculation with the all the functionalities of GHEtool.
         This function should return the DataStorage as a signal.
+        If the function returned by the data_2_results_function has a progress argument, a function is passed to it
+        which can be called with the fraction of the calculation which is finished. If it has a partial_results argument,
+        a function is passed to it which can be called with a snapshot (e.g. a copy) of the results calculated so far.
+        The run statistics of the calculation are stored in the DataStorage. If the calculation is not finished
+        (e.g. because of the time out), only its wall time is known.
 
         Returns
         -------
         None
         """
-        if self.USE_MULTITHREADING:
+        self.statistics = None
+        start = time.perf_counter()
+        if self.backend is not None:
+            debug_message, results = self.backend.run(
+                self.d_s, self.d_s.time_out, self.report_progress, self.report_partial_results, self.report_statistics  # type: ignore
+            )
+        elif self.USE_MULTITHREADING:
+            profiler = RunProfiler(thread=True)
             try:
-                results, func = self.data_2_results_function(self.d_s)
-                func()
+                with profiler:
+                    results, func = self.data_2_results_function(self.d_s)
+                    func(**calculation_kwargs(func, self.report_progress, self.report_partial_results))
                 debug_message: Exception | str | None = None
             except Exception as err:
                 debug_message, results = err, None
+            self.statistics = profiler.statistics
+        elif self.worker_pool is not None:
+            debug_message, results = self.worker_pool.run(
+                self.d_s, self.d_s.time_out, self.report_progress, self.report_partial_results, self.report_statistics  # type: ignore
+            )
         else:
             queue: mp.Queue = mp.Queue()
             stop_event: mp.Event = mp.Event()  # type: ignore
@@ -86,8 +173,9 @@ class CalcProblem(QtC.QThread):
             if not stop_event.wait(self.d_s.time_out):  # type: ignore
                 debug_message, results = f"{RuntimeError(f'RuntimeError: run time > {self.d_s.time_out}s')}", None
             else:
-                debug_message, results = queue.get()
+                debug_message, results, self.statistics = queue.get()
             process.terminate()
+        self.d_s.run_statistics = self.statistics if self.statistics is not None else RunStatistics(time.perf_counter() - start)
         self.d_s.debug_message = debug_message
         # save bore field in Datastorage
         self.d_s.results = results
@@ -97,26 +185,203 @@ class CalcProblem(QtC.QThread):
         self.any_signal.emit(self)
 
 
+class CalcBatchProblem(QtC.QThread):
+    """
+    class to calculate the scenarios of many calculation threads at once with a vectorized batch function.
+    The calculation threads are not started themselves, but their results are set and emitted as if they were.
+    """
+
+    def __init__(
+        self,
+        members: list[CalcProblem],
+        parent=None,
+        *,
+        batch_data_2_results_function: Callable[[list[DataStorage]], list[object]],
+        worker_pool: WorkerPool | None = None,
+    ) -> None:
+        """
+        This function initialises the batch calculation.
+
+        Parameters
+        ----------
+        members : list[CalcProblem]
+            calculation threads of the scenarios to be calculated
+        parent :
+            Parent class of the calculation problem
+        batch_data_2_results_function : Callable
+            function which calculates the results of all DataStorages at once
+        worker_pool : WorkerPool | None
+            pool of worker processes (with the batch_data_2_results function) which is used if multithreading is not used
+        """
+        super().__init__(parent)
+        self.members = members
+        self.batch_data_2_results_function = batch_data_2_results_function
+        self.worker_pool = worker_pool
+        for member in members:
+            member.batch = self
+
+    @property
+    def time_out(self) -> float | None:
+        """time out of the batch, which is the sum of the time outs of its scenarios"""
+        time_outs = [member.d_s.time_out for member in self.members]  # type: ignore
+        return None if any(time_out is None for time_out in time_outs) else sum(time_outs)
+
+    def report_progress(self, progress: float) -> None:
+        """
+        This function reports the progress of the batch to all its calculation threads.
+
+        Parameters
+        ----------
+        progress : float
+            fraction of the batch calculation which is finished
+
+        Returns
+        -------
+        None
+        """
+        _ = [member.report_progress(progress) for member in self.members]  # type: ignore
+
+    def report_partial_results(self, results: list[object]) -> None:
+        """
+        This function reports the partial results of the batch to its calculation threads.
+
+        Parameters
+        ----------
+        results : list[object]
+            partial results of every scenario
+
+        Returns
+        -------
+        None
+        """
+        _ = [member.report_partial_results(result) for member, result in zip(self.members, results)]  # type: ignore
+
+    def run(self) -> None:
+        """
+        This function calculates all scenarios with the batch function and emits every calculation thread with its
+        results. If an element of the returned list is an exception, it is set as debug message of its scenario.
+        Scenarios which have already been stopped (e.g. because of their time out) are skipped.
+
+        Returns
+        -------
+        None
+        """
+        data_storages = [member.d_s for member in self.members]
+        statistics: list[RunStatistics] = []
+        start = time.perf_counter()
+        if CalcProblem.USE_MULTITHREADING or self.worker_pool is None:
+            profiler = RunProfiler(thread=True, scenarios=len(data_storages))
+            try:
+                debug_message: Exception | str = ""
+                with profiler:
+                    results: list | None = calculate_batch(
+                        self.batch_data_2_results_function, data_storages, self.report_progress, self.report_partial_results
+                    )
+            except Exception as err:
+                debug_message, results = err, None
+            statistics.append(profiler.statistics)  # type: ignore
+        else:
+            debug_message, results = self.worker_pool.run(
+                data_storages, self.time_out, self.report_progress, self.report_partial_results, statistics.append  # type: ignore
+            )
+        run_statistics = statistics[0] if statistics else RunStatistics(time.perf_counter() - start, scenarios=len(data_storages))
+        for idx, member in enumerate(self.members):
+            if member.calculated:
+                continue
+            member.d_s.run_statistics = run_statistics
+            result = None if results is None else results[idx]
+            member.d_s.debug_message = result if isinstance(result, Exception) else debug_message
+            member.d_s.results = None if isinstance(result, Exception) else result
+            member.calculated = True
+            member.item.setData(CalcProblem.role, member.d_s)
+            member.any_signal.emit(member)
+
+
+def calculate_batch(
+    batch_data_2_results_function: Callable[[list[DataStorage]], list[object]],
+    data_storages: list[DataStorage],
+    progress: Callable[[float], None],
+    partial_results: Callable[[list[object]], None],
+) -> list[object]:
+    """
+    This function calculates the results of all DataStorages with the batch function.
+    Like the calculation functions, the batch function can have a progress and a partial_results argument.
+
+    Parameters
+    ----------
+    batch_data_2_results_function : Callable
+        function which returns the results (or an exception) of every DataStorage
+    data_storages : list[DataStorage]
+        DataStorages to be calculated
+    progress : Callable[[float], None]
+        function which reports the progress
+    partial_results : Callable[[list[object]], None]
+        function which reports the partial results of every DataStorage
+
+    Returns
+    -------
+    list[object]
+        results or exception of every DataStorage
+
+    Raises
+    ------
+    ValueError
+        if the batch function does not return one result per DataStorage
+    """
+    results = list(batch_data_2_results_function(data_storages, **calculation_kwargs(batch_data_2_results_function, progress, partial_results)))
+    if len(results) != len(data_storages):
+        raise ValueError(f"the batch calculation returned {len(results)} results for {len(data_storages)} scenarios")
+    return results
+
+
+def batch_data_2_results(
+    batch_data_2_results_function: Callable[[list[DataStorage]], list[object]], data_storages: list[DataStorage]
+) -> tuple[list[object], Callable[[Callable[[float], None], Callable[[list[object]], None]], None]]:
+    """
+    This function wraps the batch function as data_2_results_function, so the batches can be calculated by a worker pool.
+
+    Parameters
+    ----------
+    batch_data_2_results_function : Callable
+        function which returns the results (or an exception) of every DataStorage
+    data_storages : list[DataStorage]
+        DataStorages to be calculated
+
+    Returns
+    -------
+    tuple[list[object], Callable]
+        list which is filled with the results and the function to calculate them
+    """
+    results: list[object] = []
+
+    def func(progress: Callable[[float], None], partial_results: Callable[[list[object]], None]) -> None:
+        results.extend(calculate_batch(batch_data_2_results_function, data_storages, progress, partial_results))
+
+    return results, func
+
+
 def calculate(data_2_results_function: Callable[[DataStorage], tuple[object, Callable]], d_s: DataStorage, queue: mp.Queue, stop_event: mp.Event) -> None:
     """
     This function contains the actual code to run the different calculations.
     For each aim in the GUI, a new if statement is used. Here, one can put all the code
     needed to run the simulation/calculation with the all the functionalities.
     This function should return the DataStorage as a signal.
+    The debug message, the results and the run statistics are put in the queue.
 
     Returns
     -------
     None
     """
-
+    profiler = RunProfiler()
     try:
-        results, func = data_2_results_function(d_s)
-        func()
+        with profiler:
+            results, func = data_2_results_function(d_s)
+            func()
     except Exception as err:
-        queue.put((err, None))
+        queue.put((err, None, profiler.statistics))
         return
 
     # set debug message to "" and save borefield in Datastorage
-    queue.put(("", results))
+    queue.put(("", results, profiler.statistics))
     stop_event.set()
     return
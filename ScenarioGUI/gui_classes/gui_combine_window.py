@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import logging
+import math
 from functools import partial as ft_partial
 from json import dump, load
 from os import makedirs, remove
@@ -16,17 +17,30 @@ import pandas as pd
 import PySide6.QtCore as QtC
 import PySide6.QtGui as QtG
 import PySide6.QtWidgets as QtW
+from matplotlib import pyplot as plt
 from matplotlib import rcParams  # type: ignore
 
 import ScenarioGUI.global_settings as globs
 from ScenarioGUI.gui_classes.gui_structure_classes.functions import check_aim_options
 
 from ..utils import change_font_size, set_default_font
+from .gui_background_saver import BackgroundSaver
+from .gui_backup_journal import BackupJournal, read_journal
 from .gui_base_class import BaseUI
-from .gui_calculation_thread import CalcProblem
-from .gui_data_storage import DataStorage
-from .gui_saving_thread import SavingThread
+from .gui_binary_format import BinaryFormatError, LazyPayload, read_binary, write_binary
+from .gui_calculation_scheduler import CalculationScheduler
+from .gui_calculation_supervisor import CalculationSupervisor
+from .gui_calculation_thread import CalcBatchProblem, CalcProblem, batch_data_2_results
+from .gui_data_storage import DataStorage, LazyResults
+from .gui_execution_backend import ExecutionBackend, RemoteBackend
+from .gui_figure_cache import FigureCache
+from .gui_parameter_sweep import ParameterSweep, ParameterSweepDialog
+from .gui_project_snapshot import ProjectSnapshot, SnapshotCreator, json_default, write_atomic
+from .gui_result_cache import ResultCache
+from .gui_result_memo import ResultMemo
+from .gui_run_statistics import RunStatistics, RunStatisticsDialog
 from .gui_structure_classes import FigureOption, Option, ResultExport
+from .gui_worker_pool import WorkerPool
 
 
 if TYPE_CHECKING:
@@ -63,6 +77,7 @@ class JsonDict(TypedDict, total=True):
     version: str
     values: list[dict]
     results: list[dict]
+    statistics: list[dict | None]
     default_path: str
 
 
@@ -83,7 +98,7 @@ def normal_export(file_path: Path, data: JsonDict):
     """
     # write data to back up file
     with open(file_path, "w") as file:
-        dump(data, file, indent=1)
+        dump(data, file, indent=1, default=json_default)
 
 
 def normal_import(location: Path) -> JsonDict:
@@ -173,11 +188,13 @@ class MainWindow(QtW.QMainWindow, BaseUI):
 
         self.import_functions: dict[str, Callable[[Path], JsonDict]] = {
             globs.FILE_EXTENSION: normal_import,
-            f"{globs.FILE_EXTENSION}BackUp": normal_import,
+            f"{globs.FILE_EXTENSION}BackUp": read_journal,
+            f"{globs.FILE_EXTENSION}Bin": ft_partial(read_binary, lazy=True),
         }
         self.export_functions: dict[str, Callable[[Path, JsonDict], None]] = {
             globs.FILE_EXTENSION: normal_export,
             f"{globs.FILE_EXTENSION}BackUp": normal_export,
+            f"{globs.FILE_EXTENSION}Bin": write_binary,
         }
         self.version_import_functions: dict[str, Callable[[JsonDict], JsonDict]] = {}
 
@@ -194,17 +211,44 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # check if backup folder exits and otherwise create it
         makedirs(dirname(self.backup_file), exist_ok=True)
         makedirs(dirname(self.default_path), exist_ok=True)
+        # the automatic saves only append the changes of the scenarios to the backup file
+        self.backup_journal: BackupJournal = BackupJournal(self.backup_file)
         for idx, (name, icon, short_cut) in enumerate(zip(self.translations.languages, self.translations.icon, self.translations.short_cut)):
             self._create_action_language(idx, name, icon, short_cut)
         # add languages to combo box
-        self.gui_structure.option_language.widget.addItems(self.translations.languages)
+        self.gui_structure.option_language.set_entries(self.translations.languages)
         self.fileImport = None  # init import file
         self.filename: tuple[str, str] = MainWindow.filename_default  # filename of stored inputs
         self.list_widget_scenario.clear()  # reset list widget with stored scenarios
         self.changedFile: bool = False  # set change file variable to false
         self.ax: list = []  # axes of figure
-        self.threads: list[CalcProblem] = []  # list of calculation threads
-        self.saving_threads: list[SavingThread] = []
+        # queue of the calculation threads
+        self.scheduler: CalculationScheduler = CalculationScheduler(self.gui_structure.option_n_threads.get_value())
+        self.partial_figures: list[plt.Figure] = []  # figures of the partial results of a running calculation
+        # budget of the result figures in the DataStorages, the least recently viewed ones are closed if it is exceeded
+        self.figure_cache: FigureCache = FigureCache()
+        # saver which writes the latest pending save per file in a background thread
+        self.saver: BackgroundSaver = BackgroundSaver(start_threads=not MainWindow.TEST_MODE)
+        self.saver.failed.connect(self._saving_failed)
+        # the saves only use snapshots of the scenarios, which are taken on the GUI thread
+        self.snapshot_creator: SnapshotCreator = SnapshotCreator()
+        # pool of worker processes which is used if the calculation is not performed with multithreading
+        self.worker_pool: WorkerPool = WorkerPool(self.data_2_results_function, self.gui_structure.option_n_threads.get_value())
+        # supervisor of the time outs of the running calculations
+        self.supervisor: CalculationSupervisor = CalculationSupervisor()
+        self.supervisor.statusChanged.connect(self.show_calculation_status)
+        # memo of the calculated results, so scenarios with the same inputs are only calculated once
+        self.result_memo: ResultMemo = ResultMemo()
+        # optional on-disk cache of the results (see activate_result_cache)
+        self.result_cache: ResultCache | None = None
+        # optional vectorized calculation of many scenarios at once (see activate_batch_calculation)
+        self.batch_data_2_results_function: Callable[[list[DataStorage]], list[object]] | None = None
+        self.batch_chunk_size: int = 1
+        self.batch_worker_pool: WorkerPool | None = None
+        # optional backend which calculates the scenarios instead of the threads and the worker pool (see activate_remote_workers)
+        self.execution_backend: ExecutionBackend | None = None
+        # dialog with the run statistics of the scenarios (see activate_run_statistics)
+        self.run_statistics_dialog: RunStatisticsDialog | None = None
         CalcProblem.role = MainWindow.role
         self.size_b = QtC.QSize(self.icon_size_large, self.icon_size_large)  # size of big logo on push button
         self.size_s = QtC.QSize(self.icon_size_small, self.icon_size_small)  # size of small logo on push button
@@ -250,6 +294,193 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.menu_file.addAction(self.action_open_add)
         self.tool_bar.addAction(self.action_open_add)
 
+    def activate_result_cache(self, model_version: str = "", max_size: int = 100_000_000) -> None:
+        """
+        activates the on-disk cache of the results in the default path, so scenarios which have been calculated before
+        (also in a previous session) get their results without a new calculation.
+
+        Parameters
+        ----------
+        model_version : str
+            version of the calculation model. Change it if the results of the model change, so the cached results
+            of the previous version are not used anymore.
+        max_size : int
+            maximal size of the cache in bytes. If it is exceeded, the least recently used results are removed.
+
+        Returns
+        -------
+            None
+        """
+        self.result_cache = ResultCache(self.default_path.joinpath("result_cache"), model_version, max_size)
+
+    def activate_shared_memory_results(self, threshold: int = 1_000_000) -> None:
+        """
+        activates the transfer of large NumPy arrays in the results from the calculation processes by memory-mapped files
+        instead of pickling and copying them. This is only used if the calculations are not performed with multithreading.
+
+        Parameters
+        ----------
+        threshold : int
+            minimal size of an array in bytes to be transferred by a memory-mapped file
+
+        Returns
+        -------
+            None
+        """
+        self.worker_pool.share_arrays_above = threshold
+        if self.batch_worker_pool is not None:
+            self.batch_worker_pool.share_arrays_above = threshold
+
+    def activate_batch_calculation(self, batch_data_2_results_function: Callable[[list[DataStorage]], list[object]], chunk_size: int = 10) -> None:
+        """
+        activates the calculation of many scenarios at once with a vectorized function instead of the
+        data_2_results_function. The waiting scenarios are grouped in chunks, which are calculated in parallel
+        (one chunk per thread). The function gets a list of DataStorages and returns a list with the results
+        (or an exception) of every DataStorage. Like the calculation functions, it can have a progress and a
+        partial_results argument.
+        In multithreading, the time out of every scenario is supervised separately,
+        otherwise the time out of a chunk is the sum of the time outs of its scenarios.
+
+        Parameters
+        ----------
+        batch_data_2_results_function : Callable[[list[DataStorage]], list[object]]
+            function which calculates the results of a list of DataStorages
+        chunk_size : int
+            maximal number of scenarios which are calculated at once
+
+        Returns
+        -------
+            None
+        """
+        self.batch_data_2_results_function = batch_data_2_results_function
+        self.batch_chunk_size = max(chunk_size, 1)
+        # the worker processes of a previously activated batch calculation would otherwise be kept until the application is closed
+        self.batch_worker_pool.shutdown() if self.batch_worker_pool is not None else None
+        self.batch_worker_pool = WorkerPool(
+            ft_partial(batch_data_2_results, batch_data_2_results_function),
+            self.gui_structure.option_n_threads.get_value(),
+            self.worker_pool.share_arrays_above,
+            self.worker_pool.trace_memory,
+        )
+        self.scheduler.resize(self.gui_structure.option_n_threads.get_value() * self.batch_chunk_size)
+
+    def activate_remote_workers(self, addresses: list[str]) -> None:
+        """
+        activates the calculation of the scenarios on worker servers (started with python -m ScenarioGUI.worker),
+        which can run on other machines. The calculations are distributed over the workers by their load.
+        The number of parallel threads should be set to the total number of worker processes of the servers.
+
+        Parameters
+        ----------
+        addresses : list[str]
+            addresses of the worker servers as 'host:port'
+
+        Returns
+        -------
+            None
+        """
+        self.execution_backend = RemoteBackend(addresses, self.result_creating_class.from_dict)
+
+    def activate_parameter_sweep(self) -> None:
+        """
+        activates the parameter sweep in the calculation menu, to create (and calculate) many scenarios at once by
+        varying the FloatBox, IntBox, ListBox and ButtonBox options of the current scenario.
+
+        Returns
+        -------
+            None
+        """
+        self.action_parameter_sweep = QtG.QAction(self.dia)
+        self.action_parameter_sweep.setObjectName("action_parameter_sweep")
+        self.action_parameter_sweep.setText(self.translations.action_parameter_sweep[self.gui_structure.option_language.get_value()[0]])
+        self.action_parameter_sweep.triggered.connect(self.fun_parameter_sweep)
+        self.menu_calculation.addAction(self.action_parameter_sweep)
+
+    def fun_parameter_sweep(self) -> None:
+        """
+        This function opens the dialog of the parameter sweep and adds the scenarios of the chosen design.
+
+        Returns
+        -------
+        None
+        """
+        sweep = ParameterSweep(self.gui_structure)
+        dialog = ParameterSweepDialog(sweep, self.translations, self.gui_structure.option_language.get_value()[0], self.dia)
+        set_default_font(dialog)
+        if dialog.exec() != QtW.QDialog.Accepted:  # type: ignore
+            return
+        try:
+            points = sweep.design(ParameterSweep.DESIGNS[dialog.design.currentIndex()], dialog.n_samples.value())
+        except ValueError as err:
+            globs.LOGGER.error(f"{err}")
+            return
+        names, data_storages = zip(*sweep.create_data_storages(points)) if points else ((), ())
+        self.add_scenarios(list(data_storages), list(names), calculate=dialog.calculate.isChecked())
+
+    def activate_run_statistics(self, trace_memory: bool = False) -> None:
+        """
+        activates the run statistics (wall time, CPU time and peak memory of the calculation of every scenario)
+        in the calculation menu. The wall and CPU time are always measured, the peak memory only if it is traced.
+
+        Parameters
+        ----------
+        trace_memory : bool
+            True if the peak memory of the calculations should be traced with tracemalloc. This is only done if
+            the calculations are not performed with multithreading and it slows down the allocations in the calculations.
+
+        Returns
+        -------
+            None
+        """
+        self.worker_pool.trace_memory = trace_memory
+        if self.batch_worker_pool is not None:
+            self.batch_worker_pool.trace_memory = trace_memory
+        self.action_run_statistics = QtG.QAction(self.dia)
+        self.action_run_statistics.setObjectName("action_run_statistics")
+        self.action_run_statistics.setText(self.translations.action_run_statistics[self.gui_structure.option_language.get_value()[0]])
+        self.action_run_statistics.triggered.connect(self.fun_run_statistics)
+        self.menu_calculation.addAction(self.action_run_statistics)
+
+    def fun_run_statistics(self) -> None:
+        """
+        This function opens the dialog with the run statistics of the scenarios.
+
+        Returns
+        -------
+        None
+        """
+        names = [self.list_widget_scenario.item(idx).text() for idx in range(self.list_widget_scenario.count())]
+        if self.run_statistics_dialog is None:
+            self.run_statistics_dialog = RunStatisticsDialog(names, self.list_ds, self.translations, self.gui_structure.option_language.get_value()[0], self.dia)
+            set_default_font(self.run_statistics_dialog)
+        else:
+            self.run_statistics_dialog.update_table(names, self.list_ds)
+        self.run_statistics_dialog.show()
+
+    def _load_cached_results(self, d_s: DataStorage) -> bool:
+        """
+        This function sets the results from the result cache to the DataStorage if it has no results.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage to get the results for
+
+        Returns
+        -------
+        bool
+            True if the results are found in the cache
+        """
+        if self.result_cache is None or d_s.results is not None:
+            return False
+        file = self.result_cache.lookup(d_s)
+        if file is None:
+            return False
+        # the cache file is only read when the results are needed, so large projects load quickly
+        d_s.results = LazyResults(ft_partial(self.result_cache.read, file), self.result_creating_class.from_dict)
+        d_s.debug_message = ""
+        return True
+
     def resizeEvent(self, event: QtG.QResizeEvent) -> None:
         """
         update push buttons sizes
@@ -278,6 +509,11 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.check_page_button_layout(False)
         QtW.QMainWindow.resizeEvent(self.dia, event)
 
+    @property
+    def threads(self) -> list[CalcProblem]:
+        """list of the calculation threads of the current calculations"""
+        return self.scheduler.threads
+
     def add_other_import_function(self, file_extension: str, func: Callable[[str | Path], JsonDict]):
         """
         adds an import behaviour for a different file type.
@@ -357,7 +593,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.menu_language.addAction(action)
         action.setText(name)
         action.setShortcut(short_cut)
-        action.triggered.connect(ft_partial(self.gui_structure.option_language.widget.setCurrentIndex, idx))
+        action.triggered.connect(ft_partial(self.gui_structure.option_language.set_value, idx))
 
     def set_event_filter(self) -> None:
         """
@@ -393,7 +629,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         for option, _ in [
             (opt, name) for opt, name in self.gui_structure.list_of_options if not isinstance(opt, FigureOption) and (opt, name) not in setting_options
         ]:
-            option.change_event(self.change)
+            option.change_event(ft_partial(self.change_option, option))
         for option, _ in [(opt, name) for opt, name in self.gui_structure.list_of_options if isinstance(opt, FigureOption)]:
             option.change_event(self.change_figure_option)
         for option, _ in [(opt, name) for opt, name in self.gui_structure.list_of_result_exports]:  # type: ignore
@@ -419,10 +655,11 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.action_new.triggered.connect(self.fun_new)
         self.action_rename_scenario.triggered.connect(self.fun_rename_scenario)
         self.list_widget_scenario.setDragDropMode(QtW.QAbstractItemView.InternalMove)  # type: ignore
-        self.list_widget_scenario.model().rowsMoved.connect(self.change)
+        self.list_widget_scenario.model().rowsMoved.connect(lambda *_: self.change(remove_results=False))
         self.list_widget_scenario.currentItemChanged.connect(self.scenario_is_changed)
         self.list_widget_scenario.itemSelectionChanged.connect(self._always_scenario_selected)
         self.gui_structure.option_auto_saving.change_event(self.change_auto_saving)
+        self.gui_structure.option_n_threads.change_event(self.change_n_threads)
         self.dia.closeEvent = self.closeEvent  # type: ignore
         self.dia.resizeEvent = self.resizeEvent  # type: ignore
 
@@ -438,6 +675,20 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             return
         self.push_button_save_scenario.show()
 
+    def change_n_threads(self) -> None:
+        """
+        This function resizes the worker pool and the number of running calculations to the number of parallel threads.
+        If the number is increased during a calculation, the next waiting calculations are started directly.
+
+        Returns
+        -------
+        None
+        """
+        self.worker_pool.resize(self.gui_structure.option_n_threads.get_value())
+        self.batch_worker_pool.resize(self.gui_structure.option_n_threads.get_value()) if self.batch_worker_pool is not None else None
+        self.scheduler.resize(self.gui_structure.option_n_threads.get_value() * self.batch_chunk_size)
+        self.start_next_threads()
+
     def change_font_size(self):
         size = self.gui_structure.option_font_size.get_value()  # type: ignore
         globs.FONT_SIZE = size
@@ -470,7 +721,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             dir=str(self.default_path),
         )
         d_s = self.list_widget_scenario.currentItem().data(MainWindow.role)
-        getattr(d_s.results, result_export.export_function)(filename[0])
+        getattr(d_s.load_results(), result_export.export_function)(filename[0])
 
     def change_figure_option(self):
         d_s = self.list_widget_scenario.currentItem().data(MainWindow.role)
@@ -552,13 +803,34 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # button.setMinimumSize(self.size_push_s)
         button.resize(self.size_push_s)
 
-    def change(self) -> None:
+    def change_option(self, option: Option) -> None:
+        """
+        This function marks the current scenario as changed after the option has been changed.
+        The results of the scenario are only removed if the results of the selected aim depend on the option.
+
+        Parameters
+        ----------
+        option : Option
+            option which has been changed
+
+        Returns
+        -------
+        None
+        """
+        self.change(remove_results=self.gui_structure.results_depend_on(option))
+
+    def change(self, remove_results: bool = True) -> None:
         """
         This function checks if there are changes to a scenario or a file save happened.
         If there were changes, an * is added to the current scenario.
         This function is only active when self.started is True (this is the case when the application is running)
         and self.checking is True (this can temporarily be disabled by some other function).
 
+        Parameters
+        ----------
+        remove_results : bool
+            False if the change does not influence the results of the current scenario
+
         Returns
         -------
         None
@@ -573,9 +845,10 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             self.change_window_title()
         # get current index of scenario
         item = self.list_widget_scenario.currentItem()
-        # remove results object
+        # remove results object (the figures are recreated in any case, since the change can influence them)
         item.data(MainWindow.role).close_figures()
-        item.data(MainWindow.role).results = None
+        item.data(MainWindow.role).results = None if remove_results else item.data(MainWindow.role).results
+        item.data(MainWindow.role).run_statistics = None if remove_results else item.data(MainWindow.role).run_statistics
         # abort here if autosave scenarios is used
         if self.gui_structure.option_auto_saving.get_value() == 1:
             self.save_scenario()
@@ -598,7 +871,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
 
     def check_buttons(self):
         try:
-            not_running = self.list_widget_scenario.currentItem() not in [thread.item for thread in self.threads]
+            not_running = not self.scheduler.is_calculating(self.list_widget_scenario.currentItem())
         except RuntimeError:  # pragma: no cover
             not_running = True
         if self.check_values() and not_running:
@@ -636,7 +909,8 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # return if not checking
         if new_row_item is None or not self.checking:
             return
-
+        # calculate the selected scenario first
+        self.scheduler.prioritize(new_row_item)
         self.check_buttons()
         # if no old item is selected do nothing and return
         if old_row_item is None:
@@ -912,8 +1186,9 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             getattr(self, i).setText(getattr(self.translations, i)[self.gui_structure.option_language.get_value()[0]])
         # set translation of toolbox items
         self.gui_structure.translate(self.gui_structure.option_language.get_value()[0], self.translations)
-        for idx, name in enumerate(self.translations.languages):
-            self.gui_structure.option_language.widget.setItemText(idx, name)
+        self.gui_structure.option_language.set_entries(self.translations.languages)
+        if self.run_statistics_dialog is not None:
+            self.run_statistics_dialog.translate(self.translations, self.gui_structure.option_language.get_value()[0])
         # set small PushButtons
         self.check_page_button_layout(False)
         # replace scenario names if they are not unique
@@ -973,23 +1248,38 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         -------
         None
         """
-        func = ft_partial(self._save_to_data, self.backup_file)
-        self.saving_threads.append(SavingThread(datetime.datetime.now(), func))
-        self._saving_threads_update()
+        self.saver.save(self.backup_file, ft_partial(self.backup_journal.save, self.create_snapshot()))
 
-    def _saving_threads_update(self):
-        if len(self.saving_threads) < 1:
-            return
-        thread = self.saving_threads[0]
-        if thread.calculated:
-            thread.terminate()
-            self.saving_threads.remove(thread)
-            self._saving_threads_update()
-            return
-        if thread.isRunning():  # pragma: no cover
+    def create_snapshot(self) -> ProjectSnapshot:
+        """
+        This function takes a snapshot of the project, which can be saved in a background thread.
+
+        Returns
+        -------
+        ProjectSnapshot
+        """
+        scenario_names = [self.list_widget_scenario.item(idx).text() for idx in range(self.list_widget_scenario.count())]
+        return self.snapshot_creator.take(scenario_names, self.list_ds, self.filename, f"{self.default_path}")
+
+    def _saving_failed(self, target: str, error: str) -> None:
+        """
+        This function logs the error of a save in the background thread.
+
+        Parameters
+        ----------
+        target : str
+            file which could not be written
+        error : str
+            name of the error
+
+        Returns
+        -------
+        None
+        """
+        if error == FileNotFoundError.__name__:
+            globs.LOGGER.error(self.translations.no_file_selected[self.gui_structure.option_language.get_value()[0]])
             return
-        thread.any_signal.connect(self._saving_threads_update)
-        thread.start() if not MainWindow.TEST_MODE else None
+        globs.LOGGER.error(f"{error}: {target}")  # pragma: no cover
 
     def _load_from_data(self, location: str | Path, append: bool = False) -> None:
         """
@@ -1011,7 +1301,13 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         except FileNotFoundError:
             globs.LOGGER.error(self.translations.no_file_selected[self.gui_structure.option_language.get_value()[0]])
             return
+        except BinaryFormatError as err:
+            # a damaged binary project file is not loaded, so the current project is kept
+            globs.LOGGER.error(f"{location}: {err}")
+            return
         if saving["version"] in self.version_import_functions:
+            # the import functions of other versions convert the results as well, so the lazily read results are decoded first
+            saving["results"] = [result.load() if isinstance(result, LazyPayload) else result for result in saving["results"]]
             saving: JsonDict = self.version_import_functions[saving["version"]](saving)
         # set and change the window title
         if not append:
@@ -1021,17 +1317,24 @@ class MainWindow(QtW.QMainWindow, BaseUI):
                 self.default_path = Path(saving["default_path"])  # type: ignore
             self.change_window_title()
             self.list_widget_scenario.clear()
+            self.result_memo.clear()
         else:
             self.changedFile = True
             self.change_window_title()
         # write data to variables
-        for _idx, (val, results, name) in enumerate(zip(saving["values"], saving["results"], saving["names"])):
+        # the run statistics are not stored in older files
+        list_statistics = saving.get("statistics", [None] * len(saving["names"]))
+        for val, results, name, statistics in zip(saving["values"], saving["results"], saving["names"], list_statistics):
             d_s = DataStorage(self.gui_structure)
             d_s.from_dict(val)
-            d_s.results = None if results is None else self.result_creating_class.from_dict(results)
+            # the results are only created when they are needed, so large project files load quickly
+            d_s.results = None if results is None else LazyResults(results, self.result_creating_class.from_dict)
+            d_s.run_statistics = None if statistics is None else RunStatistics.from_dict(statistics)
+            self._load_cached_results(d_s)
             item = QtW.QListWidgetItem(self.set_name(name))
             item.setData(MainWindow.role, d_s)
             self.list_widget_scenario.addItem(item)
+        globs.LOGGER.info(f"{self.result_cache}") if self.result_cache is not None else None
 
         self.list_widget_scenario.setCurrentRow(0)
         ds = self.list_widget_scenario.item(0).data(self.role)
@@ -1054,26 +1357,35 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         -------
         None
         """
-        # create list of all scenario names
-        scenario_names = [self.list_widget_scenario.item(idx).text() for idx in range(self.list_widget_scenario.count())]
-        # create saving dict
-        list_ds = [self.list_widget_scenario.item(idx).data(MainWindow.role) for idx in range(self.list_widget_scenario.count())]
-        saving: JsonDict = {
-            "filename": self.filename,
-            "names": scenario_names,
-            "version": globs.VERSION,
-            "values": [d_s.to_dict() for d_s in list_ds],
-            "results": [d_s.results.to_dict() if d_s.results is not None else None for d_s in list_ds],
-            "default_path": f"{self.default_path}",
-        }
-        file_extension = splitext(location)[1].replace(".", "")
         try:
-            self.export_functions[file_extension](Path(location), saving)
+            self._write_data(location, self.create_snapshot())
         except FileNotFoundError:
             globs.LOGGER.error(self.translations.no_file_selected[self.gui_structure.option_language.get_value()[0]])
         except PermissionError:  # pragma: no cover
             globs.LOGGER.error("PermissionError")
 
+    def _write_data(self, location: str | Path, snapshot: ProjectSnapshot) -> None:
+        """
+        This function serializes the snapshot and writes it with the export function of the file extension.
+        It does not touch any widget, so it can be run in a background thread. The file is written in a temporary
+        file first, so it is not corrupted if the writing is interrupted.
+
+        Parameters
+        ----------
+        location : str | Path
+            Location of the data file.
+        snapshot : ProjectSnapshot
+            snapshot of the project
+
+        Returns
+        -------
+        None
+        """
+        file_extension = splitext(location)[1].replace(".", "")
+        saving: JsonDict = snapshot.to_dict()  # type: ignore
+        export_function = self.export_functions[file_extension]
+        write_atomic(Path(location), lambda temporary: export_function(temporary, saving))
+
     def load_add_scenarios(self) -> None:
         """
         This function sets the filename by opening a QFileDialog box.
@@ -1188,7 +1500,9 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         if filename == MainWindow.filename_default or not filename[0]:
             return False
         self.default_path = Path(filename[0]).parent
-        self.filename = filename if splitext(filename[0])[1].replace(".", "") == globs.FILE_EXTENSION else self.filename
+        # the project formats become the current file, other formats are only exported
+        project_formats = (globs.FILE_EXTENSION, f"{globs.FILE_EXTENSION}Bin")
+        self.filename = filename if splitext(filename[0])[1].replace(".", "") in project_formats else self.filename
         self.fun_save(filename)  # save data under a new filename
         return True
 
@@ -1218,9 +1532,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # save scenarios
         self.save_scenario()
         # try to store the data in the pickle file
-        func = ft_partial(self._save_to_data, filename[0])  # type: ignore
-        self.saving_threads.append(SavingThread(datetime.datetime.now(), func))
-        self._saving_threads_update()
+        self.saver.save(filename[0], ft_partial(self._write_data, filename[0], self.create_snapshot()), debounce=False)  # type: ignore
         # deactivate changed file * from window title
         self.changedFile = False
         self.change_window_title()
@@ -1247,6 +1559,7 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.filename = MainWindow.filename_default  # reset filename
         if self.fun_save():  # get and save filename
             self.list_widget_scenario.clear()  # clear list widget with scenario list
+            self.result_memo.clear()
             self.add_scenario()
             self.display_results()  # clear the results page
             self.fun_save()
@@ -1323,9 +1636,16 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # get selected scenario index
         item = self.list_widget_scenario.currentItem()
         # if no scenario exists create a new one else save DataStorage with new inputs in list of scenarios
-        if item.data(MainWindow.role).results is None:  # do not overwrite any results
-            item.data(MainWindow.role).close_figures()
-            item.setData(MainWindow.role, DataStorage(self.gui_structure))
+        d_s_old: DataStorage = item.data(MainWindow.role)
+        d_s = DataStorage(self.gui_structure)
+        if d_s_old.results is None:  # do not overwrite any results
+            d_s_old.close_figures()
+            item.setData(MainWindow.role, d_s)
+        elif d_s != d_s_old:
+            # the results are kept by changes which do not influence them
+            d_s_old.close_figures()
+            d_s.results, d_s.debug_message, d_s.run_statistics = d_s_old.results, d_s_old.debug_message, d_s_old.run_statistics
+            item.setData(MainWindow.role, d_s)
         # remove * from scenario if not Auto save is checked and if the last char is a *
         if self.gui_structure.option_auto_saving.get_value() != 1:
             text = item.text()
@@ -1384,6 +1704,37 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # run change function to mark unsaved inputs
         self.change()
 
+    def add_scenarios(self, data_storages: list[DataStorage], names: list[str], calculate: bool = False) -> None:
+        """
+        This function adds many scenarios at once (e.g. of a parameter sweep). The DataStorages are added directly to
+        the list, so neither the widgets of the options are set nor the change function is called per scenario.
+
+        Parameters
+        ----------
+        data_storages : list[DataStorage]
+            DataStorages of the new scenarios
+        names : list[str]
+            names of the new scenarios
+        calculate : bool
+            True if all scenarios should be calculated afterwards
+
+        Returns
+        -------
+        None
+        """
+        existing = {self.list_widget_scenario.item(idx).text().split("*")[0] for idx in range(self.list_widget_scenario.count())}
+        self.list_widget_scenario.blockSignals(True)
+        for d_s, name in zip(data_storages, names):
+            name = f"{name}(2)" if name in existing else name
+            existing.add(name)
+            item = QtW.QListWidgetItem(name)
+            item.setData(MainWindow.role, d_s)
+            self.list_widget_scenario.addItem(item)
+        self.list_widget_scenario.blockSignals(False)
+        self.changedFile = True
+        self.change_window_title()
+        self.start_multiple_scenarios_calculation() if calculate else None
+
     def update_bar(self, val: int | float) -> None:
         """
         This function updates the status bar or hides them if it is no longer needed.
@@ -1402,16 +1753,53 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         self.status_bar_progress_bar.show()
         # calculate percentage of calculated scenario
         val = val / max(len(self.threads), 1)
-        # set percentage to progress bar
+        # set percentage and the estimated remaining time to progress bar
         self.progress_bar.setValue(round(val * 100))
+        remaining = self.scheduler.remaining_time()
+        self.progress_bar.setFormat("%p%" if remaining is None else f"%p% ({datetime.timedelta(seconds=round(remaining))} remaining)")
         # hide labels and progressBar if all scenarios are calculated
-        if all(thread.calculated for thread in self.threads):
-            self.threads = []
+        if self.scheduler.done:
+            self.scheduler.clear()
             self.progress_bar.setValue(100)
+            self.progress_bar.setFormat("%p%")
             self.status_bar_progress_bar.hide()
             # show message that calculation is finished
             globs.LOGGER.info(self.translations.Calculation_Finished[self.gui_structure.option_language.get_value()[0]])
 
+    def update_progress(self, progress: float) -> None:
+        """
+        This function updates the progress bar with the progress reported by the running calculations.
+
+        Parameters
+        ----------
+        progress : float
+            progress of the calculation which reported it
+
+        Returns
+        -------
+        None
+        """
+        if self.scheduler.done:
+            return
+        self.update_bar(self.scheduler.progress)
+
+    def show_partial_results(self, thread: CalcProblem) -> None:
+        """
+        This function displays the partial results of the running calculation if its scenario is selected.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread which reported partial results
+
+        Returns
+        -------
+        None
+        """
+        if thread.calculated or thread.item is not self.list_widget_scenario.currentItem():
+            return
+        self.display_results()
+
     def thread_function(self, results: CalcProblem) -> None:
         """
         This function closes the thread of the old calculation and stores it results.
@@ -1429,22 +1817,29 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         """
         # stop finished thread
         results.terminate()
-        # count number of finished calculated scenarios
-        item_list = [thread.item for thread in self.threads]
-        open_threads = [thread for thread in self.threads if not thread.calculated and not thread.isRunning()]
-        n_closed_threads = len(self.threads) - len([thread for thread in self.threads if not thread.calculated])
+        self.supervisor.remove(results)
+        # ignore threads which have already been handled (e.g. stopped because of the time out)
+        if not self.scheduler.finish(results):
+            return
+        # pass the results to the scenarios with the same inputs
+        followers = self.result_memo.finish(results)
+        if self.result_cache is not None:
+            # the results are written in the background, so large results do not block the GUI
+            file = self.result_cache.file(results.d_s)
+            self.saver.save(file, ft_partial(self.result_cache.write, file, results.d_s.results))
+        current_item = self.list_widget_scenario.currentItem()
+        show_results = self.scheduler.is_calculating(current_item) or any(item is current_item for item in followers)
         # update progress bar
-        self.update_bar(n_closed_threads)
+        self.update_bar(self.scheduler.progress)
+        if self.run_statistics_dialog is not None and self.run_statistics_dialog.isVisible():
+            self.fun_run_statistics()
         # if number of finished is the number that has to be calculated enable buttons and actions and change page to
         # results page
-        if open_threads:  # pragma: no cover
-            # start new thread
-            open_threads[0].start() if not MainWindow.TEST_MODE else None
-            open_threads[0].any_signal.connect(self.thread_function)
+        if self.start_next_threads():
             return
         # display results
         self.check_buttons()
-        if self.list_widget_scenario.currentItem() in item_list:
+        if show_results:
             self.gui_structure.page_result.button.click()
 
     def start_multiple_scenarios_calculation(self) -> None:
@@ -1460,31 +1855,42 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             return
         # add scenario if no list of scenarios exits else save current scenario
         self.add_scenario() if self.list_widget_scenario.count() < 1 else self.save_scenario()
-        # create list of threads with scenarios that have not been calculated
-        self.threads += [
-            CalcProblem(
-                self.list_widget_scenario.item(idx).data(MainWindow.role),
-                self.list_widget_scenario.item(idx),
-                data_2_results_function=self.data_2_results_function,
+        _ = [self.result_memo.add(d_s) for d_s in self.list_ds]
+        # create list of threads with scenarios that have not been calculated.
+        # Scenarios with the same inputs as an already calculated or running one reuse its results instead.
+        n_reused: int = 0
+        for idx in range(self.list_widget_scenario.count()):
+            item = self.list_widget_scenario.item(idx)
+            d_s: DataStorage = item.data(MainWindow.role)
+            if d_s.results is not None:
+                continue
+            if self.result_memo.lookup(d_s) or self._load_cached_results(d_s):
+                item.setData(MainWindow.role, d_s)
+                n_reused += 1
+                continue
+            if self.result_memo.attach(d_s, item):
+                continue
+            self.schedule_thread(
+                CalcProblem(
+                    d_s,
+                    item,
+                    data_2_results_function=self.data_2_results_function,
+                    worker_pool=self.worker_pool,
+                    backend=self.execution_backend,
+                ),
+                priority=item is self.list_widget_scenario.currentItem(),
             )
-            for idx in range(self.list_widget_scenario.count())
-            if self.list_widget_scenario.item(idx).data(MainWindow.role).results is None
-        ]
+        globs.LOGGER.info(f"{self.result_cache}") if self.result_cache is not None else None
         # set number of to calculate scenarios
         if len(self.threads) < 1:
+            self.check_results() if n_reused > 0 else None
             return
         # disable buttons and actions to avoid two calculation at once
         self.check_buttons()
         # update progress bar
-        self.update_bar(0)
-        # start calculation if at least one scenario has to be calculated
-        if [thread for thread in self.threads if thread.isRunning()]:  # pragma: no cover
-            return
-        for thread in self.threads[: self.gui_structure.option_n_threads.get_value()]:
-            thread.start() if not MainWindow.TEST_MODE else None
-            thread.any_signal.connect(self.thread_function)
-            if thread.USE_MULTITHREADING:
-                QtC.QTimer.singleShot(1, ft_partial(self.wait_2_terminate, thread))
+        self.update_bar(self.scheduler.progress)
+        # start calculations as long as the maximal number of parallel threads is not reached
+        self.start_next_threads()
 
     def start_current_scenario_calculation(self) -> None:
         """
@@ -1506,31 +1912,123 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         if ds.results is not None:
             self.gui_structure.page_result.button.click()
             return
-        # create list of threads with calculation to be made
-        self.threads += [CalcProblem(ds, self.list_widget_scenario.currentItem(), data_2_results_function=self.data_2_results_function)]
+        # add the calculation in front of the queue
+        self.schedule_thread(
+            CalcProblem(
+                ds,
+                self.list_widget_scenario.currentItem(),
+                data_2_results_function=self.data_2_results_function,
+                worker_pool=self.worker_pool,
+                backend=self.execution_backend,
+            ),
+            priority=True,
+        )
         # disable buttons and actions to avoid two calculation at once
         self.check_buttons()
         # update progress bar
-        self.update_bar(0)
-        # start calculation
-        if len(self.threads) == 1:
-            self.threads[0].start() if not MainWindow.TEST_MODE else None
-            self.threads[0].any_signal.connect(self.thread_function)
-            if self.threads[0].USE_MULTITHREADING:
-                QtC.QTimer.singleShot(1, ft_partial(self.wait_2_terminate, self.threads[0]))
+        self.update_bar(self.scheduler.progress)
+        # start calculation if the maximal number of parallel threads is not reached
+        self.start_next_threads()
 
-    @staticmethod
-    def wait_2_terminate(thread: CalcProblem):
-        finished = thread.wait(thread.d_s.time_out * 1000)  # type: ignore
-        if finished:
+    def schedule_thread(self, thread: CalcProblem, priority: bool = False) -> None:
+        """
+        This function adds the calculation thread to the queue of the scheduler.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread
+        priority : bool
+            True if the calculation should be started before the other waiting ones
+
+        Returns
+        -------
+        None
+        """
+        thread.any_signal.connect(self.thread_function)
+        thread.progress_signal.connect(self.update_progress)
+        thread.partial_results_signal.connect(self.show_partial_results)
+        self.result_memo.start(thread)
+        self.scheduler.add(thread, priority)
+
+    def start_next_threads(self) -> bool:
+        """
+        This function starts the next calculations of the queue as long as the maximal number of parallel threads is
+        not reached. If the batch calculation is activated, the calculations are started in chunks.
+
+        Returns
+        -------
+        bool
+            True if a calculation has been started
+        """
+        threads = self.scheduler.next_threads(self.batch_chunk_size)
+        if self.batch_data_2_results_function is None:
+            _ = [self.start_thread(thread) for thread in threads]  # type: ignore
+            return bool(threads)
+        for idx in range(0, len(threads), self.batch_chunk_size):
+            self.start_batch(threads[idx : idx + self.batch_chunk_size])
+        return bool(threads)
+
+    def start_batch(self, threads: list[CalcProblem]) -> None:
+        """
+        This function calculates the scenarios of the calculation threads at once with the batch function and adds the
+        calculation threads to the supervisor.
+
+        Parameters
+        ----------
+        threads : list[CalcProblem]
+            calculation threads of the chunk
+
+        Returns
+        -------
+        None
+        """
+        batch = CalcBatchProblem(
+            threads, self.dia, batch_data_2_results_function=self.batch_data_2_results_function, worker_pool=self.batch_worker_pool  # type: ignore
+        )
+        batch.finished.connect(batch.deleteLater)
+        batch.start() if not MainWindow.TEST_MODE else None
+        _ = [self.supervisor.add(thread) for thread in threads]  # type: ignore
+
+    def start_thread(self, thread: CalcProblem) -> None:
+        """
+        This function starts the calculation thread and adds it to the supervisor, which stops it
+        if its time out is exceeded.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread to be started
+
+        Returns
+        -------
+        None
+        """
+        thread.start() if not MainWindow.TEST_MODE else None
+        self.supervisor.add(thread)
+
+    def show_calculation_status(self, status: list[tuple[CalcProblem, float, float]]) -> None:
+        """
+        This function shows the elapsed and remaining time of every running calculation as tool tip of the progress bar.
+
+        Parameters
+        ----------
+        status : list[tuple[CalcProblem, float, float]]
+            list of the calculation thread with its elapsed and remaining time in seconds
+
+        Returns
+        -------
+        None
+        """
+        try:
+            text = "\n".join(
+                f"{thread.item.text()}: {thread.progress:.0%}, {elapsed:.0f}s elapsed" + ("" if math.isinf(remaining) else f", {remaining:.0f}s remaining")
+                for thread, elapsed, remaining in status
+            )
+        except RuntimeError:  # pragma: no cover
+            # the scenario list has been cleared in the meantime
             return
-        thread.d_s.debug_message = f"{RuntimeError(f'RuntimeError: run time > {thread.d_s.time_out}s')}"  # type: ignore
-        # save bore field in Datastorage
-        thread.d_s.results = None
-        thread.calculated = True
-        thread.item.setData(CalcProblem.role, thread.d_s)
-        thread.any_signal.emit(thread)
-        thread.terminate()
+        self.progress_bar.setToolTip(text)
 
     def display_results(self) -> None:
         """
@@ -1563,7 +2061,10 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         # get Datastorage of selected scenario
         ds: DataStorage = self.list_widget_scenario.currentItem().data(MainWindow.role)
         # get results of selected scenario
-        results = ds.results
+        results = ds.load_results()
+        # close the figures of the previously shown partial results
+        _ = [plt.close(fig) for fig in self.partial_figures]  # type: ignore
+        self.partial_figures = []
 
         # set debug message
         if ds.debug_message:
@@ -1571,6 +2072,11 @@ class MainWindow(QtW.QMainWindow, BaseUI):
             self.gui_structure.text_no_result.set_text(str(ds.debug_message))
             return
 
+        # show the partial results if the scenario is calculated at the moment
+        thread = self.scheduler.running_thread(self.list_widget_scenario.currentItem()) if results is None else None
+        partial = thread is not None and thread.partial_results is not None
+        results = thread.partial_results if partial else results  # type: ignore
+
         # hide widgets if no results exists and display not calculated text
         if results is None:
             hide_no_result(True)
@@ -1579,10 +2085,11 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         hide_no_result(False)
         # create figure for every ResultFigure object
         for fig_obj, fig_name in self.gui_structure.list_of_result_figures:
-            if fig_obj.is_hidden():
+            # the figures are only drawn once the result page has been created (see Page.LAZY)
+            if fig_obj.is_hidden() or fig_obj.canvas is None:
                 continue
 
-            fig = getattr(ds, fig_name)
+            fig = None if partial else getattr(ds, fig_name)
             if fig is None:
                 globs.set_graph_layout()
                 # create axes and drawing
@@ -1595,9 +2102,14 @@ class MainWindow(QtW.QMainWindow, BaseUI):
                 # draw new plot
                 fig.tight_layout() if fig_obj.frame.isVisible() else None
                 fig_obj.canvas.draw()
-                # set figure to datastorage
+                # set figure to datastorage (the figures of partial results are replaced by the next update)
+                if partial:
+                    self.partial_figures.append(fig)
+                    continue
                 setattr(ds, fig_name, fig)
+                self.figure_cache.add(ds, fig_name, fig)
                 continue
+            self.figure_cache.touch(ds, fig_name)
             globs.set_graph_layout()
             fig_obj.replace_figure(fig)
             globs.set_graph_layout()
@@ -1635,6 +2147,9 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         """
         # close app if nothing has been changed
         if not self.changedFile:
+            self.worker_pool.shutdown()
+            self.batch_worker_pool.shutdown() if self.batch_worker_pool is not None else None
+            self.execution_backend.shutdown() if self.execution_backend is not None else None
             event.accept()
             return
 
@@ -1651,13 +2166,14 @@ class MainWindow(QtW.QMainWindow, BaseUI):
         if not close:
             event.ignore()
             return
-        # stop all calculation threads
-        if len(self.saving_threads) > 1:
-            _ = [t.terminate() for t in self.saving_threads[1:-2]]  # type: ignore
-            self.saving_threads[0].wait() if len(self.saving_threads) > 2 else None
-            _ = [t.start() for t in self.saving_threads[-2:]]  # type: ignore
-            _ = [t.wait() for t in self.saving_threads[-2:]]  # type: ignore
+        # write the pending saves and stop all calculation threads
+        self.saver.flush()
         _ = [t.terminate() for t in self.threads]  # type: ignore
+        _ = [t.batch.terminate() for t in self.threads if t.batch is not None]  # type: ignore
+        self.supervisor.timer.stop()
+        self.worker_pool.shutdown()
+        self.batch_worker_pool.shutdown() if self.batch_worker_pool is not None else None
+        self.execution_backend.shutdown() if self.execution_backend is not None else None
         # close figures
         _ = [self.list_widget_scenario.item(idx).data(MainWindow.role).close_figures() for idx in range(self.list_widget_scenario.count())]
         # close window if close variable is true else not
@@ -3,13 +3,20 @@ data storage class script
 """
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import TYPE_CHECKING, Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 
+from .gui_binary_format import LazyPayload
 from .gui_structure_classes import ListBox
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from ScenarioGUI.gui_classes.gui_run_statistics import RunStatistics
     from ScenarioGUI.gui_classes.gui_structure import GuiStructure
 
 
@@ -27,6 +34,8 @@ def is_equal(var_1: Any, var_2: Any) -> bool:
     -------
         bool
     """
+    if isinstance(var_1, np.ndarray) or isinstance(var_2, np.ndarray):
+        return np.array_equal(var_1, var_2)
     if isinstance(var_1, (tuple, list, dict)):
         if len(var_1) != len(var_2):
             return False
@@ -37,6 +46,68 @@ def is_equal(var_1: Any, var_2: Any) -> bool:
     return var_1 == var_2
 
 
+class LazyResults:
+    """
+    lightweight handle of the results of a scenario of a loaded project file or of the result cache. The results object
+    is only created (and a LazyPayload of a binary project file only decoded or a cache file only read) when the results
+    are loaded, e.g. because the scenario is selected or its results are exported.
+    """
+
+    def __init__(self, payload: dict | LazyPayload | Callable[[], dict | None], from_dict: Callable[[dict], object]):
+        """
+        This function initialises the handle.
+
+        Parameters
+        ----------
+        payload : dict | LazyPayload | Callable[[], dict | None]
+            to_dict payload of the results, the handle of it in a binary project file or the function which reads it
+            (e.g. from the result cache) and returns None if it can not be read anymore
+        from_dict : Callable[[dict], object]
+            function to create the results object from the payload
+        """
+        self._payload = payload
+        self._from_dict = from_dict
+        self._results: object | None = None
+
+    def _load_payload(self) -> dict | None:
+        if isinstance(self._payload, LazyPayload):
+            return self._payload.load()  # type: ignore
+        return self._payload() if callable(self._payload) else self._payload
+
+    def load(self) -> object | None:
+        """
+        This function creates the results object the first time it is called.
+
+        Returns
+        -------
+        object | None
+            results object or None if the payload can not be read anymore
+        """
+        if self._results is None:
+            payload = self._load_payload()
+            self._results = None if payload is None else self._from_dict(payload)
+        return self._results
+
+    def to_dict(self) -> dict | None:
+        """
+        This function returns the payload of the results, without creating the results object if it is not loaded yet.
+
+        Returns
+        -------
+        dict | None
+            to_dict payload of the results or None if the payload can not be read anymore
+        """
+        if self._results is not None:
+            return self._results.to_dict()  # type: ignore
+        return self._load_payload()
+
+    def __getattr__(self, name: str) -> Any:
+        # the results are loaded if one of their attributes is used
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+
 class DataStorage:
     """
     An instance of this class contains all the information available in the GuiStructure.
@@ -72,9 +143,54 @@ class DataStorage:
             setattr(self, figure_name, None)
 
         self.results: object | None = None
+        # statistics of the run which calculated the results
+        self.run_statistics: RunStatistics | None = None
 
         self.debug_message: str = ""
 
+    def load_results(self) -> object | None:
+        """
+        This function returns the results and creates them from the LazyResults handle of a loaded project file.
+        The handle itself is kept, so the results are still recognised as unchanged (e.g. by the BackupJournal).
+
+        Returns
+        -------
+        object | None
+            results object or None if there are no results
+        """
+        if isinstance(self.results, LazyResults):
+            results = self.results.load()
+            # a cache file can be removed in the meantime, so the scenario has to be calculated again
+            self.results = None if results is None else self.results
+            return results
+        return self.results
+
+    @classmethod
+    def from_values(cls, data: dict) -> DataStorage:
+        """
+        This function creates a DataStorage from a dictionary created by the to_dict function, without a GuiStructure.
+        This way, scenarios can be calculated without any widgets.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary with main class values created by to_dict function
+
+        Returns
+        -------
+        DataStorage
+        """
+        d_s = cls.__new__(cls)
+        d_s.list_options_aims = []
+        d_s.list_of_figures = []
+        d_s.__dict__.update(data)
+        for figure_name in d_s.list_of_figures:
+            setattr(d_s, figure_name, None)
+        d_s.results = None
+        d_s.run_statistics = None
+        d_s.debug_message = ""
+        return d_s
+
     def set_values(self, gui_structure: GuiStructure) -> None:
         """
         This function sets the values in the gui_structure according to the one stored in this class.
@@ -116,8 +232,8 @@ class DataStorage:
         dict
             Dictionary with the values of the class
         """
-        # get all normal values
-        return {key: value for key, value in self.__dict__.items() if isinstance(value, (int, bool, float, str, list, tuple))}
+        # get all normal values and arrays
+        return {key: value for key, value in self.__dict__.items() if isinstance(value, (int, bool, float, str, list, tuple, np.ndarray))}
 
     def from_dict(self, data: dict):
         """
@@ -135,6 +251,25 @@ class DataStorage:
         # set all normal values if they exist within the DS object
         _ = [setattr(self, key, value) for key, value in data.items() if hasattr(self, key)]  # type: ignore
 
+    def fingerprint(self, names: list[str] | None = None) -> str:
+        """
+        This function creates a stable hash of the values of all the options and aims.
+        DataStorages with the same inputs (e.g. scenarios which only differ in name) have the same fingerprint.
+
+        Parameters
+        ----------
+        names : list[str] | None
+            names of the options and aims to be hashed (None for all of them)
+
+        Returns
+        -------
+        str
+            hexadecimal sha256 hash of the inputs
+        """
+        values = {name: getattr(self, name, None) for name in (self.list_options_aims if names is None else names)}
+        text = json.dumps(values, sort_keys=True, default=lambda value: value.tolist() if hasattr(value, "tolist") else repr(value))
+        return hashlib.sha256(text.encode()).hexdigest()
+
     def __eq__(self, other) -> bool:
         """
         This function checks whether or not the current DataStorage object is equal to another one.
@@ -0,0 +1,376 @@
+"""
+This document contains the interface of the execution backends, which calculate the scenarios outside of the
+calculation threads, and the backend which distributes the calculations over remote worker servers
+(see ScenarioGUI.worker).
+"""
+from __future__ import annotations
+
+import abc
+import json
+import socket
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .gui_project_snapshot import json_default
+from .gui_run_statistics import RunStatistics
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from .gui_data_storage import DataStorage
+
+HEADER = struct.Struct("!Q")
+
+
+class ExecutionBackend(abc.ABC):
+    """
+    interface of a backend which calculates the scenarios, e.g. in local worker processes or on remote machines
+    """
+
+    @abc.abstractmethod
+    def run(
+        self,
+        d_s: DataStorage,
+        time_out: float | None,
+        progress: Callable[[float], None] | None = None,
+        partial_results: Callable[[object], None] | None = None,
+        statistics: Callable[[RunStatistics], None] | None = None,
+    ) -> tuple[Exception | str, object | None]:
+        """
+        This function calculates the DataStorage and blocks until the results are available.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage object with all the date to perform the calculation for
+        time_out : float | None
+            maximal run time in seconds (None for no time out)
+        progress : Callable[[float], None] | None
+            function which is called with the progress reported by the calculation
+        partial_results : Callable[[object], None] | None
+            function which is called with the partial results reported by the calculation
+        statistics : Callable[[RunStatistics], None] | None
+            function which is called with the run statistics measured by the backend
+
+        Returns
+        -------
+        tuple[Exception | str, object | None]
+            debug message and the results
+        """
+
+    def resize(self, size: int) -> None:
+        """
+        This function sets the number of calculations the backend should run at the same time.
+
+        Parameters
+        ----------
+        size : int
+            number of parallel calculations
+
+        Returns
+        -------
+        None
+        """
+
+    def shutdown(self) -> None:
+        """
+        This function releases all the resources of the backend.
+
+        Returns
+        -------
+        None
+        """
+
+
+def send_message(connection: socket.socket, message: dict) -> None:
+    """
+    This function sends a JSON message with its length in front of it.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        connected socket
+    message : dict
+        JSON serializable message, which can contain NumPy values
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        if the message is not JSON serializable
+    """
+    data = json.dumps(message, default=json_default).encode()
+    connection.sendall(HEADER.pack(len(data)) + data)
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return data
+
+
+def receive_message(connection: socket.socket) -> dict:
+    """
+    This function receives a JSON message sent by the send_message function.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        connected socket
+
+    Returns
+    -------
+    dict
+        message
+
+    Raises
+    ------
+    ConnectionError
+        if the connection is closed
+    """
+    (size,) = HEADER.unpack(_receive(connection, HEADER.size))
+    return json.loads(_receive(connection, size))
+
+
+class RemoteWorker:
+    """
+    class of a worker server with its open connections and the number of calculations running on it
+    """
+
+    def __init__(self, host: str, port: int):
+        """
+        This function initialises the worker.
+
+        Parameters
+        ----------
+        host : str
+            host name or ip address of the worker server
+        port : int
+            port of the worker server
+        """
+        self.host = host
+        self.port = port
+        self.capacity: int = 1  # number of parallel calculations, which is sent by the server on every new connection
+        self.running: int = 0
+        self.failures: int = 0  # number of failed connections in a row
+        self.retry_at: float = 0.0  # time (time.monotonic) from which on a new connection is tried after a failure
+        self.idle_connections: list[socket.socket] = []
+
+    @property
+    def load(self) -> float:
+        """fraction of the capacity which is used"""
+        return self.running / self.capacity
+
+    def __repr__(self) -> str:
+        return f"{self.host}:{self.port}"
+
+
+class RemoteTimeOut(Exception):
+    """
+    error if a worker server does not answer within the time out of the calculation and the grace time
+    """
+
+
+class RemoteBackend(ExecutionBackend):
+    """
+    class of the backend which sends the DataStorages as dictionaries to remote worker servers and creates the results
+    from the returned to_dict payloads. The calculations are sent to the worker with the lowest load. If a worker can
+    not be reached, the calculation is sent to another one, and a new connection to the failed worker is tried after
+    an increasing delay.
+    The messages are not authenticated, so the worker servers should only be reachable in a trusted network.
+    """
+
+    RETRY_DELAY: float = 1.0  # delay after the first failure in seconds, doubled after every further failure
+    MAX_RETRY_DELAY: float = 30.0
+
+    def __init__(
+        self,
+        addresses: list[str],
+        results_from_dict: Callable[[dict], object],
+        *,
+        connect_time_out: float = 5.0,
+        grace_time: float = 10.0,
+    ):
+        """
+        This function initialises the remote backend.
+
+        Parameters
+        ----------
+        addresses : list[str]
+            addresses of the worker servers as 'host:port'
+        results_from_dict : Callable[[dict], object]
+            function to create the results class from its to_dict payload
+        connect_time_out : float
+            maximal time to connect to a worker server in seconds
+        grace_time : float
+            time in seconds the backend waits longer than the time out of a calculation before the worker
+            is considered to be unreachable
+        """
+        self.results_from_dict = results_from_dict
+        self.connect_time_out = connect_time_out
+        self.grace_time = grace_time
+        self.workers: list[RemoteWorker] = []
+        self._condition = threading.Condition()
+        _ = [self.add_worker(address) for address in addresses]  # type: ignore
+
+    def add_worker(self, address: str) -> None:
+        """
+        This function registers a worker server.
+
+        Parameters
+        ----------
+        address : str
+            address of the worker server as 'host:port'
+
+        Returns
+        -------
+        None
+        """
+        host, port = address.rsplit(":", 1)
+        with self._condition:
+            self.workers.append(RemoteWorker(host, int(port)))
+            self._condition.notify_all()
+
+    def _acquire(self) -> RemoteWorker:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                free = [worker for worker in self.workers if worker.retry_at <= now and worker.running < worker.capacity]
+                if free:
+                    worker = min(free, key=lambda worker: worker.load)
+                    worker.running += 1
+                    return worker
+                # wait until a calculation is finished or a failed worker can be tried again
+                retry_times = [worker.retry_at - now for worker in self.workers if worker.retry_at > now]
+                self._condition.wait(min(retry_times) if retry_times else None)
+
+    def _release(self, worker: RemoteWorker, connection: socket.socket | None, failed: bool = True) -> None:
+        with self._condition:
+            worker.running -= 1
+            if connection is not None:
+                worker.failures = 0
+                worker.idle_connections.append(connection)
+            elif failed:
+                worker.failures += 1
+                worker.retry_at = time.monotonic() + min(self.RETRY_DELAY * 2 ** (worker.failures - 1), self.MAX_RETRY_DELAY)
+                _ = [idle.close() for idle in worker.idle_connections]  # type: ignore
+                worker.idle_connections.clear()
+            self._condition.notify_all()
+
+    def _connect(self, worker: RemoteWorker) -> socket.socket:
+        connection = socket.create_connection((worker.host, worker.port), timeout=self.connect_time_out)
+        hello = receive_message(connection)
+        with self._condition:
+            worker.capacity = max(int(hello["capacity"]), 1)
+        return connection
+
+    def _request(
+        self,
+        connection: socket.socket,
+        d_s: DataStorage,
+        time_out: float | None,
+        progress: Callable[[float], None] | None,
+        statistics: Callable[[RunStatistics], None] | None,
+    ) -> tuple[str, object | None]:
+        connection.settimeout(None if time_out is None else time_out + self.grace_time)
+        send_message(connection, {"values": d_s.to_dict(), "time_out": time_out})
+        while True:
+            try:
+                message = receive_message(connection)
+            except socket.timeout as err:
+                raise RemoteTimeOut(f"{time_out}") from err
+            if "statistics" in message:
+                statistics(RunStatistics.from_dict(message["statistics"])) if statistics is not None else None
+                continue
+            if "progress" not in message:
+                break
+            progress(message["progress"]) if progress is not None else None
+        results = None if message["results"] is None else self.results_from_dict(message["results"])
+        return message["debug_message"], results
+
+    def run(
+        self,
+        d_s: DataStorage,
+        time_out: float | None,
+        progress: Callable[[float], None] | None = None,
+        partial_results: Callable[[object], None] | None = None,
+        statistics: Callable[[RunStatistics], None] | None = None,
+    ) -> tuple[Exception | str, object | None]:
+        """
+        This function calculates the DataStorage on the worker with the lowest load.
+        Partial results are not transferred from the workers.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage object with all the date to perform the calculation for
+        time_out : float | None
+            maximal run time in seconds (None for no time out), which is enforced by the worker server
+        progress : Callable[[float], None] | None
+            function which is called with the progress reported by the calculation
+        partial_results : Callable[[object], None] | None
+            not used
+        statistics : Callable[[RunStatistics], None] | None
+            function which is called with the run statistics measured by the worker server
+
+        Returns
+        -------
+        tuple[Exception | str, object | None]
+            debug message and the results
+        """
+        error: Exception | None = None
+        # every worker is tried at most twice, so a calculation does not wait forever if no worker is reachable
+        for _ in range(2 * len(self.workers)):
+            worker = self._acquire()
+            with self._condition:
+                connection = worker.idle_connections.pop() if worker.idle_connections else None
+            try:
+                if connection is not None:
+                    try:
+                        outputs = self._request(connection, d_s, time_out, progress, statistics)
+                        self._release(worker, connection)
+                        return outputs
+                    except (OSError, ValueError):
+                        # the idle connection can be closed by a restarted server, so a new one is tried
+                        connection.close()
+                connection = self._connect(worker)
+                outputs = self._request(connection, d_s, time_out, progress, statistics)
+            except RemoteTimeOut:
+                # the calculation runs longer than its time out, so it would run as long on every other worker
+                connection.close()
+                self._release(worker, None, failed=False)
+                return f"{RuntimeError(f'RuntimeError: run time > {time_out}s')}", None
+            except TypeError as err:
+                # the DataStorage can not be serialized, so the calculation would fail on every other worker as well
+                self._release(worker, connection)
+                return f"{err}", None
+            except (OSError, ValueError, KeyError) as err:
+                connection.close() if connection is not None else None
+                self._release(worker, None)
+                error = err
+                continue
+            self._release(worker, connection)
+            return outputs
+        return f"{RuntimeError(f'RuntimeError: no remote worker reachable ({error})')}", None
+
+    def shutdown(self) -> None:
+        """
+        This function closes all the idle connections to the workers.
+
+        Returns
+        -------
+        None
+        """
+        with self._condition:
+            for worker in self.workers:
+                _ = [connection.close() for connection in worker.idle_connections]  # type: ignore
+                worker.idle_connections.clear()
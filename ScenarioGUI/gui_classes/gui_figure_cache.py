@@ -0,0 +1,154 @@
+"""
+This document contains the cache of the result figures stored in the DataStorages, which limits the number and memory
+of the figures by closing the least recently viewed ones. Closed figures are created again by display_results when
+their scenario is viewed again.
+"""
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from matplotlib import pyplot as plt
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .gui_data_storage import DataStorage
+
+
+def estimate_size(fig: plt.Figure) -> int:
+    """
+    This function estimates the memory of a figure by the size of its RGBA canvas.
+
+    Parameters
+    ----------
+    fig : plt.Figure
+        figure
+
+    Returns
+    -------
+    int
+        memory in bytes
+    """
+    width, height = fig.get_size_inches() * fig.dpi
+    return int(width * height * 4)
+
+
+class FigureCache:
+    """
+    class which keeps track of the result figures of all DataStorages in the order they have been viewed.
+    If the number or the estimated memory of the figures exceeds the budget, the least recently viewed figures are
+    closed and removed from their DataStorage.
+    """
+
+    def __init__(self, max_figures: int | None = 60, max_memory: int | None = None):
+        """
+        This function initialises the figure cache.
+
+        Parameters
+        ----------
+        max_figures : int | None
+            maximal number of figures (None for no limit)
+        max_memory : int | None
+            maximal estimated memory of the figures in bytes (None for no limit)
+        """
+        self.max_figures = max_figures
+        self.max_memory = max_memory
+        self._figures: OrderedDict[tuple[int, str], tuple[weakref.ref[DataStorage], plt.Figure, int]] = OrderedDict()
+
+    @staticmethod
+    def _is_alive(entry: tuple[weakref.ref[DataStorage], plt.Figure, int], fig_name: str) -> bool:
+        d_s = entry[0]()
+        return d_s is not None and getattr(d_s, fig_name, None) is entry[1]
+
+    def add(self, d_s: DataStorage, fig_name: str, fig: plt.Figure) -> None:
+        """
+        This function adds the figure of the DataStorage as most recently viewed one and closes the least recently
+        viewed figures of the other DataStorages if the budget is exceeded.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage with the figure
+        fig_name : str
+            name of the figure in the DataStorage
+        fig : plt.Figure
+            figure
+
+        Returns
+        -------
+        None
+        """
+        # remove the entries of figures which are already closed (e.g. by a change of the inputs)
+        for key in [key for key, entry in self._figures.items() if not self._is_alive(entry, key[1])]:
+            del self._figures[key]
+        self._figures[(id(d_s), fig_name)] = (weakref.ref(d_s), fig, estimate_size(fig))
+        self._figures.move_to_end((id(d_s), fig_name))
+        self.evict(keep=d_s)
+
+    def touch(self, d_s: DataStorage, fig_name: str) -> None:
+        """
+        This function marks the figure of the DataStorage as most recently viewed.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage with the figure
+        fig_name : str
+            name of the figure in the DataStorage
+
+        Returns
+        -------
+        None
+        """
+        key = (id(d_s), fig_name)
+        if key in self._figures:
+            self._figures.move_to_end(key)
+
+    @property
+    def memory(self) -> int:
+        """estimated memory of all figures in bytes"""
+        return sum(entry[2] for entry in self._figures.values())
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def _over_budget(self) -> bool:
+        return (self.max_figures is not None and len(self._figures) > self.max_figures) or (
+            self.max_memory is not None and self.memory > self.max_memory
+        )
+
+    def evict(self, keep: DataStorage | None = None) -> None:
+        """
+        This function closes the least recently viewed figures until the budget is met.
+        The figures of the DataStorage to keep (e.g. the one which is shown) are not closed.
+
+        Parameters
+        ----------
+        keep : DataStorage | None
+            DataStorage of which the figures are not closed
+
+        Returns
+        -------
+        None
+        """
+        for key in list(self._figures):
+            if not self._over_budget():
+                return
+            ref, fig, _ = self._figures[key]
+            d_s = ref()
+            if d_s is not None and d_s is keep:
+                continue
+            del self._figures[key]
+            if d_s is not None and getattr(d_s, key[1], None) is fig:
+                setattr(d_s, key[1], None)
+            plt.close(fig)
+
+    def clear(self) -> None:
+        """
+        This function forgets all figures without closing them.
+
+        Returns
+        -------
+        None
+        """
+        self._figures.clear()
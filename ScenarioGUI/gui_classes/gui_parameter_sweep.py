@@ -0,0 +1,376 @@
+"""
+This document contains the parameter sweep, which creates many scenarios at once by varying the values of
+FloatBox, IntBox, ListBox and ButtonBox options, and the dialog to define it.
+"""
+from __future__ import annotations
+
+import copy
+import itertools
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import PySide6.QtCore as QtC
+import PySide6.QtWidgets as QtW
+
+from .gui_data_storage import DataStorage
+from .gui_structure_classes import ButtonBox, FloatBox, IntBox, ListBox
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from .gui_structure import GuiStructure
+    from .gui_structure_classes import Option
+    from .translation_class import Translations
+
+SWEEP_OPTIONS: tuple[type[Option], ...] = (FloatBox, IntBox, ListBox, ButtonBox)
+
+
+class Parameter(NamedTuple):
+    """
+    varied option of a parameter sweep with its discrete values or its range
+    """
+
+    name: str
+    option: Option
+    values: list[float | int] | None
+    low: float | None
+    high: float | None
+    n: int | None
+
+
+def is_sweepable(option: Option) -> bool:
+    """
+    This function checks if the option can be varied in a parameter sweep.
+    Options with units and figure options are not supported, since their values are not a single number or index.
+
+    Parameters
+    ----------
+    option : Option
+        option to check
+
+    Returns
+    -------
+    bool
+    """
+    return type(option) in SWEEP_OPTIONS
+
+
+def bounds(option: Option) -> tuple[float, float]:
+    """
+    This function returns the minimal and maximal value of the option. For the ListBox and ButtonBox these are the
+    minimal and maximal index of the entries.
+
+    Parameters
+    ----------
+    option : Option
+        FloatBox, IntBox, ListBox or ButtonBox
+
+    Returns
+    -------
+    tuple[float, float]
+        minimal and maximal value
+    """
+    if isinstance(option, (ListBox, ButtonBox)):
+        return 0, len(option.entries) - 1
+    return option.minimal_value, option.maximal_value  # type: ignore
+
+
+class ParameterSweep:
+    """
+    class to create the DataStorages of a parameter sweep.
+    All the options which are not varied keep the values of the current inputs of the GuiStructure.
+    """
+
+    FULL_FACTORIAL: str = "full factorial"
+    LATIN_HYPERCUBE: str = "Latin hypercube"
+    ONE_AT_A_TIME: str = "one-at-a-time"
+    DESIGNS: tuple[str, ...] = (FULL_FACTORIAL, LATIN_HYPERCUBE, ONE_AT_A_TIME)
+
+    def __init__(self, gui_structure: GuiStructure):
+        """
+        This function initialises the parameter sweep.
+
+        Parameters
+        ----------
+        gui_structure : GuiStructure
+            GuiStructure with the options to be varied
+        """
+        self.gui_structure = gui_structure
+        self.options: dict[str, Option] = {name: option for option, name in gui_structure.list_of_options if is_sweepable(option)}
+        self.parameters: list[Parameter] = []
+
+    def add(
+        self,
+        name: str,
+        values: Sequence[float | int] | None = None,
+        *,
+        low: float | None = None,
+        high: float | None = None,
+        n: int | None = None,
+    ) -> None:
+        """
+        This function adds an option to be varied, either with a list of values or with a range.
+        For ListBoxes and ButtonBoxes, the values are the indices of the entries. The values of FloatBoxes are rounded
+        to their number of decimals, so the widgets can show them.
+
+        Parameters
+        ----------
+        name : str
+            name of the option in the GuiStructure
+        values : Sequence[float | int] | None
+            values of the option
+        low : float | None
+            lower bound of the range (default: minimal value of the option)
+        high : float | None
+            upper bound of the range (default: maximal value of the option)
+        n : int | None
+            number of values in the range for the full factorial and one-at-a-time design.
+            The Latin hypercube design samples the whole range.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            if the option can not be varied or the values are not within the minimal and maximal value of the option
+        """
+        if name not in self.options:
+            raise ValueError(f"{name} is not a FloatBox, IntBox, ListBox or ButtonBox option")
+        option = self.options[name]
+        minimal, maximal = bounds(option)
+        if values is not None:
+            values = [self._cast(option, value) for value in values]
+            if not values or not all(minimal <= value <= maximal for value in values):
+                raise ValueError(f"the values of {name} have to be between {minimal} and {maximal}")
+            self.parameters.append(Parameter(name, option, values, None, None, None))
+            return
+        low = minimal if low is None else low
+        high = maximal if high is None else high
+        if not minimal <= low <= high <= maximal:
+            raise ValueError(f"the range of {name} has to be between {minimal} and {maximal}")
+        self.parameters.append(Parameter(name, option, None, low, high, n))
+
+    @staticmethod
+    def _cast(option: Option, value: float) -> float | int:
+        return round(float(value), option.decimal_number) if isinstance(option, FloatBox) else int(round(value))
+
+    def _grid(self, parameter: Parameter) -> list[float | int]:
+        if parameter.values is not None:
+            return parameter.values
+        if parameter.n is None:
+            raise ValueError(f"the number of values of {parameter.name} is needed for this design")
+        values = [self._cast(parameter.option, value) for value in np.linspace(parameter.low, parameter.high, parameter.n)]
+        # rounding of the values can create duplicates
+        return list(dict.fromkeys(values))
+
+    def full_factorial(self) -> list[dict[str, float | int]]:
+        """
+        This function creates all the combinations of the values of the parameters.
+
+        Returns
+        -------
+        list[dict[str, float | int]]
+            values of the varied options of every scenario
+        """
+        names = [parameter.name for parameter in self.parameters]
+        return [dict(zip(names, values)) for values in itertools.product(*[self._grid(parameter) for parameter in self.parameters])]
+
+    def latin_hypercube(self, n: int, seed: int | None = None) -> list[dict[str, float | int]]:
+        """
+        This function creates a Latin hypercube sample, so every parameter range (or list of values) is divided into
+        n strata and every stratum is sampled exactly once.
+
+        Parameters
+        ----------
+        n : int
+            number of scenarios
+        seed : int | None
+            seed of the random number generator
+
+        Returns
+        -------
+        list[dict[str, float | int]]
+            values of the varied options of every scenario
+        """
+        rng = np.random.default_rng(seed)
+        # one random point in every stratum and a random permutation of the strata per parameter
+        samples = (rng.permuted(np.tile(np.arange(n), (len(self.parameters), 1)), axis=1) + rng.random((len(self.parameters), n))) / n
+        columns = []
+        for parameter, sample in zip(self.parameters, samples):
+            if parameter.values is not None:
+                columns.append([parameter.values[int(value * len(parameter.values))] for value in sample])
+                continue
+            columns.append([self._cast(parameter.option, parameter.low + value * (parameter.high - parameter.low)) for value in sample])  # type: ignore
+        names = [parameter.name for parameter in self.parameters]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def one_at_a_time(self) -> list[dict[str, float | int]]:
+        """
+        This function creates the base scenario with the current inputs and one scenario for every other value of
+        every parameter, in which only this parameter is changed.
+
+        Returns
+        -------
+        list[dict[str, float | int]]
+            values of the varied options of every scenario
+        """
+        base = {parameter.name: self._value(parameter.option) for parameter in self.parameters}
+        return [base] + [
+            {**base, parameter.name: value} for parameter in self.parameters for value in self._grid(parameter) if value != base[parameter.name]
+        ]
+
+    @staticmethod
+    def _value(option: Option) -> float | int:
+        value = option.get_value()
+        return value[0] if isinstance(option, ListBox) else value  # type: ignore
+
+    def design(self, design: str, n: int = 10, seed: int | None = None) -> list[dict[str, float | int]]:
+        """
+        This function creates the values of the varied options of every scenario of the design.
+
+        Parameters
+        ----------
+        design : str
+            one of ParameterSweep.DESIGNS
+        n : int
+            number of scenarios of the Latin hypercube design
+        seed : int | None
+            seed of the random number generator of the Latin hypercube design
+
+        Returns
+        -------
+        list[dict[str, float | int]]
+            values of the varied options of every scenario
+        """
+        if design == self.FULL_FACTORIAL:
+            return self.full_factorial()
+        if design == self.LATIN_HYPERCUBE:
+            return self.latin_hypercube(n, seed)
+        if design == self.ONE_AT_A_TIME:
+            return self.one_at_a_time()
+        raise ValueError(f"unknown design {design}, use one of {self.DESIGNS}")
+
+    def create_data_storages(self, points: list[dict[str, float | int]]) -> list[tuple[str, DataStorage]]:
+        """
+        This function creates the DataStorages of the scenarios without setting any widget.
+
+        Parameters
+        ----------
+        points : list[dict[str, float | int]]
+            values of the varied options of every scenario
+
+        Returns
+        -------
+        list[tuple[str, DataStorage]]
+            name and DataStorage of every scenario
+        """
+        base = DataStorage(self.gui_structure)
+        scenarios = []
+        for point in points:
+            d_s = copy.deepcopy(base)
+            for name, value in point.items():
+                option = self.options[name]
+                if isinstance(option, ListBox):
+                    setattr(d_s, name, (value, option.entries[value]))  # type: ignore
+                    setattr(d_s, f"{name}_text", option.entries[value])  # type: ignore
+                    continue
+                setattr(d_s, name, value)
+            scenarios.append((", ".join(f"{name}={value}" for name, value in point.items()), d_s))
+        return scenarios
+
+
+class ParameterSweepDialog(QtW.QDialog):
+    """
+    class of the dialog to define a parameter sweep.
+    For every option, either a list of values (separated by ';') or a range with the number of values can be given.
+    """
+
+    def __init__(self, sweep: ParameterSweep, translations: Translations, language: int, parent: QtW.QWidget | None = None):
+        """
+        This function creates the dialog.
+
+        Parameters
+        ----------
+        sweep : ParameterSweep
+            parameter sweep to be defined
+        translations : Translations
+            translations of the GUI
+        language : int
+            index of the current language
+        parent : QtW.QWidget | None
+            parent widget
+        """
+        super().__init__(parent)
+        self.sweep = sweep
+        self.translations = translations
+        self.language = language
+        self.setWindowTitle(translations.action_parameter_sweep[language])
+        layout = QtW.QVBoxLayout(self)
+        self.table = QtW.QTableWidget(len(sweep.options), 5, self)
+        self.table.setHorizontalHeaderLabels(translations.label_sweep_columns[language].split(","))
+        for row, (name, option) in enumerate(sweep.options.items()):
+            item = QtW.QTableWidgetItem(f"{option.label_text[0]} ({name})")
+            item.setCheckState(QtC.Qt.Unchecked)  # type: ignore
+            item.setData(QtC.Qt.UserRole, name)  # type: ignore
+            self.table.setItem(row, 0, item)
+            minimal, maximal = bounds(option)
+            self.table.setItem(row, 2, QtW.QTableWidgetItem(f"{minimal}"))
+            self.table.setItem(row, 3, QtW.QTableWidgetItem(f"{maximal}"))
+            self.table.setItem(row, 4, QtW.QTableWidgetItem("3"))
+        self.table.resizeColumnsToContents()
+        layout.addWidget(self.table)
+        form = QtW.QFormLayout()
+        self.design = QtW.QComboBox(self)
+        # the entries are in the order of ParameterSweep.DESIGNS
+        self.design.addItems(translations.label_sweep_designs[language].split(","))
+        form.addRow(translations.label_sweep_design[language], self.design)
+        self.n_samples = QtW.QSpinBox(self)
+        self.n_samples.setRange(1, 100_000)
+        self.n_samples.setValue(10)
+        form.addRow(translations.label_sweep_n_samples[language], self.n_samples)
+        self.calculate = QtW.QCheckBox(self)
+        self.calculate.setChecked(True)
+        form.addRow(translations.label_sweep_calculate[language], self.calculate)
+        layout.addLayout(form)
+        self.label_error = QtW.QLabel(self)
+        layout.addWidget(self.label_error)
+        buttons = QtW.QDialogButtonBox(QtW.QDialogButtonBox.Ok | QtW.QDialogButtonBox.Cancel, parent=self)  # type: ignore
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def accept(self) -> None:
+        """
+        This function reads the table into the parameter sweep and closes the dialog if all the inputs are valid.
+
+        Returns
+        -------
+        None
+        """
+        self.sweep.parameters = []
+        try:
+            for row in range(self.table.rowCount()):
+                item = self.table.item(row, 0)
+                if item.checkState() != QtC.Qt.Checked:  # type: ignore
+                    continue
+                name = item.data(QtC.Qt.UserRole)  # type: ignore
+                values = self.table.item(row, 1).text() if self.table.item(row, 1) is not None else ""
+                if values.strip():
+                    self.sweep.add(name, [float(value) for value in values.split(";") if value.strip()])
+                    continue
+                self.sweep.add(
+                    name,
+                    low=float(self.table.item(row, 2).text()),
+                    high=float(self.table.item(row, 3).text()),
+                    n=int(self.table.item(row, 4).text()),
+                )
+        except ValueError as err:
+            self.label_error.setText(f"{err}")
+            return
+        if not self.sweep.parameters:
+            self.label_error.setText(self.translations.label_sweep_no_option[self.language])
+            return
+        super().accept()
+
@@ -0,0 +1,159 @@
+"""
+This document contains the snapshots of the project, which are taken on the GUI thread, so the serialization and the
+writing to disk can be done in a background thread without touching any widget.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+import ScenarioGUI.global_settings as globs
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from .gui_data_storage import DataStorage
+    from .gui_run_statistics import RunStatistics
+
+
+class ScenarioSnapshot(NamedTuple):
+    """
+    immutable state of a scenario. The values are shared between the snapshots as long as the DataStorage of the
+    scenario is unchanged, so they must not be changed.
+    """
+
+    name: str
+    values: dict
+    results: object | None
+    statistics: RunStatistics | None
+
+
+class ProjectSnapshot(NamedTuple):
+    """
+    immutable state of the project with the scenarios in the order of the scenario list
+    """
+
+    filename: tuple[str, str]
+    version: str
+    default_path: str
+    scenarios: tuple[ScenarioSnapshot, ...]
+
+    @property
+    def meta(self) -> dict:
+        """project values besides the scenarios"""
+        return {"filename": self.filename, "version": self.version, "default_path": self.default_path}
+
+    def to_dict(self) -> dict:
+        """
+        This function serializes the snapshot including the results, which can take a while for large results.
+
+        Returns
+        -------
+        dict
+            project data like the one of the JSON project files
+        """
+        return {
+            "filename": self.filename,
+            "names": [scenario.name for scenario in self.scenarios],
+            "version": self.version,
+            "values": [scenario.values for scenario in self.scenarios],
+            "results": [None if scenario.results is None else scenario.results.to_dict() for scenario in self.scenarios],
+            "statistics": [None if scenario.statistics is None else scenario.statistics.to_dict() for scenario in self.scenarios],
+            "default_path": self.default_path,
+        }
+
+
+class SnapshotCreator:
+    """
+    class which takes the snapshots of the project. The values of a DataStorage are only converted to a dictionary
+    again if the DataStorage has been replaced or its debug message has changed.
+    """
+
+    def __init__(self):
+        self._values: dict[int, tuple[DataStorage, str, dict]] = {}
+
+    def take(self, names: list[str], list_ds: list[DataStorage], filename: tuple[str, str], default_path: str) -> ProjectSnapshot:
+        """
+        This function takes a snapshot of the scenarios. It has to be called on the GUI thread.
+
+        Parameters
+        ----------
+        names : list[str]
+            names of the scenarios
+        list_ds : list[DataStorage]
+            DataStorages of the scenarios
+        filename : tuple[str, str]
+            filename of the project
+        default_path : str
+            default path of the project
+
+        Returns
+        -------
+        ProjectSnapshot
+        """
+        values: dict[int, tuple[DataStorage, str, dict]] = {}
+        scenarios = []
+        for name, d_s in zip(names, list_ds):
+            cached = self._values.get(id(d_s))
+            if cached is None or cached[0] is not d_s or cached[1] != d_s.debug_message:
+                cached = (d_s, d_s.debug_message, d_s.to_dict())
+            values[id(d_s)] = cached
+            scenarios.append(ScenarioSnapshot(name, cached[2], d_s.results, d_s.run_statistics))
+        self._values = values
+        return ProjectSnapshot(filename, globs.VERSION, default_path, tuple(scenarios))
+
+
+def json_default(value: object) -> object:
+    """
+    This function converts the NumPy values, which can not be stored in JSON directly, to lists and Python scalars.
+
+    Parameters
+    ----------
+    value : object
+        value which is not JSON serializable
+
+    Returns
+    -------
+    object
+        JSON serializable value
+
+    Raises
+    ------
+    TypeError
+        if the value is not a NumPy value
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_atomic(location: Path, write: Callable[[Path], None]) -> None:
+    """
+    This function writes the file in a temporary file next to it, which then replaces the file.
+    This way, the file is never left half-written if the writing is interrupted. Every write uses its own temporary file,
+    so several writers of the same file (e.g. the GUI and the batch calculation) do not write into each other's file.
+
+    Parameters
+    ----------
+    location : Path
+        file to be written
+    write : Callable[[Path], None]
+        function which writes the file at the given path
+
+    Returns
+    -------
+    None
+    """
+    handle, name = tempfile.mkstemp(suffix=".tmp", prefix=f"{location.name}.", dir=location.parent)
+    os.close(handle)
+    temporary = Path(name)
+    try:
+        write(temporary)
+        os.replace(temporary, location)
+    finally:
+        if temporary.exists():  # pragma: no cover
+            temporary.unlink()
@@ -0,0 +1,204 @@
+"""
+This document contains the on-disk cache of the calculated results, so scenarios which have been calculated in a
+previous session do not have to be calculated again.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import ScenarioGUI.global_settings as globs
+
+from .gui_project_snapshot import json_default
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .gui_data_storage import DataStorage
+
+
+class ResultCache:
+    """
+    class of a folder with the to_dict payloads of the calculated results.
+    The entries are keyed by the fingerprint of the DataStorage, the version of the GUI and the version of the model,
+    and the least recently used entries are removed if the folder exceeds its maximal size. The size of the folder is
+    tracked, so the folder is only scanned again if the maximal size is exceeded.
+    """
+
+    def __init__(self, folder: Path, model_version: str = "", max_size: int = 100_000_000):
+        """
+        This function initialises the result cache.
+
+        Parameters
+        ----------
+        folder : Path
+            folder of the cache files
+        model_version : str
+            version of the calculation model. If the model is changed, the version should be changed as well,
+            so the previous results are not used anymore.
+        max_size : int
+            maximal size of the cache folder in bytes
+        """
+        self.folder = folder
+        self.model_version = model_version
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        os.makedirs(self.folder, exist_ok=True)
+        self.size: int = sum(entry.stat().st_size for entry in os.scandir(self.folder) if entry.name.endswith(".json"))
+
+    def file(self, d_s: DataStorage) -> Path:
+        """
+        This function returns the cache file of the DataStorage.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage
+
+        Returns
+        -------
+        Path
+            cache file
+        """
+        key = hashlib.sha256(f"{d_s.fingerprint()}{globs.VERSION}{self.model_version}".encode()).hexdigest()
+        return self.folder.joinpath(f"{key}.json")
+
+    def get(self, d_s: DataStorage) -> dict | None:
+        """
+        This function returns the cached results of the DataStorage.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage to get the results for
+
+        Returns
+        -------
+        dict | None
+            to_dict payload of the results or None if no results are cached
+        """
+        file = self.lookup(d_s)
+        return None if file is None else self.read(file)
+
+    def lookup(self, d_s: DataStorage) -> Path | None:
+        """
+        This function returns the cache file of the DataStorage if it exists, without reading it.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage to get the results for
+
+        Returns
+        -------
+        Path | None
+            cache file or None if no results are cached
+        """
+        file = self.file(d_s)
+        try:
+            # mark the entry as recently used
+            os.utime(file)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return file
+
+    @staticmethod
+    def read(file: Path) -> dict | None:
+        """
+        This function reads the cached results of the cache file.
+
+        Parameters
+        ----------
+        file : Path
+            cache file
+
+        Returns
+        -------
+        dict | None
+            to_dict payload of the results or None if the file can not be read (e.g. because it has been removed)
+        """
+        try:
+            with open(file) as f:
+                return load(f)
+        except (OSError, JSONDecodeError):
+            return None
+
+    def put(self, d_s: DataStorage) -> None:
+        """
+        This function stores the results of the DataStorage and removes the least recently used entries if the
+        cache is too big.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            calculated DataStorage
+
+        Returns
+        -------
+        None
+        """
+        self.write(self.file(d_s), d_s.results)
+
+    def write(self, file: Path, results: object | None) -> None:
+        """
+        This function writes the results to the cache file and removes the least recently used entries if the cache is
+        too big. It can be called in a background thread with the file taken on the GUI thread.
+
+        Parameters
+        ----------
+        file : Path
+            cache file of the DataStorage
+        results : object | None
+            results object
+
+        Returns
+        -------
+        None
+        """
+        if results is None:
+            return
+        size_old = file.stat().st_size if file.exists() else 0
+        try:
+            with open(file.with_suffix(".tmp"), "w") as f:
+                dump(results.to_dict(), f, default=json_default)  # type: ignore
+            size = file.with_suffix(".tmp").stat().st_size
+            os.replace(file.with_suffix(".tmp"), file)
+        except (OSError, TypeError, ValueError) as err:
+            globs.LOGGER.warning(f"results could not be cached: {err}")
+            return
+        self.size += size - size_old
+        self.evict() if self.size > self.max_size else None
+
+    def evict(self) -> None:
+        """
+        This function removes the least recently used entries until the cache is smaller than its maximal size.
+
+        Returns
+        -------
+        None
+        """
+        entries = [(stat.st_mtime, stat.st_size, entry) for entry in os.scandir(self.folder) if entry.name.endswith(".json") for stat in [entry.stat()]]
+        self.size = sum(entry[1] for entry in entries)
+        for _, entry_size, entry in sorted(entries, key=lambda entry: entry[0]):
+            if self.size <= self.max_size:
+                return
+            os.remove(entry.path)
+            self.size -= entry_size
+
+    def clear(self) -> None:
+        """
+        This function removes all entries of the cache.
+
+        Returns
+        -------
+        None
+        """
+        _ = [os.remove(entry.path) for entry in os.scandir(self.folder) if entry.name.endswith(".json")]  # type: ignore
+        self.size = 0
+
+    def __str__(self) -> str:
+        return f"Result cache: {self.hits} hits, {self.misses} misses"
@@ -0,0 +1,161 @@
+"""
+This document contains the memo of the calculated results, so scenarios with the same inputs (e.g. duplicated or only
+renamed scenarios) are only calculated once.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import PySide6.QtWidgets as QtW
+
+    from .gui_calculation_thread import CalcProblem
+    from .gui_data_storage import DataStorage
+
+
+class ResultMemo:
+    """
+    class with a table of the calculated results and the running calculations, both keyed by the fingerprint of the
+    DataStorage. Scenarios with the fingerprint of a running calculation are attached to it and receive its results
+    as soon as it is finished. Only the most recently used results are kept, so the results of deleted or changed
+    scenarios do not stay in memory for the whole session.
+    """
+
+    def __init__(self, max_results: int | None = 100) -> None:
+        """
+        This function initialises the memo.
+
+        Parameters
+        ----------
+        max_results : int | None
+            maximal number of results in the memo (None for no limit)
+        """
+        self.max_results = max_results
+        self.results: OrderedDict[str, object] = OrderedDict()
+        self.running: dict[str, CalcProblem] = {}
+        self.followers: dict[CalcProblem, list[tuple[DataStorage, QtW.QListWidgetItem]]] = {}
+
+    def add(self, d_s: DataStorage) -> None:
+        """
+        This function adds the results of a calculated DataStorage to the memo and removes the least recently used
+        results if there are more than max_results.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            calculated DataStorage
+
+        Returns
+        -------
+        None
+        """
+        if d_s.results is None:
+            return
+        fingerprint = d_s.fingerprint()
+        self.results[fingerprint] = d_s.results
+        self.results.move_to_end(fingerprint)
+        while self.max_results is not None and len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def lookup(self, d_s: DataStorage) -> bool:
+        """
+        This function sets the results of an already calculated scenario with the same inputs to the DataStorage.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage without results
+
+        Returns
+        -------
+        bool
+            True if the results are found
+        """
+        fingerprint = d_s.fingerprint()
+        results = self.results.get(fingerprint)
+        if results is None:
+            return False
+        self.results.move_to_end(fingerprint)
+        d_s.results = results
+        d_s.debug_message = ""
+        return True
+
+    def attach(self, d_s: DataStorage, item: QtW.QListWidgetItem) -> bool:
+        """
+        This function attaches the DataStorage to a running calculation with the same inputs.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage without results
+        item : QtW.QListWidgetItem
+            list widget item of the scenario
+
+        Returns
+        -------
+        bool
+            True if a running calculation with the same inputs is found
+        """
+        thread = self.running.get(d_s.fingerprint())
+        if thread is None:
+            return False
+        self.followers[thread].append((d_s, item))
+        return True
+
+    def start(self, thread: CalcProblem) -> None:
+        """
+        This function registers a new calculation, so other scenarios with the same inputs can attach to it.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            calculation thread
+
+        Returns
+        -------
+        None
+        """
+        self.running[thread.d_s.fingerprint()] = thread
+        self.followers[thread] = []
+
+    def finish(self, thread: CalcProblem) -> list[QtW.QListWidgetItem]:
+        """
+        This function stores the results of a finished calculation and passes them (or the error) to the
+        attached scenarios.
+
+        Parameters
+        ----------
+        thread : CalcProblem
+            finished calculation thread
+
+        Returns
+        -------
+        list[QtW.QListWidgetItem]
+            list widget items of the attached scenarios
+        """
+        followers = self.followers.pop(thread, [])
+        fingerprint = thread.d_s.fingerprint()
+        if self.running.get(fingerprint) is thread:
+            del self.running[fingerprint]
+        self.add(thread.d_s)
+        items = []
+        for d_s, item in followers:
+            # skip scenarios which have been changed in the meantime
+            if item.data(thread.role) is not d_s:
+                continue
+            d_s.results = thread.d_s.results
+            d_s.debug_message = thread.d_s.debug_message
+            item.setData(thread.role, d_s)
+            items.append(item)
+        return items
+
+    def clear(self) -> None:
+        """
+        This function removes all the calculated results from the memo.
+
+        Returns
+        -------
+        None
+        """
+        self.results.clear()
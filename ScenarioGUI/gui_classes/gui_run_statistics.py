@@ -0,0 +1,285 @@
+"""
+This document contains the run statistics of the calculations (wall time, CPU time and peak memory), the profiler
+which measures them and the dialog to compare them between the scenarios.
+"""
+from __future__ import annotations
+
+import math
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import PySide6.QtCore as QtC
+import PySide6.QtWidgets as QtW
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # the resource module is not available on Windows
+    resource = None  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .gui_data_storage import DataStorage
+    from .translation_class import Translations
+
+
+def reset_peak_rss() -> None:
+    """
+    This function resets the peak resident set size of the process to the current one, which is only possible on Linux.
+    On the other platforms, the peak resident set size is the one since the start of the process.
+
+    Returns
+    -------
+    None
+    """
+    if not sys.platform.startswith("linux"):  # pragma: no cover
+        return
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:  # pragma: no cover
+        return
+
+
+def peak_rss() -> int | None:
+    """
+    This function returns the peak resident set size of the process. Unlike the memory traced with tracemalloc,
+    it contains the memory which C extensions and native libraries allocate directly as well.
+
+    Returns
+    -------
+    int | None
+        peak resident set size in bytes (None if it can not be measured, e.g. on Windows without psutil)
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on the other platforms
+        return peak if sys.platform == "darwin" else peak * 1024
+    try:  # pragma: no cover
+        import psutil
+    except ImportError:  # pragma: no cover
+        return None
+    return getattr(psutil.Process().memory_info(), "peak_wset", None)  # pragma: no cover
+
+
+class RunStatistics:
+    """
+    class with the statistics of the run which calculated a scenario
+    """
+
+    def __init__(self, wall_time: float, cpu_time: float | None = None, peak_memory: int | None = None, scenarios: int = 1, peak_rss: int | None = None):
+        """
+        This function initialises the run statistics.
+
+        Parameters
+        ----------
+        wall_time : float
+            elapsed time of the calculation in seconds
+        cpu_time : float | None
+            CPU time of the calculation in seconds (None if it is unknown, e.g. if the calculation exceeded the time out)
+        peak_memory : int | None
+            peak memory allocated by Python objects of the calculation in bytes (None if the memory is not traced)
+        scenarios : int
+            number of scenarios which have been calculated in the same run (e.g. in a batch calculation)
+        peak_rss : int | None
+            peak resident set size of the process of the calculation in bytes, which contains the memory allocated
+            directly by C extensions and native libraries as well (None if the memory is not traced)
+        """
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.peak_memory = peak_memory
+        self.scenarios = scenarios
+        self.peak_rss = peak_rss
+
+    @property
+    def cpu_usage(self) -> float | None:
+        """CPU time divided by the wall time (above 1 if the calculation uses several cores)"""
+        if self.cpu_time is None or self.wall_time <= 0:
+            return None
+        return self.cpu_time / self.wall_time
+
+    def to_dict(self) -> dict:
+        """
+        Creates a dictionary from the class to be again imported later.
+
+        Returns
+        -------
+        dict
+            Dictionary with the values of the class
+        """
+        return {
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "scenarios": self.scenarios,
+            "peak_rss": self.peak_rss,
+        }
+
+    @staticmethod
+    def from_dict(dictionary: dict) -> RunStatistics:
+        """
+        Creates the run statistics from a dictionary created by the to_dict function.
+
+        Parameters
+        ----------
+        dictionary : dict
+            Dictionary with the values of the class
+
+        Returns
+        -------
+        RunStatistics
+        """
+        return RunStatistics(**dictionary)
+
+    def __repr__(self) -> str:
+        return (
+            f"RunStatistics(wall_time={self.wall_time}, cpu_time={self.cpu_time}, peak_memory={self.peak_memory}, scenarios={self.scenarios}, "
+            f"peak_rss={self.peak_rss})"
+        )
+
+
+class RunProfiler:
+    """
+    context manager which measures the run statistics of the code inside it.
+    The CPU time of a thread only contains the time of that thread, the one of a process the time of all its threads.
+    The peak memory is traced with tracemalloc, which slows down the allocations, so it should only be used in a
+    process which calculates a single scenario at a time (e.g. a worker process). Since tracemalloc does not trace the
+    memory which C extensions allocate directly, the peak resident set size of the process is measured as well.
+    """
+
+    def __init__(self, trace_memory: bool = False, thread: bool = False, scenarios: int = 1):
+        """
+        This function initialises the profiler.
+
+        Parameters
+        ----------
+        trace_memory : bool
+            True if the peak memory should be traced
+        thread : bool
+            True if only the CPU time of the current thread should be measured
+        scenarios : int
+            number of scenarios which are calculated in the run
+        """
+        self.trace_memory = trace_memory
+        self.thread = thread
+        self.scenarios = scenarios
+        self.statistics: RunStatistics | None = None
+        self._start_wall: float = 0.0
+        self._start_cpu: float = 0.0
+        self._stop_tracing: bool = False
+
+    def _cpu_time(self) -> float:
+        return time.thread_time() if self.thread else time.process_time()
+
+    def __enter__(self) -> RunProfiler:
+        if self.trace_memory:
+            self._stop_tracing = not tracemalloc.is_tracing()
+            tracemalloc.start() if self._stop_tracing else tracemalloc.reset_peak()
+            reset_peak_rss()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = self._cpu_time()
+        return self
+
+    def __exit__(self, *args) -> None:
+        wall_time = time.perf_counter() - self._start_wall
+        cpu_time = self._cpu_time() - self._start_cpu
+        peak_memory = rss = None
+        if self.trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop() if self._stop_tracing else None
+            rss = peak_rss()
+        self.statistics = RunStatistics(wall_time, cpu_time, peak_memory, self.scenarios, rss)
+
+
+class NumberItem(QtW.QTableWidgetItem):
+    """
+    table item which is sorted by its number instead of its text. Items without a number are sorted first.
+    """
+
+    def __init__(self, value: float | None, text: str):
+        super().__init__(text)
+        self.value = -math.inf if value is None else value
+
+    def __lt__(self, other: QtW.QTableWidgetItem) -> bool:
+        if isinstance(other, NumberItem):
+            return self.value < other.value
+        return super().__lt__(other)  # pragma: no cover
+
+
+class RunStatisticsDialog(QtW.QDialog):
+    """
+    class of the dialog with a sortable table of the run statistics of all scenarios
+    """
+
+    def __init__(self, names: list[str], data_storages: list[DataStorage], translations: Translations, language: int, parent: QtW.QWidget | None = None):
+        """
+        This function creates the dialog.
+
+        Parameters
+        ----------
+        names : list[str]
+            names of the scenarios
+        data_storages : list[DataStorage]
+            DataStorages of the scenarios
+        translations : Translations
+            translations of the GUI
+        language : int
+            index of the current language
+        parent : QtW.QWidget | None
+            parent widget
+        """
+        super().__init__(parent)
+        layout = QtW.QVBoxLayout(self)
+        self.table = QtW.QTableWidget(0, len(translations.label_run_statistics_columns[language].split(",")), self)
+        self.table.setEditTriggers(QtW.QAbstractItemView.NoEditTriggers)  # type: ignore
+        layout.addWidget(self.table)
+        self.translate(translations, language)
+        self.update_table(names, data_storages)
+
+    def translate(self, translations: Translations, language: int) -> None:
+        """
+        This function sets the title and the column headers of the dialog in the language.
+
+        Parameters
+        ----------
+        translations : Translations
+            translations of the GUI
+        language : int
+            index of the language
+
+        Returns
+        -------
+        None
+        """
+        self.setWindowTitle(translations.action_run_statistics[language])
+        self.table.setHorizontalHeaderLabels(translations.label_run_statistics_columns[language].split(","))
+
+    def update_table(self, names: list[str], data_storages: list[DataStorage]) -> None:
+        """
+        This function fills the table with the run statistics of the scenarios. Scenarios without statistics
+        (e.g. not calculated or with results of another scenario) are skipped.
+
+        Parameters
+        ----------
+        names : list[str]
+            names of the scenarios
+        data_storages : list[DataStorage]
+            DataStorages of the scenarios
+
+        Returns
+        -------
+        None
+        """
+        rows = [(name, d_s.run_statistics) for name, d_s in zip(names, data_storages) if d_s.run_statistics is not None]
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, (name, statistics) in enumerate(rows):
+            peak_memory, rss = (None if memory is None else memory / 1_000_000 for memory in (statistics.peak_memory, statistics.peak_rss))
+            values = (statistics.wall_time, statistics.cpu_time, statistics.cpu_usage, peak_memory, rss)
+            self.table.setItem(row, 0, QtW.QTableWidgetItem(name))
+            for column, value in enumerate(values, start=1):
+                self.table.setItem(row, column, NumberItem(value, "" if value is None else f"{value:.3f}"))
+            self.table.setItem(row, 6, NumberItem(statistics.scenarios, f"{statistics.scenarios}"))
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
@@ -0,0 +1,159 @@
+"""
+This document contains the transfer of large NumPy arrays from the worker processes to the GUI without copying them
+through the pipe. The arrays are written to memory-mapped temporary files by the worker and mapped (copy-on-write)
+by the GUI, so only the small rest of the results is pickled. The names of the files contain the id of the worker
+process, so the files which are never read by the GUI (e.g. because of a time out) can be removed with the worker.
+"""
+from __future__ import annotations
+
+import glob
+import io
+import os
+import pickle
+import tempfile
+import weakref
+
+import numpy as np
+
+PREFIX: str = "scenariogui_"
+
+
+def remove_file(path: str) -> None:
+    """
+    This function removes a file and ignores it if the file is already removed or still in use.
+
+    Parameters
+    ----------
+    path : str
+        path of the file
+
+    Returns
+    -------
+    None
+    """
+    try:
+        os.remove(path)
+    except OSError:  # pragma: no cover
+        return
+
+
+def remove_files(pid: int) -> None:
+    """
+    This function removes the leftover memory-mapped files of a (finished) process.
+
+    Parameters
+    ----------
+    pid : int
+        id of the process which has written the files
+
+    Returns
+    -------
+    None
+    """
+    _ = [remove_file(path) for path in glob.glob(os.path.join(tempfile.gettempdir(), f"{PREFIX}{pid}_*.npy"))]  # type: ignore
+
+
+class ArrayPickler(pickle.Pickler):
+    """
+    class to pickle objects and to write the large NumPy arrays within them to memory-mapped files instead
+    """
+
+    def __init__(self, file: io.BytesIO, threshold: int):
+        """
+        This function initialises the pickler.
+
+        Parameters
+        ----------
+        file : io.BytesIO
+            file to pickle to
+        threshold : int
+            minimal size in bytes of an array to be written to a memory-mapped file
+        """
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.threshold = threshold
+        self.paths: list[str] = []
+
+    def persistent_id(self, obj: object) -> tuple[str, str] | None:
+        # subclasses (e.g. masked arrays) would lose their extra information, so only plain arrays are shared
+        if type(obj) not in (np.ndarray, np.memmap) or obj.nbytes < self.threshold or obj.dtype.hasobject:  # type: ignore
+            return None
+        with tempfile.NamedTemporaryFile(prefix=f"{PREFIX}{os.getpid()}_", suffix=".npy", delete=False) as file:
+            self.paths.append(file.name)
+            np.save(file, obj, allow_pickle=False)
+        return "ndarray", file.name
+
+
+class ArrayUnpickler(pickle.Unpickler):
+    """
+    class to unpickle objects pickled by the ArrayPickler and to map their arrays from the memory-mapped files
+    """
+
+    def persistent_load(self, pid: tuple[str, str]) -> np.ndarray:
+        _, path = pid
+        return attach_array(path)
+
+
+def attach_array(path: str) -> np.ndarray:
+    """
+    This function maps the array of the file copy-on-write into memory.
+    The file is removed directly if the operating system allows it (the mapping stays valid) and otherwise as soon
+    as the array is deleted.
+
+    Parameters
+    ----------
+    path : str
+        path of the .npy file
+
+    Returns
+    -------
+    np.ndarray
+        memory-mapped array
+    """
+    array = np.load(path, mmap_mode="c")
+    try:
+        os.remove(path)
+    except OSError:  # pragma: no cover
+        weakref.finalize(array, remove_file, path)
+    return array
+
+
+def dumps(obj: object, threshold: int) -> bytes:
+    """
+    This function pickles the object and writes all the NumPy arrays larger than the threshold to memory-mapped files.
+
+    Parameters
+    ----------
+    obj : object
+        object to be pickled
+    threshold : int
+        minimal size in bytes of an array to be written to a memory-mapped file
+
+    Returns
+    -------
+    bytes
+        pickled object without the large arrays
+    """
+    file = io.BytesIO()
+    pickler = ArrayPickler(file, threshold)
+    try:
+        pickler.dump(obj)
+    except Exception:
+        _ = [remove_file(path) for path in pickler.paths]  # type: ignore
+        raise
+    return file.getvalue()
+
+
+def loads(data: bytes) -> object:
+    """
+    This function unpickles an object created by the dumps function.
+
+    Parameters
+    ----------
+    data : bytes
+        pickled object
+
+    Returns
+    -------
+    object
+    """
+    return ArrayUnpickler(io.BytesIO(data)).load()
@@ -28,9 +28,9 @@ from ScenarioGUI.gui_classes.gui_structure_classes import (
     ResultFigure,
     ResultText,
 )
+from ScenarioGUI.gui_classes.gui_structure_classes.font_index import FONT_INDEX
 from ScenarioGUI.gui_classes.gui_structure_classes.font_list_box import FontListBox
 from ScenarioGUI.gui_classes.gui_structure_classes.functions import check_conditional_visibility
-from ScenarioGUI.gui_classes.gui_structure_classes.result_figure import font_list, get_name
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -256,8 +256,8 @@ class GuiStructure:
         self.option_font = FontListBox(
             label=self.translations.option_font if hasattr(self.translations, "option_font") else "Font family: ",
             category=self.category_default_figure_settings,
-            entries=[get_name(font) for font in font_list],
-            default_index=[get_name(font).upper() for font in font_list].index(globs.FONT.upper()),
+            entries=lambda: FONT_INDEX.names,
+            default_index=lambda: FONT_INDEX.index(globs.FONT),
         )
         self.option_figure_background.change_event(self.change_figure_background_color)
         self.option_plot_background.change_event(self.change_plot_background_color)
@@ -297,9 +297,11 @@ class GuiStructure:
                 ],
             ):
                 option.label_text = getattr(self.translations, name) if hasattr(self.translations, name) else option.label_text
+                option.set_text(option.label_text[0])
             fig.option_save_layout.button_text = (
                 self.translations.option_save_layout if hasattr(self.translations, "option_save_layout") else fig.option_save_layout.button_text
             )
+            fig.option_save_layout.set_text(f"  {fig.option_save_layout.button_text[0]}  ")
 
     def create_lists(self):
         """
@@ -336,6 +338,33 @@ class GuiStructure:
         ]
         self.set_figure_translations()
 
+    def results_depend_on(self, option: Option) -> bool:
+        """
+        This function checks if the results of the selected aim depend on the value of the option.
+        If the option has no dependent aims set, but it is only shown for some aims (directly or by its category),
+        the results of these aims depend on it, otherwise the results of all aims do.
+
+        Parameters
+        ----------
+        option : Option
+            option which has been changed
+
+        Returns
+        -------
+        bool
+            True if the results have to be removed
+        """
+        aims = option.dependent_aims
+        if aims is None:
+            aims = [
+                aim
+                for aim, _ in self.list_of_aims
+                if any(element is option or (isinstance(element, Category) and option in element.list_of_options) for element in aim.list_options)
+            ]
+            if not aims:
+                return True
+        return any(aim.is_checked() for aim in aims)
+
     def change_font_size_2(self, size: int) -> None:
         """
         changes the font size to the size value
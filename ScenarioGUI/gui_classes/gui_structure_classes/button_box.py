@@ -60,20 +60,11 @@ class ButtonBox(Option):
         """
         super().__init__(label, default_index, category)
         self.entries: list[str] = entries
-        self.widget: list[QtW.QPushButton] = [QtW.QPushButton(self.default_parent) for _ in self.entries]
-        for idx, button in enumerate(self.widget):
-            default_value = self.default_value if idx != self.default_value else idx - 1 if idx > 0 else 1
-            button.clicked.connect(
-                ft_partial(
-                    self.update_function,
-                    *(
-                        button,
-                        self.widget[default_value],
-                        [but for but in self.widget if but not in [button, self.widget[default_value]]],
-                    ),
-                )
-            )
-            button.toggled.connect(ft_partial(check, self.linked_options, self, self.get_value()))
+        self.widget: list[QtW.QPushButton] | None = None
+        # checked index, button texts and enabled entries until the buttons are created
+        self._value: int = default_index if 0 <= default_index < len(entries) else -1
+        self._texts: list[str] = list(entries)
+        self._entries_enabled: list[bool] = [True for _ in entries]
 
     def get_value(self) -> int:
         """
@@ -84,6 +75,8 @@ class ButtonBox(Option):
         int
             Value of the ButtonBox
         """
+        if self.widget is None:
+            return self._value
         for idx, button in enumerate(self.widget):
             if button.isChecked():
                 return idx
@@ -102,6 +95,13 @@ class ButtonBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            # same as clicking on an enabled, not checked button
+            if value != self._value and self._entries_enabled[value]:
+                self._value = value
+                check(self.linked_options, self, value)
+                self.valueChanged.emit()
+            return
         button = self.widget[value]
         if not button.isChecked():
             button.click()
@@ -115,6 +115,8 @@ class ButtonBox(Option):
         bool
             True if at least one button is checked. False otherwise
         """
+        if self.widget is None:
+            return self._value >= 0
         return any(button.isChecked() for button in self.widget)
 
     def add_link_2_show(self, option: Option | Category | FunctionButton | Hint, on_index: int):
@@ -143,6 +145,17 @@ class ButtonBox(Option):
         self.linked_options.append([option, on_index])
         check_conditional_visibility(option)
 
+    def init_links(self) -> None:
+        """
+        This function shows or hides the linked options for the current value and initiates the links.
+
+        Returns
+        -------
+        None
+        """
+        check(self.linked_options, self, self.get_value())
+        super().init_links()
+
     def is_hidden(self) -> bool:
         """
         This function returns a boolean value related to whether or not the option is hidden.
@@ -152,6 +165,8 @@ class ButtonBox(Option):
         Bool
             True if the option is hidden
         """
+        if self.widget is None:
+            return super().is_hidden() or not any(self._entries_enabled)
         return super().is_hidden() or np.all([button.isHidden() for button in self.widget])
 
     def set_text(self, name: str) -> None:
@@ -169,9 +184,10 @@ class ButtonBox(Option):
         None
         """
         entry_name: list[str] = name.split(",")
-        self.label.setText(entry_name[0])
-        for button, button_name in zip(self.widget, entry_name[1:]):
-            button.setText(f" {button_name.replace('++', ',')} ")
+        super().set_text(entry_name[0])
+        for idx, button_name in enumerate(entry_name[1 : len(self._texts) + 1]):
+            self._texts[idx] = button_name.replace("++", ",")
+            self.widget[idx].setText(f" {self._texts[idx]} ") if self.widget is not None else None
 
     def check_linked_value(self, value: int, value_if_hidden: bool | None = None) -> bool:
         """
@@ -217,6 +233,17 @@ class ButtonBox(Option):
         idx: int
             index of entry which should be disabled
         """
+        if self.widget is None:
+            self._entries_enabled[idx] = False
+            if self._value == idx:
+                enabled = [index for index, entry_enabled in enumerate(self._entries_enabled) if entry_enabled]
+                self._value = self.default_value if self._entries_enabled[self.default_value] else enabled[0] if enabled else -1
+                check(self.linked_options, self, self._value)
+            if not any(self._entries_enabled):
+                self.hide()
+                # all buttons are invisible
+                self.visibilityChanged.emit()
+            return
         if self.widget[idx].isChecked():
             self.widget[idx].setChecked(False)
             self.widget[idx].setEnabled(False)
@@ -246,6 +273,15 @@ class ButtonBox(Option):
             index of entry which should be disabled
         """
         self.show()
+        if self.widget is None:
+            self._entries_enabled[idx] = True
+            if self._entries_enabled.count(True) == 1:
+                if self._value != idx:
+                    self._value = idx
+                    check(self.linked_options, self, idx)
+                # again visible
+                self.valueChanged.emit()
+            return
         self.widget[idx].setEnabled(True)
         self.widget[idx].show()
         if len([widget for widget in self.widget if widget.isEnabled()]) == 1:
@@ -253,6 +289,40 @@ class ButtonBox(Option):
             # again visible
             self.valueChanged.emit()
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the buttons of the ButtonBox in its frame with the stored texts, enabled entries and value.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = [QtW.QPushButton(self.frame) for _ in self.entries]
+        for idx, button in enumerate(self.widget):
+            default_value = self.default_value if idx != self.default_value else idx - 1 if idx > 0 else 1
+            button.clicked.connect(
+                ft_partial(
+                    self.update_function,
+                    *(
+                        button,
+                        self.widget[default_value],
+                        [but for but in self.widget if but not in [button, self.widget[default_value]]],
+                    ),
+                )
+            )
+            button.toggled.connect(ft_partial(check, self.linked_options, self, self.get_value()))
+        for idx, (text, entry_enabled, button) in enumerate(zip(self._texts, self._entries_enabled, self.widget)):
+            button.setText(f" {text} ")
+            button.setCheckable(True)
+            # the linked options are already shown or hidden for the current value
+            button.blockSignals(True)
+            button.setChecked(idx == self._value)
+            button.blockSignals(False)
+            if not entry_enabled:
+                button.setEnabled(False)
+                button.hide()
+            button.clicked.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -281,9 +351,7 @@ class ButtonBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        for idx, (entry, widget) in enumerate(zip(self.entries, self.widget)):
-            widget.setParent(self.frame)
-            widget.setText(f" {entry} ")
+        for widget in self.widget:
             widget.setStyleSheet(
                 f"QPushButton{'{'}border: 3px solid {globs.DARK};border-radius: 5px;gridline-color: {globs.LIGHT};"
                 f"background-color: {globs.GREY};font-weight:700;{'}'}"
@@ -293,10 +361,7 @@ class ButtonBox(Option):
                 f"gridline-color: {globs.GREY};background-color: {globs.GREY};{'}'}\n"
                 f"QPushButton:disabled:hover{'{'}background-color: {globs.DARK};{'}'}"
             )
-            widget.setCheckable(True)
-            widget.setChecked(idx == self.default_value)
             widget.setMinimumHeight(30)
-            widget.clicked.connect(self.valueChanged.emit)
             font = widget.font()
             font.setFamily(globs.FONT)
             font.setPointSize(globs.FONT_SIZE)
@@ -48,8 +48,11 @@ class Category:
         .. figure:: _static/Example_Category.PNG
         """
         self.label_text: list[str] = [label] if isinstance(label, str) else label
-        self.frame: QtW.QFrame = QtW.QFrame(self.default_parent)
-        self.label: QtW.QLabel = QtW.QLabel(self.frame)
+        self.frame: QtW.QFrame | None = None
+        self.label: QtW.QLabel | None = None
+        # label text and visibility until the frame is created
+        self._text: str = self.label_text[0]
+        self._hidden: bool = False
         self.list_of_options: list[Option | Hint | FunctionButton] = []
         self.graphic_left: QtW.QGraphicsView | bool | None = None
         self.graphic_right: QtW.QGraphicsView | bool | None = None
@@ -119,6 +122,19 @@ class Category:
         """
         self.grid_layout = column
 
+    def can_be_created_lazily(self) -> bool:
+        """
+        This function checks if the widget of the category can be created later than the widgets of the options are used.
+
+        Returns
+        -------
+        bool
+            True if all options in the category can be used before their widget is created
+        """
+        return all(
+            option.can_be_created_lazily() if isinstance(option, Category) else getattr(option, "lazy_creation", True) for option in self.list_of_options
+        )
+
     def set_text(self, name: str) -> None:
         """
         This function sets the text in the Category label.
@@ -132,7 +148,9 @@ class Category:
         -------
         None
         """
-        self.label.setText(name)
+        self._text = name
+        if self.label is not None:
+            self.label.setText(name)
 
     def create_widget(self, page: QtW.QWidget, layout: QtW.QLayout):
         """
@@ -151,8 +169,8 @@ class Category:
         -------
         None
         """
-        self.label.setParent(page)
-        self.label.setText(self.label_text[0])
+        self.label = QtW.QLabel(page)
+        self.label.setText(self._text)
         self.label.setStyleSheet(
             f"QLabel {'{'}border: 1px solid  {globs.LIGHT};border-top-left-radius: 15px;border-top-right-radius: 15px;"
             f"background-color:  {globs.LIGHT};padding: 5px 0px;\n"
@@ -161,7 +179,10 @@ class Category:
         self.label.setAlignment(QtC.Qt.AlignCenter | QtC.Qt.AlignVCenter)
         set_default_font(self.label, bold=True)
         layout.addWidget(self.label)
-        self.frame.setParent(page)
+        self.frame = QtW.QFrame(page)
+        if self._hidden:
+            self.frame.hide()
+            self.label.hide()
         self.frame.setStyleSheet(
             f"QFrame{'{'}border: 1px solid {globs.LIGHT};border-bottom-left-radius: 15px;border-bottom-right-radius: 15px;{'}'}\n"
             f"QLabel{'{'}border: 0px solid {globs.WHITE};{'}'}"
@@ -240,8 +261,10 @@ class Category:
         -------
         None
         """
-        self.frame.hide()
-        self.label.hide()
+        self._hidden = True
+        if self.frame is not None:
+            self.frame.hide()
+            self.label.hide()
         for option in [option for option in self.list_of_options if not isinstance(option, ResultText)]:
             # only hide the options that were not already hidden
             # this since otherwise there can be problems with options at the results page
@@ -263,8 +286,10 @@ class Category:
         -------
         None
         """
-        self.frame.show()
-        self.label.show()
+        self._hidden = False
+        if self.frame is not None:
+            self.frame.show()
+            self.label.show()
         for option in self.options_hidden:
             option.show()
         self.options_hidden = []
@@ -278,6 +303,8 @@ class Category:
         Bool
             True if the option is hidden
         """
+        if self.frame is None:
+            return self._hidden
         return self.frame.isHidden()
 
     def translate(self, idx: int) -> None:
@@ -307,7 +334,8 @@ class Category:
         -------
             None
         """
-        change_font_size(self.label, size)
+        if self.label is not None:
+            change_font_size(self.label, size)
 
     def __repr__(self):
         return f"{type(self).__name__}; Label: {self.label_text[0]}"
@@ -75,6 +75,8 @@ class FigureOption(ButtonBox):
         key_name, key_value : str, int
             Name of the variable and its value as an argument for the function in the Borefield Class that creates the figure.
         """
+        if self.widget is None:
+            return (self.param, self.entries_values[self._value]) if self._value >= 0 else ("", -1)
         for idx, button in enumerate(self.widget):
             if button.isChecked():
                 return self.param, self.entries_values[idx]
@@ -95,8 +97,7 @@ class FigureOption(ButtonBox):
         None
         """
         value = values[1]
-        for idx, button in enumerate(self.widget):
-            if self.entries_values[idx] == value:
-                if not button.isChecked():
-                    button.click()
+        for idx, entry_value in enumerate(self.entries_values):
+            if entry_value == value:
+                super().set_value(idx)
                 break
@@ -71,13 +71,14 @@ class FileNameBox(Option):
 
         """
         super().__init__(label, default_value, category)
-        self.widget: QtW.QLineEdit = QtW.QLineEdit(self.default_parent)
+        self.widget: QtW.QLineEdit | None = None
         self.dialog_text: str = dialog_text
         self.error_text: str = error_text
-        self.button: QtW.QPushButton = QtW.QPushButton(self.default_parent)
+        self.button: QtW.QPushButton | None = None
         self.file_extension = [file_extension] if isinstance(file_extension, str) else file_extension
         self.check_active: bool = False
-        self.widget.textChanged.connect(self.valueChanged.emit)
+        # filename until the widget is created
+        self._value: str = default_value
 
     def get_value(self) -> str:
         """
@@ -88,6 +89,8 @@ class FileNameBox(Option):
         str
             Filename (with path)
         """
+        if self.widget is None:
+            return self._value
         return self.widget.text()
 
     def set_value(self, value: str) -> None:
@@ -103,6 +106,11 @@ class FileNameBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            if value != self._value:
+                self._value = value
+                self.valueChanged.emit()
+            return
         self.widget.setText(value)
 
     def _check_value(self) -> bool:
@@ -114,7 +122,7 @@ class FileNameBox(Option):
         bool
             True if a value is given in the FileNameBox. False otherwise
         """
-        return exists(self.widget.text()) if self.check_active else True
+        return exists(self.get_value()) if self.check_active else True
 
     def add_link_2_show(
         self,
@@ -180,6 +188,20 @@ class FileNameBox(Option):
         """
         return partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the text box and the button of the FileNameBox in its frame with the stored filename.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = QtW.QLineEdit(self.frame)
+        self.widget.setText(self._value)
+        self.widget.textChanged.connect(self.valueChanged.emit)
+        self.button = QtW.QPushButton(self.frame)
+        self.button.clicked.connect(self.fun_choose_file)  # pylint: disable=E1101
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -208,22 +230,18 @@ class FileNameBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent, False)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f"QLineEdit{'{'}border: 3px solid {globs.LIGHT};border-radius: 5px;color: {globs.WHITE};gridline-color: {globs.LIGHT};"
             f"background-color: {globs.LIGHT};\n"
             f"selection-background-color: {globs.LIGHT_SELECT};{'}'}\n"
             f"QLineEdit:hover{'{'}background-color: {globs.DARK};{'}'}"
         )
-        self.widget.setText(self.default_value)
         set_default_font(self.widget)
         layout.addWidget(self.widget)
-        self.button.setParent(self.frame)
         self.button.setMinimumSize(QtC.QSize(30, 30))
         self.button.setMaximumSize(QtC.QSize(30, 30))
         self.button.setText("...")
         set_default_font(self.button)
-        self.button.clicked.connect(self.fun_choose_file)  # pylint: disable=E1101
         layout.addWidget(self.button)
 
     def set_font_size(self, size: int) -> None:
@@ -239,7 +257,8 @@ class FileNameBox(Option):
             None
         """
         super().set_font_size(size)
-        change_font_size(self.button, size)
+        if self.button is not None:
+            change_font_size(self.button, size)
 
     def fun_choose_file(self) -> None:
         """
@@ -30,6 +30,7 @@ class FlexibleAmount(Option):
     """
 
     COUNTER: int = 0
+    lazy_creation: bool = False
 
     def __init__(
         self,
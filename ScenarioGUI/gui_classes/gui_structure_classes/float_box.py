@@ -111,7 +111,9 @@ class FloatBox(Option):
         self.minimal_value: float = minimal_value
         self.maximal_value: float = maximal_value
         self.step: float = step
-        self.widget: DoubleSpinBox = DoubleSpinBox(self.default_parent, valueChanged=self.valueChanged.emit)
+        self.widget: DoubleSpinBox | None = None
+        # value until the widget is created
+        self._value: float = round(min(max(default_value, minimal_value), maximal_value), decimal_number)
 
     def get_value(self) -> float:
         """
@@ -122,6 +124,8 @@ class FloatBox(Option):
         float
             Value of the FloatBox
         """
+        if self.widget is None:
+            return self._value
         return self.widget.value()
 
     def set_value(self, value: float) -> None:
@@ -137,6 +141,12 @@ class FloatBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            value = round(min(max(value, self.minimal_value), self.maximal_value), self.decimal_number)
+            if value != self._value:
+                self._value = value
+                self.valueChanged.emit()
+            return
         check_and_set_max_min_values(self.widget, value, self.maximal_value, self.minimal_value)
         self.widget.setValue(value)
 
@@ -260,6 +270,22 @@ class FloatBox(Option):
         """
         return ft_partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the FloatBox widget in its frame with the stored value.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = DoubleSpinBox(self.frame)
+        self.widget.setMinimum(self.minimal_value)
+        self.widget.setMaximum(self.maximal_value)
+        self.widget.setDecimals(self.decimal_number)
+        self.widget.setValue(self._value)
+        self.widget.setSingleStep(self.step)
+        self.widget.valueChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -289,17 +315,11 @@ class FloatBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f'QDoubleSpinBox{"{"}selection-color: {globs.WHITE};selection-background-color: {globs.LIGHT};' f'border: 1px solid {globs.WHITE};{"}"}'
         )
         self.widget.setAlignment(QtC.Qt.AlignRight | QtC.Qt.AlignTrailing | QtC.Qt.AlignVCenter)
         self.widget.setProperty("showGroupSeparator", True)
-        self.widget.setMinimum(self.minimal_value)
-        self.widget.setMaximum(self.maximal_value)
-        self.widget.setDecimals(self.decimal_number)
-        self.widget.setValue(self.default_value)
-        self.widget.setSingleStep(self.step)
         self.widget.setFocusPolicy(QtC.Qt.FocusPolicy.StrongFocus)
         if self.limit_size:
             self.widget.setMaximumWidth(100)
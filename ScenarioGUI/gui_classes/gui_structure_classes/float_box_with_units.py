@@ -83,7 +83,10 @@ class FloatBoxWithUnits(FloatBox):
             decimal_number=decimal_number,
         )
         self.units: list[tuple[str, float]] = [] if units is None else units
-        self.unit_widget: ComboBox = ComboBox(self.default_parent, currentIndexChanged=self.valueChanged.emit)
+        self.unit_widget: ComboBox | None = None
+        # unit index until the widget is created
+        self._unit_index: int = 0
+        self._scale_decimals: bool = False
 
     def activate_scale_decimals(self) -> None:
         """
@@ -93,7 +96,9 @@ class FloatBoxWithUnits(FloatBox):
         -------
             None
         """
-        self.unit_widget.currentIndexChanged.connect(self._change_decimals)
+        self._scale_decimals = True
+        if self.unit_widget is not None:
+            self.unit_widget.currentIndexChanged.connect(self._change_decimals)
 
     def _change_decimals(self):
         unit = self.units[self.unit_widget.currentIndex()][1]
@@ -108,6 +113,8 @@ class FloatBoxWithUnits(FloatBox):
         tuple[float, int]
             Value of the IntBox multiplied with units value and unit box index
         """
+        if self.widget is None:
+            return self._value * self.units[self._unit_index][1], self._unit_index
         return self.widget.value() * self.units[self.unit_widget.currentIndex()][1], self.unit_widget.currentIndex()
 
     def set_value(self, value: tuple[float | int, int] | float | int) -> None:
@@ -123,6 +130,13 @@ class FloatBoxWithUnits(FloatBox):
         -------
         None
         """
+        if self.widget is None:
+            unit_index, value = (value[1], value[0] / self.units[value[1]][1]) if isinstance(value, (tuple, list)) else (0, value)
+            if unit_index != self._unit_index:
+                self._unit_index = unit_index
+                self.valueChanged.emit()
+            super().set_value(value)
+            return
         if not isinstance(value, (tuple, list)):
             self.unit_widget.setCurrentIndex(0)
             check_and_set_max_min_values(self.widget, value, self.maximal_value, self.minimal_value)
@@ -187,7 +201,8 @@ class FloatBoxWithUnits(FloatBox):
             new font size
         """
         super().set_font_size(size)
-        change_font_size(self.unit_widget, size, True)
+        if self.unit_widget is not None:
+            change_font_size(self.unit_widget, size, True)
 
     def check_linked_value(self, value: tuple[float | None, float | None], value_if_hidden: bool | None = None) -> bool:
         """
@@ -233,6 +248,23 @@ class FloatBoxWithUnits(FloatBox):
         """
         return partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the FloatBox widget and the unit widget in its frame with the stored value and unit.
+
+        Returns
+        -------
+        None
+        """
+        super()._init_widget()
+        self.unit_widget = ComboBox(self.frame)
+        self.unit_widget.addItems([name for name, _ in self.units])
+        self.unit_widget.setCurrentIndex(self._unit_index)
+        if self._scale_decimals:
+            self._change_decimals()
+            self.unit_widget.currentIndexChanged.connect(self._change_decimals)
+        self.unit_widget.currentIndexChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -262,9 +294,7 @@ class FloatBoxWithUnits(FloatBox):
         None
         """
         super().create_widget(frame, layout_parent, row=row, column=column)
-        self.unit_widget.setParent(self.frame)
         self.frame.layout().addWidget(self.unit_widget)
-        self.unit_widget.addItems([name for name, _ in self.units])
         self.unit_widget.setStyleSheet(
             f"QFrame {'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox{'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
@@ -0,0 +1,181 @@
+"""
+font index script, which contains the lazily created and cached list of the system fonts for the font options
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import matplotlib
+import matplotlib.font_manager as fm
+
+
+def get_name(font: fm.FontProperties) -> str:
+    """
+    get the name of the font and catch the MacOS runtime error
+
+    Parameters
+    ----------
+    font: fm.FontProperties
+        font to get name for
+    Returns
+    -------
+        str
+    """
+    try:
+        return font.get_name()
+    except RuntimeError:  # pragma: no cover
+        return "ZZ"
+
+
+class FontIndex:
+    """
+    class with the sorted list of the system fonts with unique names.
+    The list is only created when it is used for the first time. Since every font file has to be opened to get its name,
+    the paths and names are stored in a cache file, which is used as long as the font directories have not been changed.
+    """
+
+    CACHE_VERSION: int = 1
+
+    def __init__(self, cache_file: Path | None = None, directories: list[Path] | None = None):
+        """
+        This function initialises the font index.
+
+        Parameters
+        ----------
+        cache_file : Path | None
+            file to store the index in (default: scenario_gui_font_index.json in the cache folder of matplotlib)
+        directories : list[Path] | None
+            directories with the fonts (default: the font directories of the system)
+        """
+        self.cache_file: Path = Path(matplotlib.get_cachedir()).joinpath("scenario_gui_font_index.json") if cache_file is None else cache_file
+        self.directories = directories
+        self._fonts: list[tuple[str, str]] | None = None
+        self._font_properties: dict[int, fm.FontProperties] = {}
+
+    def font_directories(self) -> list[Path]:
+        """
+        This function returns the directories in which the fonts are searched.
+
+        Returns
+        -------
+        list[Path]
+            font directories
+        """
+        if self.directories is not None:
+            return self.directories
+        if sys.platform == "win32":  # pragma: no cover
+            return [Path(fm.win32FontDirectory()), *map(Path, fm.MSUserFontDirectories)]
+        if sys.platform == "darwin":  # pragma: no cover
+            return [*map(Path, fm.X11FontDirectories), *map(Path, fm.OSXFontDirectories)]
+        return list(map(Path, fm.X11FontDirectories))
+
+    def key(self) -> str:
+        """
+        This function creates the key of the font directories from the modification times of all their folders,
+        which change if a font is added or removed.
+
+        Returns
+        -------
+        str
+            hexadecimal sha256 hash
+        """
+        stamps = [matplotlib.__version__]
+        for directory in self.font_directories():
+            for folder, _, _ in os.walk(directory):
+                try:
+                    stamps.append(f"{folder}:{os.stat(folder).st_mtime_ns}")
+                except OSError:  # pragma: no cover
+                    continue
+        return hashlib.sha256("\n".join(stamps).encode()).hexdigest()
+
+    def _create(self) -> list[tuple[str, str]]:
+        paths = fm.findSystemFonts(None if self.directories is None else [f"{directory}" for directory in self.directories])
+        paths = sorted(paths, key=lambda font_path: font_path.upper().split("\\")[-1].replace(".TTF", ""))
+        fonts: dict[str, str] = {}
+        for font_path in paths:
+            fonts.setdefault(get_name(fm.FontProperties(fname=font_path)), font_path)
+        return [(font_path, name) for name, font_path in fonts.items()]
+
+    def _load(self) -> list[tuple[str, str]]:
+        key = self.key()
+        try:
+            with open(self.cache_file) as file:
+                data = json.load(file)
+            if data["version"] == self.CACHE_VERSION and data["key"] == key:
+                return [(font_path, name) for font_path, name in data["fonts"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        fonts = self._create()
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w") as file:
+                json.dump({"version": self.CACHE_VERSION, "key": key, "fonts": fonts}, file)
+        except OSError:  # pragma: no cover
+            pass
+        return fonts
+
+    @property
+    def fonts(self) -> list[tuple[str, str]]:
+        """paths and names of the fonts, which are loaded on the first access"""
+        if self._fonts is None:
+            self._fonts = self._load()
+        return self._fonts
+
+    @property
+    def names(self) -> list[str]:
+        """names of the fonts"""
+        return [name for _, name in self.fonts]
+
+    @property
+    def names_upper(self) -> list[str]:
+        """upper case names of the fonts"""
+        return [name.upper() for _, name in self.fonts]
+
+    def index(self, name: str) -> int:
+        """
+        This function returns the index of the font with the name (case-insensitive).
+
+        Parameters
+        ----------
+        name : str
+            name of the font
+
+        Returns
+        -------
+        int
+            index of the font
+
+        Raises
+        ------
+        ValueError
+            if the font is not found
+        """
+        return self.names_upper.index(name.upper())
+
+    def font(self, index: int) -> fm.FontProperties:
+        """
+        This function returns the font properties of the font with the index. They are created on the first request.
+
+        Parameters
+        ----------
+        index : int
+            index of the font
+
+        Returns
+        -------
+        fm.FontProperties
+            font properties
+        """
+        if index not in self._font_properties:
+            self._font_properties[index] = fm.FontProperties(fname=self.fonts[index][0], size=12)
+        return self._font_properties[index]
+
+    def __len__(self) -> int:
+        return len(self.fonts)
+
+
+FONT_INDEX = FontIndex()
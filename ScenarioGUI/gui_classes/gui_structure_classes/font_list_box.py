@@ -17,6 +17,8 @@ from .list_box import ListBox
 from .option import Option
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
     import PySide6.QtGui as QtG
 
     from .category import Category
@@ -38,17 +40,18 @@ class FontListBox(ListBox):
 
     LinkMatrix: list[int] | None = None
 
-    def __init__(self, label: str | list[str], default_index: int, entries: list[str], category: Category):
+    def __init__(self, label: str | list[str], default_index: int | Callable[[], int], entries: list[str] | Callable[[], list[str]], category: Category):
         """
 
         Parameters
         ----------
         label : List[str]
             The label of the ListBox
-        default_index : int
-            The default index of the ListBox
-        entries : List[str]
-            The list of all the different buttons in the ListBox
+        default_index : int | Callable[[], int]
+            The default index of the ListBox or a function to get it, which is only called when the index is used for the first time
+        entries : List[str] | Callable[[], list[str]]
+            The list of all the different buttons in the ListBox or a function to get it,
+            which is only called when the entries are used for the first time (e.g. to not search the system fonts on startup)
         category : Category
             Category in which the ButtonBox should be placed
 
@@ -58,22 +61,120 @@ class FontListBox(ListBox):
         >>>                       default_index=0,
         >>>                       entries=['Arial', 'Verdana'],
         >>>                       category=category_example)
+        >>> option_font = FontListBox(label="Font",
+        >>>                           default_index=lambda: FONT_INDEX.index(globs.FONT),
+        >>>                           entries=lambda: FONT_INDEX.names,
+        >>>                           category=category_example)
 
         Gives:
 
         .. figure:: _static/Example_FontListBox.PNG
 
         """
+        self._default_index: int | Callable[[], int] = default_index
+        self._entries: list[str] | Callable[[], list[str]] = entries
         Option.__init__(self, label, default_index, category)
-        self.entries: list[str] = entries
-        self.widget: FontComboBox = FontComboBox(self.default_parent)
-        self.widget.clear()
-        self.widget.addItems(self.entries)
-        self.widget.currentIndexChanged.connect(self.valueChanged.emit)
+        self.widget: FontComboBox | None = None
+        # items, index and insert policy until the widget is created, the items and the index are set on the first use
+        self._lazy_items: list[str] | None = None
+        self._lazy_value: int | None = None
+        self._insert_policy: QtW.QComboBox.InsertPolicy | None = None
         self._link_matrix: list[int] | None = None
 
+    @property
+    def default_value(self) -> int:
+        """default index, which is resolved on the first access"""
+        if callable(self._default_index):
+            self._default_index = self._default_index()
+        return self._default_index
+
+    @default_value.setter
+    def default_value(self, default_index: int | Callable[[], int]) -> None:
+        self._default_index = default_index
+
+    @property
+    def entries(self) -> list[str]:
+        """entries of the FontListBox, which are resolved on the first access"""
+        if callable(self._entries):
+            self._entries = self._entries()
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: list[str] | Callable[[], list[str]]) -> None:
+        self._entries = entries
+
+    @property
+    def _items(self) -> list[str]:
+        if self._lazy_items is None:
+            self._lazy_items = list(self.entries)
+        return self._lazy_items
+
+    @_items.setter
+    def _items(self, items: list[str]) -> None:
+        self._lazy_items = items
+
+    @property
+    def _value(self) -> int:
+        if self._lazy_value is None:
+            self._lazy_value = self.link_matrix().index(self.default_value)
+        return self._lazy_value
+
+    @_value.setter
+    def _value(self, value: int) -> None:
+        self._lazy_value = value
+
+    def is_resolved(self) -> bool:
+        """
+        This function checks whether the entries and the index of the FontListBox are already resolved.
+
+        Returns
+        -------
+        bool
+            True if the entries and the index are resolved
+        """
+        return self.widget is not None or self._lazy_value is not None
+
+    def set_text(self, name: str) -> None:
+        """
+        This function sets the text of the label and, if given, of the entries of the FontListBox.
+        The entries are only resolved if new names for them are given.
+
+        Parameters
+        ----------
+        name: str
+            String with the label name at position 0 and optionally the names of all the entries (in order).
+            These strings are separated by ","
+
+        Returns
+        -------
+        None
+        """
+        if "," not in name:
+            Option.set_text(self, name)
+            return
+        super().set_text(name)
+
     def link_matrix(self) -> list[int]:
-        return [[self.widget.itemText(index) for index in range(self.widget.count())].index(font) for font in self.entries]
+        items = self._items if self.widget is None else [self.widget.itemText(index) for index in range(self.widget.count())]
+        return [items.index(font) for font in self.entries]
+
+    def _init_widget(self) -> None:
+        """
+        This function creates the FontListBox widget in its frame with the stored items, index and insert policy.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = FontComboBox(self.frame)
+        self.widget.clear()
+        self.widget.addItems(self._items)
+        self.widget.setCurrentIndex(self._value)
+        if self._insert_policy is not None:
+            self.widget.setEditable(True)
+            self.widget.setInsertPolicy(self._insert_policy)
+        self.widget.currentIndexChanged.connect(self.valueChanged.emit)
+        self.widget.currentIndexChanged.connect(ft_partial(check, self.linked_options, self))  # pylint: disable=E1101
 
     def create_widget(
         self,
@@ -103,18 +204,15 @@ class FontListBox(ListBox):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f"QFrame {'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox{'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox QAbstractItemView::item:hover{'{'}color: {globs.WHITE};background-color: {globs.LIGHT_SELECT};{'}'}"
             f"QComboBox QAbstractItemView::item:selected{'{'}color: {globs.WHITE};background-color: {globs.LIGHT_SELECT};{'}'}"
         )
-        self.widget.setCurrentIndex(self.link_matrix().index(self.default_value))
         if self.limit_size:
             # self.widget.setMaximumWidth(100)
             self.widget.setMinimumWidth(100)
-        self.widget.currentIndexChanged.connect(ft_partial(check, self.linked_options, self))  # pylint: disable=E1101
         self.widget.setMinimumHeight(28)
         self.widget.setFocusPolicy(QtC.Qt.FocusPolicy.StrongFocus)
         set_default_font(self.widget)
@@ -11,7 +11,7 @@ import PySide6.QtWidgets as QtW  # type: ignore
 
 import ScenarioGUI.global_settings as globs
 
-from ...utils import change_font_size, set_default_font
+from ...utils import Signal, change_font_size, set_default_font
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
@@ -53,8 +53,12 @@ class FunctionButton:
         """
         self.button_text: list[str] = [button_text] if isinstance(button_text, str) else button_text
         self.icon: str = icon
-        self.frame: QtW.QFrame = QtW.QFrame(self.default_parent)
-        self.button: QtW.QPushButton = QtW.QPushButton(self.default_parent)
+        self.frame: QtW.QFrame | None = None
+        self.button: QtW.QPushButton | None = None
+        # text and visibility until the button is created
+        self._text: str = f"  {self.button_text[0]}  "
+        self._hidden: bool = False
+        self.clicked: Signal = Signal()
         category.list_of_options.append(self)
         self.conditional_visibility: bool = False
 
@@ -73,8 +77,9 @@ class FunctionButton:
         -------
         None
         """
-        self.button.setParent(frame)
-        self.button.setText(f"  {self.button_text[0]}  ")
+        self.button = QtW.QPushButton(frame)
+        self.button.setText(self._text)
+        self.button.clicked.connect(self.clicked.emit)
         icon = QtG.QIcon()
         # icon11.addPixmap(QtGui_QPixmap(icon), QtGui_QIcon.Normal, QtGui_QIcon.Off)
         icon.addFile(f"{globs.FOLDER}/icons/{self.icon}")
@@ -83,7 +88,8 @@ class FunctionButton:
         self.button.setMinimumWidth(100)
         self.button.setMinimumHeight(35)
         set_default_font(self.button)
-        self.frame.setParent(frame)
+        self.frame = QtW.QFrame(frame)
+        self.frame.hide() if self._hidden else None
         self.frame.setFrameShape(QtW.QFrame.StyledPanel)
         self.frame.setFrameShadow(QtW.QFrame.Raised)
         self.frame.setStyleSheet(f"QFrame{'{'}border: 0px solid {globs.WHITE};border-radius: 0px;{'}'}")
@@ -107,7 +113,9 @@ class FunctionButton:
         -------
         None
         """
-        self.frame.hide()
+        self._hidden = True
+        if self.frame is not None:
+            self.frame.hide()
 
     def show(self) -> None:
         """
@@ -117,7 +125,9 @@ class FunctionButton:
         -------
         None
         """
-        self.frame.show()
+        self._hidden = False
+        if self.frame is not None:
+            self.frame.show()
 
     def is_hidden(self) -> bool:
         """
@@ -128,6 +138,8 @@ class FunctionButton:
         Bool
             True if the option is hidden
         """
+        if self.frame is None:
+            return self._hidden
         return self.frame.isHidden()
 
     def set_text(self, name: str):
@@ -143,7 +155,9 @@ class FunctionButton:
         -------
         None
         """
-        self.button.setText(name)
+        self._text = name
+        if self.button is not None:
+            self.button.setText(name)
 
     def change_event(self, function_to_be_called: Callable, *args) -> None:
         """
@@ -160,7 +174,7 @@ class FunctionButton:
         -------
         None
         """
-        self.button.clicked.connect(lambda: function_to_be_called(*args))
+        self.clicked.connect(lambda: function_to_be_called(*args))
 
     def set_font_size(self, size: int) -> None:
         """
@@ -47,7 +47,10 @@ class Hint:
 
         """
         self.hint: list[str] = [hint] if isinstance(hint, str) else hint
-        self.label: QtW.QLabel = QtW.QLabel(self.default_parent)
+        self.label: QtW.QLabel | None = None
+        # text and visibility until the label is created
+        self._text: str = self.hint[0]
+        self._hidden: bool = False
         self.warning = warning
         category.list_of_options.append(self)
         self.conditional_visibility: bool = False
@@ -79,8 +82,9 @@ class Hint:
         -------
         None
         """
-        self.label.setParent(frame)
-        self.label.setText(self.hint[0])
+        self.label = QtW.QLabel(frame)
+        self.label.setText(self._text)
+        self.label.hide() if self._hidden else None
         if self.warning:
             self.label.setStyleSheet(f"color: {globs.WARNING};")
         set_default_font(self.label)
@@ -98,7 +102,9 @@ class Hint:
         -------
         None
         """
-        self.label.hide()
+        self._hidden = True
+        if self.label is not None:
+            self.label.hide()
 
     def show(self) -> None:
         """
@@ -108,7 +114,9 @@ class Hint:
         -------
         None
         """
-        self.label.show()
+        self._hidden = False
+        if self.label is not None:
+            self.label.show()
 
     def is_hidden(self) -> bool:
         """
@@ -119,6 +127,8 @@ class Hint:
         Bool
             True if the option is hidden
         """
+        if self.label is None:
+            return self._hidden
         return self.label.isHidden()
 
     def set_text(self, name: str):
@@ -134,7 +144,9 @@ class Hint:
         -------
         None
         """
-        self.label.setText(name)
+        self._text = name
+        if self.label is not None:
+            self.label.setText(name)
 
     def set_font_size(self, size: int) -> None:
         """
@@ -85,7 +85,9 @@ class IntBox(Option):
         self.minimal_value: int = minimal_value
         self.maximal_value: int = maximal_value
         self.step: int = step
-        self.widget: SpinBox = SpinBox(self.default_parent, valueChanged=self.valueChanged.emit)
+        self.widget: SpinBox | None = None
+        # value until the widget is created
+        self._value: int = min(max(default_value, minimal_value), maximal_value)
 
     def get_value(self) -> int:
         """
@@ -96,6 +98,8 @@ class IntBox(Option):
         int
             Value of the IntBox
         """
+        if self.widget is None:
+            return self._value
         return self.widget.value()
 
     def set_value(self, value: int) -> None:
@@ -111,6 +115,12 @@ class IntBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            value = int(min(max(value, self.minimal_value), self.maximal_value))
+            if value != self._value:
+                self._value = value
+                self.valueChanged.emit()
+            return
         check_and_set_max_min_values(self.widget, value, self.maximal_value, self.minimal_value)
         self.widget.setValue(value)
 
@@ -234,6 +244,21 @@ class IntBox(Option):
         """
         return ft_partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the IntBox widget in its frame with the stored value.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = SpinBox(self.frame)
+        self.widget.setMinimum(self.minimal_value)
+        self.widget.setMaximum(self.maximal_value)
+        self.widget.setValue(self._value)
+        self.widget.setSingleStep(self.step)
+        self.widget.valueChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -263,15 +288,10 @@ class IntBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f'QSpinBox{"{"}selection-color: {globs.WHITE};selection-background-color: {globs.LIGHT};border: 1px solid {globs.WHITE};{"}"}'
         )
         self.widget.setAlignment(QtC.Qt.AlignRight | QtC.Qt.AlignTrailing | QtC.Qt.AlignVCenter)
-        self.widget.setMinimum(self.minimal_value)
-        self.widget.setMaximum(self.maximal_value)
-        self.widget.setValue(self.default_value)
-        self.widget.setSingleStep(self.step)
         self.widget.setMaximumWidth(100)
         self.widget.setMinimumWidth(100)
         self.widget.setMinimumHeight(28)
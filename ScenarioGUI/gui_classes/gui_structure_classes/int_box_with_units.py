@@ -71,7 +71,9 @@ class IntBoxWithUnits(IntBox):
         """
         super().__init__(label=label, default_value=default_value, category=category, maximal_value=maximal_value, minimal_value=minimal_value, step=step)
         self.units: list[tuple[str, float]] = [] if units is None else units
-        self.unit_widget: ComboBox = ComboBox(self.default_parent, currentIndexChanged=self.valueChanged.emit)
+        self.unit_widget: ComboBox | None = None
+        # unit index until the widget is created
+        self._unit_index: int = 0
 
     def check_linked_value(self, value: tuple[int | None, int | None], value_if_hidden: bool | None = None) -> bool:
         """
@@ -140,6 +142,8 @@ class IntBoxWithUnits(IntBox):
         tuple[float, int]
             Value of the IntBox multiplied with units value and unit box index
         """
+        if self.widget is None:
+            return self._value * self.units[self._unit_index][1], self._unit_index
         return self.widget.value() * self.units[self.unit_widget.currentIndex()][1], self.unit_widget.currentIndex()
 
     def set_value(self, value: tuple[float | int, int] | float | int) -> None:
@@ -155,6 +159,13 @@ class IntBoxWithUnits(IntBox):
         -------
         None
         """
+        if self.widget is None:
+            unit_index, value = (value[1], value[0] / self.units[value[1]][1]) if isinstance(value, (tuple, list)) else (0, value)
+            if unit_index != self._unit_index:
+                self._unit_index = unit_index
+                self.valueChanged.emit()
+            super().set_value(value)
+            return
         if not isinstance(value, (tuple, list)):
             self.unit_widget.setCurrentIndex(0)
             check_and_set_max_min_values(self.widget, value, self.maximal_value, self.minimal_value)
@@ -205,7 +216,22 @@ class IntBoxWithUnits(IntBox):
             new font size
         """
         super().set_font_size(size)
-        change_font_size(self.unit_widget, size, True)
+        if self.unit_widget is not None:
+            change_font_size(self.unit_widget, size, True)
+
+    def _init_widget(self) -> None:
+        """
+        This function creates the IntBox widget and the unit widget in its frame with the stored value and unit.
+
+        Returns
+        -------
+        None
+        """
+        super()._init_widget()
+        self.unit_widget = ComboBox(self.frame)
+        self.unit_widget.addItems([name for name, _ in self.units])
+        self.unit_widget.setCurrentIndex(self._unit_index)
+        self.unit_widget.currentIndexChanged.connect(self.valueChanged.emit)
 
     def create_widget(
         self,
@@ -236,9 +262,7 @@ class IntBoxWithUnits(IntBox):
         None
         """
         super().create_widget(frame, layout_parent, row=row, column=column)
-        self.unit_widget.setParent(self.frame)
         self.frame.layout().addWidget(self.unit_widget)
-        self.unit_widget.addItems([name for name, _ in self.units])
         self.unit_widget.setStyleSheet(
             f"QFrame {'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox{'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
@@ -68,7 +68,53 @@ class ListBox(Option):
         """
         super().__init__(label, default_index, category)
         self.entries: list[str] = entries
-        self.widget: ComboBox = ComboBox(self.default_parent, currentIndexChanged=self.valueChanged.emit)
+        self.widget: ComboBox | None = None
+        # items, index and insert policy until the widget is created
+        self._items: list[str] = list(entries)
+        self._value: int = default_index if 0 <= default_index < len(entries) else -1
+        self._insert_policy: QtW.QComboBox.InsertPolicy | None = None
+
+    def set_entries(self, entries: list[str]) -> None:
+        """
+        This function sets the entries of the ListBox. Entries beyond the current ones are added.
+
+        Parameters
+        ----------
+        entries : List[str]
+            The list of all the different entries in the ListBox
+
+        Returns
+        -------
+        None
+        """
+        self.entries = entries
+        if self.widget is not None:
+            for idx, entry in enumerate(entries):
+                self.widget.setItemText(idx, entry) if idx < self.widget.count() else self.widget.addItem(entry)
+            return
+        self._items = [*entries, *self._items[len(entries) :]]
+        if self._value < 0 and self._items:
+            self._set_index(0)
+
+    def _set_index(self, index: int) -> None:
+        """
+        This function sets the index of the ListBox before its widget is created.
+
+        Parameters
+        ----------
+        index : int
+            Index of the ListBox
+
+        Returns
+        -------
+        None
+        """
+        index = index if 0 <= index < len(self._items) else -1
+        if index == self._value:
+            return
+        self._value = index
+        self.valueChanged.emit()
+        check(self.linked_options, self, index)
 
     def get_text(self) -> str:
         """
@@ -79,6 +125,8 @@ class ListBox(Option):
         str
             Current text on the ListBox
         """
+        if self.widget is None:
+            return self._items[self._value] if self._value >= 0 else ""
         return self.widget.currentText()
 
     def get_value(self) -> tuple[int, str]:
@@ -90,6 +138,8 @@ class ListBox(Option):
         int
             Value/index of the ListBox
         """
+        if self.widget is None:
+            return self._value, self.get_text()
         return self.widget.currentIndex(), self.widget.currentText()
 
     def set_value(self, value: tuple[int, str] | int) -> None:
@@ -105,17 +155,18 @@ class ListBox(Option):
         -------
         None
         """
-        if isinstance(value, int):
-            self.widget.setCurrentIndex(value)
+        index = value if isinstance(value, int) else value[0]
+        if self.widget is None:
+            self._set_index(index)
             return
-        self.widget.setCurrentIndex(value[0])
+        self.widget.setCurrentIndex(index)
 
     def make_editable(self, insertable: bool = False):
-        self.widget.setEditable(True)
-        if insertable:
-            self.widget.setInsertPolicy(QtW.QComboBox.InsertPolicy.InsertAtBottom)
+        self._insert_policy = QtW.QComboBox.InsertPolicy.InsertAtBottom if insertable else QtW.QComboBox.InsertPolicy.NoInsert
+        if self.widget is None:
             return
-        self.widget.setInsertPolicy(QtW.QComboBox.InsertPolicy.NoInsert)
+        self.widget.setEditable(True)
+        self.widget.setInsertPolicy(self._insert_policy)
 
     def _check_value(self) -> bool:
         """
@@ -126,7 +177,7 @@ class ListBox(Option):
         bool
             True if the current index of the ListBox is larger than zero. False otherwise
         """
-        return self.widget.currentIndex() >= 0
+        return self.get_value()[0] >= 0
 
     def set_text(self, name: str):
         """
@@ -143,7 +194,10 @@ class ListBox(Option):
         None
         """
         entry_name: list[str, str] = name.split(",")
-        self.label.setText(entry_name[0])
+        super().set_text(entry_name[0])
+        if self.widget is None:
+            self._items[: len(entry_name) - 1] = entry_name[1 : len(self._items) + 1]
+            return
         for idx, name in enumerate(entry_name[1:]):
             self.widget.setItemText(idx, name)
 
@@ -189,7 +243,7 @@ class ListBox(Option):
         bool
             True if the linked "option" should be shown
         """
-        return self.check_value_if_hidden(self.widget.currentIndex() == value, value_if_hidden)
+        return self.check_value_if_hidden(self.get_value()[0] == value, value_if_hidden)
 
     def create_function_2_check_linked_value(self, value: int, value_if_hidden: bool | None = None) -> Callable[[], bool]:
         """
@@ -208,6 +262,23 @@ class ListBox(Option):
         """
         return ft_partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the ListBox widget in its frame with the stored items, index and insert policy.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = ComboBox(self.frame)
+        self.widget.addItems(self._items)
+        self.widget.setCurrentIndex(self._value)
+        if self._insert_policy is not None:
+            self.widget.setEditable(True)
+            self.widget.setInsertPolicy(self._insert_policy)
+        self.widget.currentIndexChanged.connect(self.valueChanged.emit)
+        self.widget.currentIndexChanged.connect(ft_partial(check, self.linked_options, self))  # pylint: disable=E1101
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -236,19 +307,15 @@ class ListBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f"QFrame {'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox{'{'}border: 1px solid {globs.WHITE};border-bottom-left-radius: 0px;border-bottom-right-radius: 0px;{'}'}"
             f"QComboBox QAbstractItemView::item:hover{'{'}color: {globs.WHITE};background-color: {globs.LIGHT_SELECT};{'}'}"
             f"QComboBox QAbstractItemView::item:selected{'{'}color: {globs.WHITE};background-color: {globs.LIGHT_SELECT};{'}'}"
         )
-        self.widget.addItems(self.entries)
-        self.widget.setCurrentIndex(self.default_value)
         if self.limit_size:
             # self.widget.setMaximumWidth(100)
             self.widget.setMinimumWidth(100)
-        self.widget.currentIndexChanged.connect(ft_partial(check, self.linked_options, self))  # pylint: disable=E1101
         self.widget.setMinimumHeight(28)
         self.widget.setFocusPolicy(QtC.Qt.FocusPolicy.StrongFocus)
         set_default_font(self.widget)
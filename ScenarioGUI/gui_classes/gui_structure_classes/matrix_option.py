@@ -67,6 +67,8 @@ class MatrixBox(Option):
     The MatrixBox can be used to input floating point numbers in a matrix format.
     """
 
+    lazy_creation: bool = False
+
     def __init__(
         self,
         label: str | list[str],
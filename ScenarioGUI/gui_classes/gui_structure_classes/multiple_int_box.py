@@ -78,7 +78,9 @@ class MultipleIntBox(Option):
         self.minimal_value: list[int] = [minimal_value for _ in default_value] if not isinstance(minimal_value, Iterable) else minimal_value
         self.maximal_value: list[int] = [maximal_value for _ in default_value] if not isinstance(maximal_value, Iterable) else maximal_value
         self.step: list[int] = [step for _ in default_value] if not isinstance(step, Iterable) else step
-        self.widget: list[SpinBox] = [SpinBox(self.default_parent, valueChanged=self.valueChanged.emit) for _ in default_value]
+        self.widget: list[SpinBox] | None = None
+        # values until the widgets are created
+        self._value: list[int] = [int(min(max(val, min_val), max_val)) for val, min_val, max_val in zip(default_value, self.minimal_value, self.maximal_value)]
 
     def get_value(self) -> tuple[int]:
         """
@@ -89,6 +91,8 @@ class MultipleIntBox(Option):
         tuple[int]
             Value of the IntBox
         """
+        if self.widget is None:
+            return tuple(self._value)
         return tuple(widget.value() for widget in self.widget)
 
     def set_value(self, value: list[int] | tuple[int]) -> None:
@@ -104,6 +108,13 @@ class MultipleIntBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            values = [int(min(max(val, min_val), max_val)) for val, min_val, max_val in zip(value, self.minimal_value, self.maximal_value)]
+            values = [*values, *self._value[len(values) :]]
+            if values != self._value:
+                self._value = values
+                self.valueChanged.emit()
+            return
         _ = [widget.setValue(val) for widget, val in zip(self.widget, value)]
 
     def _check_value(self) -> bool:
@@ -228,6 +239,22 @@ class MultipleIntBox(Option):
             return option.show()
         option.hide()
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the IntBox widgets of the MultipleIntBox in its frame with the stored values.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = [SpinBox(self.frame) for _ in self._value]
+        for widget, max_val, min_val, step, val in zip(self.widget, self.maximal_value, self.minimal_value, self.step, self._value):
+            widget.setMinimum(min_val)
+            widget.setMaximum(max_val)
+            widget.setValue(val)
+            widget.setSingleStep(step)
+            widget.valueChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -257,16 +284,11 @@ class MultipleIntBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        for widget, max_val, min_val, step, def_val in zip(self.widget, self.maximal_value, self.minimal_value, self.step, self.default_value):
-            widget.setParent(self.frame)
+        for widget in self.widget:
             widget.setStyleSheet(
                 f'QSpinBox{"{"}selection-color: {globs.WHITE};selection-background-color: {globs.LIGHT};' f'border: 1px solid {globs.WHITE};{"}"}'
             )
             widget.setAlignment(QtC.Qt.AlignRight | QtC.Qt.AlignTrailing | QtC.Qt.AlignVCenter)
-            widget.setMinimum(min_val)
-            widget.setMaximum(max_val)
-            widget.setValue(def_val)
-            widget.setSingleStep(step)
             widget.setMaximumWidth(100)
             widget.setMinimumWidth(100)
             widget.setMinimumHeight(28)
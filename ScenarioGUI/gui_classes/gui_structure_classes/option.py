@@ -14,6 +14,7 @@ import ScenarioGUI.global_settings as globs
 from ScenarioGUI.utils import Signal, change_font_size, set_default_font
 
 from .aim import Aim
+from .page import Page
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
@@ -25,7 +26,19 @@ if TYPE_CHECKING:  # pragma: no cover
         list_of_options: list[Option]
 
 
-class Option(QtC.QObject):
+class OptionType(type(QtC.QObject)):
+    """
+    Metaclass of the options, which creates the widgets of an option directly after it has been initialised,
+    unless they are only created when its page is shown for the first time (see Page.LAZY).
+    """
+
+    def __call__(cls, *args, **kwargs):
+        option = super().__call__(*args, **kwargs)
+        option._create_widgets() if not option.is_created_lazily() else None
+        return option
+
+
+class Option(QtC.QObject, metaclass=OptionType):
     """
     Abstract base class for a gui option.
     """
@@ -34,6 +47,8 @@ class Option(QtC.QObject):
     hidden_option_editable: bool = True
 
     value_if_hidden: bool | None = None
+    # False if the option can only be used after its widgets have been created, so they are never created lazily (see Page.LAZY)
+    lazy_creation: bool = True
 
     def __init__(
         self,
@@ -55,8 +70,12 @@ class Option(QtC.QObject):
         self.label_text: list[str] = [label] if isinstance(label, str) else label
         self.default_value: bool | int | float | str = default_value
         self.widget: QtW.QWidget | None = None
-        self.frame: QtW.QFrame = QtW.QFrame(self.default_parent)
-        self.label = QtW.QLabel(self.frame)
+        self.frame: QtW.QFrame | None = None
+        self.label: QtW.QLabel | None = None
+        # label text, tool tip and visibility until the frame is created
+        self._text: str = self.label_text[0]
+        self._tool_tip: str = ""
+        self._hidden: bool = False
         self.linked_options: list[(Option, int)] = []
         self.limit_size: bool = True
         category.list_of_options.append(self)
@@ -65,6 +84,7 @@ class Option(QtC.QObject):
         self.valueChanged: Signal = Signal()
         self.conditional_visibility: bool = False
         self.tool_tip: list[str] = []
+        self.dependent_aims: list[Aim] | None = None  # aims of which the results depend on this option (None for all)
 
     @abc.abstractmethod
     def get_value(self) -> bool | int | float | str:
@@ -108,7 +128,9 @@ class Option(QtC.QObject):
         self._set_tool_tip(self.tool_tip[0])
 
     def _set_tool_tip(self, tool_tip: str):
-        self.frame.setToolTip(tool_tip)
+        self._tool_tip = tool_tip
+        if self.frame is not None:
+            self.frame.setToolTip(tool_tip)
 
     def check_value_if_hidden(self, un_hidden_value: bool, hidden_value: bool) -> bool:
         hidden_value = self.value_if_hidden if hidden_value is None else hidden_value
@@ -137,6 +159,30 @@ class Option(QtC.QObject):
         """
         self.list_2_check_before_value.append(aim_or_option)
 
+    def set_dependent_aims(self, *aims: Aim) -> None:
+        """
+        This function sets the aims of which the results depend on the value of this option.
+        If the option is changed, the results of the scenario are only removed if one of these aims is selected.
+        Without any aim, the option does not influence the results at all (e.g. it only changes their presentation).
+        By default, the results of all aims depend on the option, unless it is only shown for some aims.
+
+        Parameters
+        ----------
+        aims : Aim
+            aims of which the results depend on the value of this option
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        In the example below, the results are only removed if 'option_example' is changed while 'aim_example' is selected.
+
+        >>> option_example.set_dependent_aims(aim_example)
+        """
+        self.dependent_aims = list(aims)
+
     def check_value(self) -> bool:
         """
         This function check whether the value of the option is valid.
@@ -149,7 +195,7 @@ class Option(QtC.QObject):
         bool
             True if the value of the current option is valid.
         """
-        if self.frame.isEnabled():
+        if self.is_enabled():
             if not self.list_2_check_before_value:
                 return self._check_value()
             if any(aim.widget.isChecked() for aim in self.list_2_check_before_value if isinstance(aim, Aim)) or any(
@@ -187,6 +233,49 @@ class Option(QtC.QObject):
         None
         """
 
+    def is_created_lazily(self) -> bool:
+        """
+        This function checks if the widgets of the option are only created when its page is shown for the first time (see Page.LAZY).
+        Otherwise, they are created directly after the option has been initialised.
+
+        Returns
+        -------
+        bool
+            True if the widgets are created lazily
+        """
+        return self.lazy_creation and Page.LAZY
+
+    def _create_widgets(self) -> None:
+        """
+        This function creates the frame, the label and the widget of the option with the stored text, tool tip, visibility and value,
+        if they have not been created yet. They are placed in a category by create_widget.
+
+        Returns
+        -------
+        None
+        """
+        if self.frame is None:
+            enabled = self.is_enabled()
+            self.frame = QtW.QFrame(self.default_parent)
+            self.label = QtW.QLabel(self.frame)
+            self.label.setText(self._text)
+            self.frame.setToolTip(self._tool_tip)
+            # keep the visibility if the option has been hidden before its frame is created
+            self.frame.hide() if self._hidden else None
+            self.frame.setEnabled(enabled)
+        if self.widget is None:
+            self._init_widget()
+
+    def _init_widget(self) -> None:
+        """
+        This function creates the widget of the option in its frame with the stored value.
+        Options, which create their widgets in the __init__ function, do not have to implement it.
+
+        Returns
+        -------
+        None
+        """
+
     def init_links(self) -> None:
         """
         This function initiates the links.
@@ -211,7 +300,9 @@ class Option(QtC.QObject):
         -------
         None
         """
-        self.label.setText(name)
+        self._text = name
+        if self.label is not None:
+            self.label.setText(name)
 
     def deactivate_size_limit(self) -> None:
         """
@@ -244,10 +335,18 @@ class Option(QtC.QObject):
         """
 
         if self.label_text == [""]:
-            self.frame.setParent(None)
+            if self.frame is not None:
+                # keep the widgets, which have already been created in the own frame of the option
+                for widget in self.frame.findChildren(QtW.QWidget, options=QtC.Qt.FindChildOption.FindDirectChildrenOnly):
+                    widget.setParent(frame) if widget is not self.label else None
+                self.frame.setParent(None)
             self.frame = frame
             self.label = None
+            # keep the visibility if the option has been hidden before its widget is created
+            frame.hide() if self._hidden else None
+            self._create_widgets()
             return frame.layout()
+        self._create_widgets()
         self.frame.setParent(frame)
         self.frame.setFrameShape(QtW.QFrame.StyledPanel)
         self.frame.setFrameShadow(QtW.QFrame.Raised)
@@ -256,7 +355,6 @@ class Option(QtC.QObject):
         layout.setSpacing(6)
         layout.setContentsMargins(0, 0, 0, 0)
         self.label.setParent(frame)
-        self.label.setText(self.label_text[0])
         set_default_font(self.label)
         layout.addWidget(self.label)
         if create_spacer:
@@ -275,8 +373,10 @@ class Option(QtC.QObject):
         """
         # if self.is_hidden():
         #     return
-        self.frame.hide()
-        self.frame.setEnabled(self.hidden_option_editable)
+        self._hidden = True
+        if self.frame is not None:
+            self.frame.hide()
+            self.frame.setEnabled(self.hidden_option_editable)
         [option.hide() for option, value in self.linked_options]
         self.visibilityChanged.emit()
 
@@ -289,8 +389,24 @@ class Option(QtC.QObject):
         Bool
             True if the option is hidden
         """
+        # a frame, which is not placed in a category yet, is always hidden
+        if self.frame is None or self.frame.parentWidget() is None:
+            return self._hidden
         return self.frame.isHidden()
 
+    def is_enabled(self) -> bool:
+        """
+        This function returns a boolean value related to whether or not the option can be edited.
+
+        Returns
+        -------
+        Bool
+            True if the option is enabled
+        """
+        if self.frame is None:
+            return not self._hidden or self.hidden_option_editable
+        return self.frame.isEnabled()
+
     def show(self) -> None:
         """
         This function makes the current frame visible.
@@ -301,8 +417,10 @@ class Option(QtC.QObject):
         """
         # if not self.is_hidden():
         #     return
-        self.frame.show()
-        self.frame.setEnabled(True)
+        self._hidden = False
+        if self.frame is not None:
+            self.frame.show()
+            self.frame.setEnabled(True)
         [option.show() for option, value in self.linked_options if self.check_linked_value(value)]
         self.visibilityChanged.emit()
 
@@ -379,6 +497,9 @@ class Option(QtC.QObject):
         """
         if self.label is not None:
             change_font_size(self.label, size, False)
+        if self.widget is None:
+            # the widget gets the font size when it is created
+            return
         if isinstance(self.widget, list):
             for widget in self.widget:
                 if isinstance(widget, list):
@@ -32,6 +32,7 @@ class Page:
     previous_label: str = "previous"
     default_parent: QtW.QWidget | None = None
     TOGGLE: bool = True
+    LAZY: bool = False  # create the categories of a page only when it is shown for the first time
 
     def __init__(self, name: str | list[str], button_name: str, icon: str):
         """
@@ -70,7 +71,11 @@ class Page:
         self.next_page: Page | None = None
         self.upper_frame: list[Aim] = []
         self.functions_button_clicked: list[Callable] = []
+        self.functions_categories_created: list[Callable] = []
         self.aims_in_row: int = 2
+        self.categories_created: bool = False
+        self.scroll_area: QtW.QScrollArea | None = None
+        self.scroll_area_layout: QtW.QVBoxLayout | None = None
 
     def add_function_called_if_button_clicked(self, function_to_be_called: Callable) -> None:
         """
@@ -87,6 +92,34 @@ class Page:
         """
         self.functions_button_clicked.append(function_to_be_called)
 
+    def add_function_called_if_categories_created(self, function_to_be_called: Callable) -> None:
+        """
+        This function calls the function_to_be_called after the categories of the Page have been created.
+        This is only done later than the creation of the page if the page is created lazily (see LAZY).
+
+        Parameters
+        ----------
+        function_to_be_called : callable
+            Function which should be called
+
+        Returns
+        -------
+        None
+        """
+        self.functions_categories_created.append(function_to_be_called)
+
+    def can_be_created_lazily(self) -> bool:
+        """
+        This function checks if the categories of the page can be created when the page is shown for the first time.
+        This is not possible if an option of the page can only be used after its widget has been created.
+
+        Returns
+        -------
+        bool
+            True if the categories can be created later
+        """
+        return all(category.can_be_created_lazily() for category in self.list_categories)
+
     def set_text(self, name: str) -> None:
         """
         This function sets the text of the Page and the page button.
@@ -194,11 +227,10 @@ class Page:
 
         scroll_area_layout.addWidget(label_gap)
 
-        for category in self.list_categories:
-            category.create_widget(scroll_area, scroll_area_layout)
-
-        spacer = QtW.QSpacerItem(1, 1, QtW.QSizePolicy.Minimum, QtW.QSizePolicy.Expanding)
-        scroll_area_layout.addItem(spacer)
+        self.scroll_area, self.scroll_area_layout = scroll_area, scroll_area_layout
+        lazy = self.LAZY and self.can_be_created_lazily()
+        if not lazy:
+            self.create_categories()
 
         self.create_navigation_buttons(central_widget, layout)
 
@@ -215,10 +247,32 @@ class Page:
 
         vertical_layout_menu.addWidget(self.button)
         vertical_layout_menu.addWidget(self.label_gap)
+        if lazy:
+            self.button.clicked.connect(self.create_categories)  # pylint: disable=E1101
         self.button.clicked.connect(ft_partial(stacked_widget.setCurrentWidget, self.page))  # pylint: disable=E1101
         for function_2_be_called in self.functions_button_clicked:
             self.button.clicked.connect(function_2_be_called)  # pylint: disable=E1101
 
+    def create_categories(self) -> None:
+        """
+        This function creates the widgets of the categories of the Page, if they have not been created yet.
+        The values of the options can be read and set before, since the options store them until their widgets are created here.
+
+        Returns
+        -------
+        None
+        """
+        if self.categories_created:
+            return
+        self.categories_created = True
+        for category in self.list_categories:
+            category.create_widget(self.scroll_area, self.scroll_area_layout)
+
+        spacer = QtW.QSpacerItem(1, 1, QtW.QSizePolicy.Minimum, QtW.QSizePolicy.Expanding)
+        self.scroll_area_layout.addItem(spacer)
+        for function_2_be_called in self.functions_categories_created:
+            function_2_be_called()
+
     def set_font_size(self, size: int) -> None:
         """
         set the text size of hint
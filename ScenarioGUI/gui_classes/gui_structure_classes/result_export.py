@@ -96,4 +96,4 @@ class ResultExport(FunctionButton):
         -------
         None
         """
-        self.button.clicked.connect(lambda: function_to_be_called(*args))
+        self.clicked.connect(lambda: function_to_be_called(*args))
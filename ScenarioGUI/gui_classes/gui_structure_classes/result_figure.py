@@ -15,13 +15,14 @@ import PySide6.QtWidgets as QtW  # type: ignore
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
 
 import ScenarioGUI.global_settings as globs
 
-from ...utils import change_font_size
 from . import FunctionButton, IntBox
 from .button_box import ButtonBox
 from .category import Category
+from .font_index import FONT_INDEX, get_name  # noqa: F401
 from .font_list_box import FontListBox
 from .multiple_int_box import MultipleIntBox
 
@@ -29,29 +30,13 @@ if TYPE_CHECKING:  # pragma: no cover
     from .page import Page
 
 
-def get_name(font: fm.FontProperties) -> str:
-    """
-    get the name of the font and catch the MacOS runtime error
-
-    Parameters
-    ----------
-    font: fm.FontProperties
-        font to get name for
-    Returns
-    -------
-        str
-    """
-    try:
-        return font.get_name()
-    except RuntimeError:  # pragma: no cover
-        return "ZZ"
-
-
-font_list: list[fm.FontProperties] = [fm.FontProperties(fname=font_path, size=12) for font_path in fm.findSystemFonts()]
-font_list = sorted(font_list, key=lambda x: x.get_file().upper().split("\\")[-1].replace(".TTF", ""))
-font_name_set = set()
-font_list = [font for font in font_list if get_name(font) not in font_name_set and not font_name_set.add(get_name(font))]
-font_list_by_name: list[str] = [get_name(font).upper() for font in font_list]
+def __getattr__(name: str):
+    # the font list is not created on import anymore, but only when it is used for the first time
+    if name == "font_list":
+        return [FONT_INDEX.font(idx) for idx in range(len(FONT_INDEX))]
+    if name == "font_list_by_name":
+        return FONT_INDEX.names_upper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # overwrite navigationToolbar
@@ -122,35 +107,14 @@ class ResultFigure(Category):
         super().__init__(label, page)
         self.y_axes_text: str = ""
         self.x_axes_text: str = ""
-        self.frame_canvas: QtW.QFrame = QtW.QFrame(self.frame)
-        self.layout_frame_canvas: QtW.QVBoxLayout = QtW.QVBoxLayout(self.frame_canvas)
+        # the frame, canvas and toolbar of the figure are created with the category in create_widget
+        self.frame_canvas: QtW.QFrame | None = None
+        self.layout_frame_canvas: QtW.QVBoxLayout | None = None
         globs.set_graph_layout()
-        self.fig: plt.Figure = plt.figure()
+        self.fig: plt.Figure = Figure()
         self.a_x: plt.Axes | None = self.fig.add_subplot(111)
-        self.canvas: FigureCanvas = FigureCanvas(self.fig)
-        self.canvas.a_x = self.a_x
-        # create navigation toolbar and replace icons with white ones
-        self.toolbar: NavigationToolbarScenarioGUI = NavigationToolbarScenarioGUI(
-            overwrite=customizable_figure == 1, canvas=self.canvas, parent=None, coordinate=True
-        )
-        for name, icon_name in [
-            ("save_figure", "Save_Inv"),
-            ("home", "Home"),
-            ("zoom", "Search"),
-            ("back", "Back"),
-            ("forward", "Forward"),
-            ("pan", "Pen"),
-            ("configure_subplots", "Options"),
-            ("edit_parameters", "Parameters"),
-        ]:
-            icon = QtG.QIcon()
-            icon.addFile(
-                f"{globs.FOLDER}/icons/{icon_name}.svg",
-                QtC.QSize(),
-                QtG.QIcon.Normal,  # type: ignore
-                QtG.QIcon.Off,  # type: ignore
-            )
-            self.toolbar._actions[name].setIcon(icon)
+        self.canvas: FigureCanvas | None = None
+        self.toolbar: NavigationToolbarScenarioGUI | None = None
         self._kwargs: dict = {}
         self.function_name: str = ""
         self.class_name: str = ""
@@ -160,8 +124,6 @@ class ResultFigure(Category):
         self.set_text(self.label_text[0])
         self.scroll_area: QtW.QScrollArea | None = None
         self.customizable_figure: int = customizable_figure
-        # Connect the resizeEvent to the update_figure_layout function
-        self.frame_canvas.resizeEvent = self.update_figure_layout
 
         self.default_settings = {}
 
@@ -220,8 +182,8 @@ class ResultFigure(Category):
             self.option_font = FontListBox(
                 label="Font family: ",
                 category=self,
-                entries=[get_name(font) for font in font_list],
-                default_index=font_list_by_name.index(globs.FONT.upper()),
+                entries=lambda: FONT_INDEX.names,
+                default_index=lambda: FONT_INDEX.index(globs.FONT),
             )
             self.option_save_layout = FunctionButton(button_text="Save layout", category=self, icon="Save")
             self.default_figure_colors.add_link_2_show(self.option_figure_background, on_index=0)
@@ -253,7 +215,8 @@ class ResultFigure(Category):
             "title": self.option_title.get_value(),
             "legend_text": self.option_legend_text.get_value(),
             "font_size": self.option_font_size.get_value(),
-            "font": self.option_font.link_matrix()[self.option_font.get_value()[0]],
+            # the default font is only searched when it is needed
+            "font": self.option_font.link_matrix()[self.option_font.get_value()[0]] if self.option_font.is_resolved() else None,
         }
 
     def change_2_default_settings(self):
@@ -264,9 +227,10 @@ class ResultFigure(Category):
             self.a_x.tick_params(axis="y", colors=to_rgb(np.array(self.default_settings["axes"]) / 255))
             self._change_axes_color(self.default_settings["axes_text"])
             self._change_legend_text_color(self.default_settings["legend_text"])
-            self._change_font(self.default_settings["font"], self.default_settings["font_size"])
-            self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-            self.canvas.draw() if self.frame.isVisible() else None
+            font = self.default_settings["font"]
+            self._change_font(self.option_font.link_matrix()[self.option_font.default_value] if font is None else font, self.default_settings["font_size"])
+            self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+            self.canvas.draw() if self.is_visible() else None
             return
         self.change_figure_background_color()
         self.change_plot_background_color()
@@ -276,9 +240,20 @@ class ResultFigure(Category):
         self.change_title_color()
         self.change_font()
 
+    def is_visible(self) -> bool:
+        """
+        This function returns a boolean value related to whether or not the figure is currently visible.
+
+        Returns
+        -------
+        bool
+            True if the figure has been created and is visible
+        """
+        return self.frame is not None and self.frame.isVisible()
+
     def update_figure_layout(self, event):
-        self.canvas.draw() if self.frame.isVisible() else None  # Redraw the canvas
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None  # Adjust the layout of the figure
+        self.canvas.draw() if self.is_visible() else None  # Redraw the canvas
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None  # Adjust the layout of the figure
         self.frame_canvas.setMinimumHeight(self.frame_canvas.window().size().height() * 0.6)
         self.frame_canvas.setMaximumHeight(self.frame_canvas.window().size().height() * 0.6)
         QtW.QFrame.resizeEvent(self.frame_canvas, event)
@@ -306,13 +281,44 @@ class ResultFigure(Category):
         if legend is not None:
             for text, label in zip(legend.get_texts(), self.legend_text):
                 text.set_text(label)
-        self.toolbar.home()
-        self.canvas.hide()
-        self.toolbar.hide()
-        canvas = FigureCanvas(self.fig)
-        # create navigation toolbar and replace icons with white ones
+        # the canvas is created for the current figure in create_widget, if it does not exist yet
+        if self.canvas is not None:
+            self.toolbar.home()
+            self.canvas.hide()
+            self.toolbar.hide()
+            canvas = FigureCanvas(self.fig)
+            toolbar = self.create_toolbar(canvas, self.frame_canvas)
+
+            self.layout_frame_canvas.replaceWidget(self.canvas, canvas)
+            self.layout_frame_canvas.replaceWidget(self.toolbar, toolbar)
+
+            self.canvas = canvas
+            self.canvas.a_x = copy.deepcopy(self.a_x)
+            self.canvas.mpl_connect("scroll_event", self.scrolling)
+            self.toolbar = toolbar
+        if self.customizable_figure == 2:
+            self.change_2_default_settings()
+        else:
+            self._change_font(FONT_INDEX.index(globs.FONT), globs.FONT_SIZE)
+
+    def create_toolbar(self, canvas: FigureCanvas, parent: QtW.QWidget | None) -> NavigationToolbarScenarioGUI:
+        """
+        This function creates the navigation toolbar of the canvas and replaces its icons with white ones.
+
+        Parameters
+        ----------
+        canvas : FigureCanvas
+            canvas of the figure
+        parent : QtW.QWidget | None
+            parent of the toolbar
+
+        Returns
+        -------
+        NavigationToolbarScenarioGUI
+            navigation toolbar
+        """
         toolbar: NavigationToolbarScenarioGUI = NavigationToolbarScenarioGUI(
-            overwrite=self.customizable_figure == 1, canvas=canvas, parent=self.frame_canvas, coordinate=True
+            overwrite=self.customizable_figure == 1, canvas=canvas, parent=parent, coordinate=True
         )
         for name, icon_name in [
             ("save_figure", "Save_Inv"),
@@ -332,18 +338,7 @@ class ResultFigure(Category):
                 QtG.QIcon.Off,  # type: ignore
             )
             toolbar._actions[name].setIcon(icon)
-
-        self.layout_frame_canvas.replaceWidget(self.canvas, canvas)
-        self.layout_frame_canvas.replaceWidget(self.toolbar, toolbar)
-
-        self.canvas = canvas
-        self.canvas.a_x = copy.deepcopy(self.a_x)
-        self.canvas.mpl_connect("scroll_event", self.scrolling)
-        self.toolbar = toolbar
-        if self.customizable_figure == 2:
-            self.change_2_default_settings()
-        else:
-            self._change_font(font_list_by_name.index(globs.FONT.upper()), globs.FONT_SIZE)
+        return toolbar
 
     def create_widget(self, page: QtW.QScrollArea, layout: QtW.QLayout):
         """
@@ -365,7 +360,10 @@ class ResultFigure(Category):
         # create widget as from category
         super().create_widget(page, layout)
         # create frame with no border for the frames inside the NavigationToolbar
-        self.frame_canvas.setParent(page)
+        self.frame_canvas = QtW.QFrame(page)
+        self.layout_frame_canvas = QtW.QVBoxLayout(self.frame_canvas)
+        # Connect the resizeEvent to the update_figure_layout function
+        self.frame_canvas.resizeEvent = self.update_figure_layout
         self.frame_canvas.setStyleSheet(
             f"QFrame{'{'}border: 0px solid {globs.LIGHT};border-bottom-left-radius: 15px;border-bottom-right-radius: 15px;{'}'}\n"
             f"QLabel{'{'}border: 0px solid {globs.WHITE};{'}'}"
@@ -377,6 +375,9 @@ class ResultFigure(Category):
         self.frame_canvas.setMinimumHeight(500)
         self.frame_canvas.setMaximumHeight(500)
         # add canvas and toolbar to local frame
+        self.canvas = FigureCanvas(self.fig)
+        self.canvas.a_x = self.a_x
+        self.toolbar = self.create_toolbar(self.canvas, None)
         self.layout_frame_canvas.addWidget(self.canvas)
         self.layout_frame_canvas.addWidget(self.toolbar)
         if self.customizable_figure == 2:
@@ -400,18 +401,18 @@ class ResultFigure(Category):
 
     def change_figure_background_color(self):
         self.fig.set_facecolor(to_rgb(np.array(self.option_figure_background.get_value()) / 255))
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def change_plot_background_color(self):
         self.a_x.set_facecolor(to_rgb(np.array(self.option_plot_background.get_value()) / 255))
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def change_axes_color(self):
         self._change_axes_color(self.option_axes.get_value())
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def _change_axes_color(self, color: tuple[int, int, int]):
         self.a_x.tick_params(axis="x", colors=to_rgb(np.array(color) / 255))
@@ -423,19 +424,19 @@ class ResultFigure(Category):
 
     def change_title_color(self):
         self.a_x.set_title(self.a_x.get_title(), color=to_rgb(np.array(self.option_title.get_value()) / 255))
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def change_axis_text_color(self):
         self.a_x.xaxis.label.set_color(to_rgb(np.array(self.option_axes_text.get_value()) / 255))
         self.a_x.yaxis.label.set_color(to_rgb(np.array(self.option_axes_text.get_value()) / 255))
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def change_legend_text_color(self):
         self._change_legend_text_color(self.option_legend_text.get_value())
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def _change_legend_text_color(self, colors: tuple[int, int, int]):
         legend = self.a_x.get_legend()
@@ -446,11 +447,11 @@ class ResultFigure(Category):
 
     def change_font(self):
         self._change_font(self.option_font.link_matrix()[self.option_font.get_value()[0]], self.option_font_size.get_value())
-        self.fig.tight_layout() if self.frame.isVisible() and not (self.fig.get_tight_layout()) else None
-        self.canvas.draw() if self.frame.isVisible() else None
+        self.fig.tight_layout() if self.is_visible() and not (self.fig.get_tight_layout()) else None
+        self.canvas.draw() if self.is_visible() else None
 
     def _change_font(self, font_index: int, font_size: int):
-        font: fm.FontProperties = font_list[font_index]
+        font: fm.FontProperties = FONT_INDEX.font(font_index)
         font.set_size(font_size)
         font.set_style("normal")
         font.set_weight("normal")
@@ -508,7 +509,7 @@ class ResultFigure(Category):
         None
         """
         entry_name: list[str, str] = name.split(",")
-        self.label.setText(entry_name[0])
+        super().set_text(entry_name[0])
         self.y_axes_text = entry_name[1]
         self.a_x.set_ylabel(self.y_axes_text)
         self.x_axes_text = entry_name[2]
@@ -605,7 +606,7 @@ class ResultFigure(Category):
         -------
             None
         """
-        change_font_size(self.label, size)
+        super().set_font_size(size)
         if self.customizable_figure != 2:
             return
         self.option_font_size.set_font_size(size)
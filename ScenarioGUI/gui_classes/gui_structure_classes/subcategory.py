@@ -47,8 +47,11 @@ class Subcategory(Category):
         .. figure:: _static/Example_Category.PNG
         """
         self.label_text: list[str] = [label] if isinstance(label, str) else label
-        self.frame: QtW.QFrame = QtW.QFrame(self.default_parent)
-        self.label: QtW.QLabel = QtW.QLabel(self.frame)
+        self.frame: QtW.QFrame | None = None
+        self.label: QtW.QLabel | None = None
+        # label text and visibility until the frame is created
+        self._text: str = self.label_text[0]
+        self._hidden: bool = False
         self.list_of_options: list[Option | Hint | FunctionButton] = []
         self.graphic_left: QtW.QGraphicsView | bool | None = None
         self.graphic_right: QtW.QGraphicsView | bool | None = None
@@ -58,7 +58,9 @@ class TextBox(Option):
         super().__init__(label, default_text, category)
         self.password: bool = password
         self.wrong_value: str = wrong_value
-        self.widget: QtW.QLineEdit = QtW.QLineEdit(self.default_parent, textChanged=self.valueChanged.emit)
+        self.widget: QtW.QLineEdit | None = None
+        # text until the widget is created
+        self._value: str = default_text
 
     def get_value(self) -> str:
         """
@@ -69,6 +71,8 @@ class TextBox(Option):
         str
             Value of the TextBox
         """
+        if self.widget is None:
+            return self._value
         return self.widget.text()
 
     def set_value(self, value: str) -> None:
@@ -84,6 +88,11 @@ class TextBox(Option):
         -------
         None
         """
+        if self.widget is None:
+            if value != self._value:
+                self._value = value
+                self.valueChanged.emit()
+            return
         self.widget.setText(value)
 
     def _check_value(self) -> bool:
@@ -162,6 +171,20 @@ class TextBox(Option):
         """
         return ft_partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the TextBox widget in its frame with the stored text.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = QtW.QLineEdit(self.frame)
+        self.widget.setText(self._value)
+        if self.password:
+            self.widget.setEchoMode(QtW.QLineEdit.Password)
+        self.widget.textChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -190,16 +213,12 @@ class TextBox(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f'QDoubleSpinBox{"{"}selection-color: {globs.WHITE};selection-background-color: {globs.LIGHT};'
             f'border: 1px solid {globs.WHITE};font: {globs.FONT_SIZE}pt "{globs.FONT}";{"}"}'
         )
         self.widget.setAlignment(QtC.Qt.AlignRight | QtC.Qt.AlignTrailing | QtC.Qt.AlignVCenter)
         self.widget.setProperty("showGroupSeparator", True)
-        self.widget.setText(self.default_value)
-        if self.password:
-            self.widget.setEchoMode(QtW.QLineEdit.Password)
         if self.limit_size:
             self.widget.setMaximumWidth(150)
             self.widget.setMinimumWidth(150)
@@ -55,7 +55,9 @@ class TextBoxMultiLine(Option):
         """
         super().__init__(label, default_text, category)
         self.wrong_value: str = wrong_value
-        self.widget: QtW.QTextEdit = QtW.QTextEdit(self.default_parent, textChanged=self.valueChanged.emit)
+        self.widget: QtW.QTextEdit | None = None
+        # text until the widget is created
+        self._value: str = default_text
 
     def get_value(self) -> str:
         """
@@ -66,6 +68,8 @@ class TextBoxMultiLine(Option):
         str
             Value of the TextBox
         """
+        if self.widget is None:
+            return self._value
         return self.widget.toPlainText()
 
     def set_value(self, value: str) -> None:
@@ -81,6 +85,11 @@ class TextBoxMultiLine(Option):
         -------
         None
         """
+        if self.widget is None:
+            if value != self._value:
+                self._value = value
+                self.valueChanged.emit()
+            return
         self.widget.setText(value)
 
     def _check_value(self) -> bool:
@@ -159,6 +168,18 @@ class TextBoxMultiLine(Option):
         """
         return ft_partial(self.check_linked_value, value, value_if_hidden)
 
+    def _init_widget(self) -> None:
+        """
+        This function creates the TextBoxMultiLine widget in its frame with the stored text.
+
+        Returns
+        -------
+        None
+        """
+        self.widget = QtW.QTextEdit(self.frame)
+        self.widget.setText(self._value)
+        self.widget.textChanged.connect(self.valueChanged.emit)
+
     def create_widget(
         self,
         frame: QtW.QFrame,
@@ -187,7 +208,6 @@ class TextBoxMultiLine(Option):
         None
         """
         layout = self.create_frame(frame, layout_parent)
-        self.widget.setParent(self.frame)
         self.widget.setStyleSheet(
             f"QTextEdit{'{'}border: 3px solid {globs.LIGHT};border-radius: 5px;color: {globs.WHITE};gridline-color: {globs.LIGHT};background-color: {globs.LIGHT};font-weight:500;\n"
             f"selection-background-color: {globs.LIGHT_SELECT};{'}'}\n"
@@ -195,7 +215,6 @@ class TextBoxMultiLine(Option):
         )
         self.widget.setAlignment(QtC.Qt.AlignmentFlag.AlignRight)
         self.widget.setProperty("showGroupSeparator", True)
-        self.widget.setText(self.default_value)
         if self.limit_size:
             self.widget.setMaximumWidth(500)
             self.widget.setMinimumWidth(150)
@@ -48,10 +48,11 @@ class ValueHint(Hint):
 
         """
         super().__init__(hint, category, warning)
-        self.label.setParent(None)
-        self.frame: QtW.QFrame = QtW.QFrame(self.default_parent)
-        self.label: list[QtW.QLabel] = [QtW.QLabel(self.default_parent), QtW.QLabel(self.default_parent), QtW.QLabel(self.default_parent)]
+        self.frame: QtW.QFrame | None = None
+        self.label: list[QtW.QLabel] | None = None
         self.default_value: float = default_value
+        # value text until the labels are created
+        self._value_text: str = f"{self.default_value:.2f}"
 
     def create_widget(
         self,
@@ -80,7 +81,11 @@ class ValueHint(Hint):
         -------
         None
         """
-        self.frame.setParent(frame)
+        self.frame = QtW.QFrame(frame)
+        self.frame.hide() if self._hidden else None
+        self.label = [QtW.QLabel(self.frame) for _ in range(3)]
+        self.set_text(self._text)
+        self.label[1].setText(self._value_text)
         self.frame.setFrameShape(QtW.QFrame.StyledPanel)
         self.frame.setFrameShadow(QtW.QFrame.Raised)
         self.frame.setStyleSheet("QFrame{\n" f" border: 0px solid {globs.WHITE};\n" f"	border-radius: 0px;\n{'}'}")
@@ -99,9 +104,6 @@ class ValueHint(Hint):
         spacer = QtW.QSpacerItem(1, 1, QtW.QSizePolicy.Expanding, QtW.QSizePolicy.Minimum)
         layout.addItem(spacer)
 
-        self.set_text(self.hint[0])
-        self.label[1].setText(f"{self.default_value:.2f}")
-
     def hide(self) -> None:
         """
         This function makes the Hint invisible.
@@ -110,7 +112,9 @@ class ValueHint(Hint):
         -------
         None
         """
-        self.frame.hide()
+        self._hidden = True
+        if self.frame is not None:
+            self.frame.hide()
 
     def show(self) -> None:
         """
@@ -120,7 +124,9 @@ class ValueHint(Hint):
         -------
         None
         """
-        self.frame.show()
+        self._hidden = False
+        if self.frame is not None:
+            self.frame.show()
 
     def is_hidden(self) -> bool:
         """
@@ -131,6 +137,8 @@ class ValueHint(Hint):
         Bool
             True if the option is hidden
         """
+        if self.frame is None:
+            return self._hidden
         return self.frame.isHidden()
 
     def set_text(self, name: str):
@@ -147,6 +155,9 @@ class ValueHint(Hint):
         None
         """
         before_value, after_name = name.split(",")
+        self._text = name
+        if self.label is None:
+            return
         self.label[0].setText(before_value)
         self.label[2].setText(after_name)
 
@@ -164,7 +175,9 @@ class ValueHint(Hint):
         -------
         None
         """
-        self.label[1].setText(f"{value}")
+        self._value_text = f"{value}"
+        if self.label is not None:
+            self.label[1].setText(self._value_text)
 
     def set_font_size(self, size: int) -> None:
         """
@@ -178,7 +191,7 @@ class ValueHint(Hint):
         -------
 
         """
-        _ = [change_font_size(label, size, False) for label in self.label]
+        _ = [change_font_size(label, size, False) for label in self.label] if self.label is not None else None
 
     def __repr__(self):
-        return f"{type(self).__name__}; Hint: {self.label[0].text()}; Warning: {self.warning}"
+        return f"{type(self).__name__}; Hint: {self._text.split(',')[0]}; Warning: {self.warning}"
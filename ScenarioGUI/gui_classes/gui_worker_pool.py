@@ -0,0 +1,478 @@
+"""
+This document contains the worker pool which is used to calculate the different scenarios in
+long-lived external processes, so the interpreter start-up and the imports of the calculation
+are only paid once per worker and not once per scenario.
+"""
+from __future__ import annotations
+
+import atexit
+import inspect
+import multiprocessing as mp
+import multiprocessing.util  # noqa: F401 registers the exit function of multiprocessing before shutdown_pools
+import threading
+import time
+import weakref
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import gui_shared_arrays
+from .gui_execution_backend import ExecutionBackend
+from .gui_run_statistics import RunProfiler, RunStatistics
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+
+    from .gui_data_storage import DataStorage
+
+
+class PartialResults(NamedTuple):
+    """
+    message of a worker process with a snapshot of the results of a running calculation
+    """
+
+    results: object
+
+
+class SharedResults(NamedTuple):
+    """
+    message of a worker process with the results of which the large arrays are shared by memory-mapped files
+    """
+
+    debug_message: Exception | str
+    payload: bytes
+
+
+def calculation_kwargs(
+    func: Callable, progress: Callable[[float], None], partial_results: Callable[[object], None]
+) -> dict[str, Callable[[float], None] | Callable[[object], None]]:
+    """
+    This function creates the keyword arguments for the function returned by the data_2_results_function.
+    If it has a progress argument, it gets a function to be called with the fraction (between 0 and 1) of the
+    calculation which is finished. If it has a partial_results argument, it gets a function to be called with a
+    snapshot of the results which are calculated so far.
+
+    Parameters
+    ----------
+    func : Callable
+        function returned by the data_2_results_function
+    progress : Callable[[float], None]
+        function which reports the progress
+    partial_results : Callable[[object], None]
+        function which reports the partial results
+
+    Returns
+    -------
+    dict[str, Callable[[float], None] | Callable[[object], None]]
+        keyword arguments of the calculation function
+    """
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):  # pragma: no cover
+        return {}
+    kwargs: dict[str, Callable[[float], None] | Callable[[object], None]] = {}
+    if "progress" in parameters:
+        kwargs["progress"] = throttle_progress(progress)
+    if "partial_results" in parameters:
+        kwargs["partial_results"] = throttle_partial_results(partial_results)
+    return kwargs
+
+
+def throttle_progress(report: Callable[[float], None], step: float = 0.01) -> Callable[[float], None]:
+    """
+    This function creates a progress function which limits the progress to values between 0 and 1 and only reports
+    it if it changed by at least the step, so a calculation can report its progress as often as it wants.
+
+    Parameters
+    ----------
+    report : Callable[[float], None]
+        function which reports the progress
+    step : float
+        minimal change of the progress to be reported
+
+    Returns
+    -------
+    Callable[[float], None]
+        progress function to be passed to the calculation
+    """
+    last: list[float] = [-1.0]
+
+    def progress(value: float) -> None:
+        value = min(max(float(value), 0.0), 1.0)
+        if abs(value - last[0]) < step and value < 1:
+            return
+        last[0] = value
+        report(value)
+
+    return progress
+
+
+def throttle_partial_results(report: Callable[[object], None], interval: float = 1.0) -> Callable[[object], None]:
+    """
+    This function creates a partial results function which reports the partial results at most once per interval.
+
+    Parameters
+    ----------
+    report : Callable[[object], None]
+        function which reports the partial results
+    interval : float
+        minimal time between two reported partial results in seconds
+
+    Returns
+    -------
+    Callable[[object], None]
+        partial results function to be passed to the calculation
+    """
+    last: list[float] = [-interval]
+
+    def partial_results(results: object) -> None:
+        now = time.monotonic()
+        if now - last[0] < interval:
+            return
+        last[0] = now
+        report(results)
+
+    return partial_results
+
+
+def send_partial_results(connection: Connection, results: object) -> None:
+    """
+    This function sends a snapshot of the results to the main process. It is skipped if the results can not be pickled.
+
+    Parameters
+    ----------
+    connection : Connection
+        connection to the main process
+    results : object
+        partial results of the calculation
+
+    Returns
+    -------
+    None
+    """
+    try:
+        connection.send(PartialResults(results))
+    except Exception:  # pragma: no cover
+        return
+
+
+def work(data_2_results_function: Callable[[DataStorage], tuple[object, Callable]], connection: Connection) -> None:
+    """
+    This function is the loop of a worker process.
+    It receives DataStorages (together with the minimal size of the arrays to be shared and whether the memory should be
+    traced) over the connection, calculates them and sends back the RunStatistics, the debug message and the results
+    until None is received or the connection is closed.
+    In between, the progress of the calculation is sent as float and the partial results as PartialResults.
+
+    Parameters
+    ----------
+    data_2_results_function : Callable
+        function to create the results class and a function to be called in the thread
+    connection : Connection
+        connection to the main process
+
+    Returns
+    -------
+    None
+    """
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        d_s, share_arrays_above, trace_memory = message
+        # a list of DataStorages is calculated by a batch function
+        profiler = RunProfiler(trace_memory, scenarios=len(d_s) if isinstance(d_s, list) else 1)
+        try:
+            with profiler:
+                results, func = data_2_results_function(d_s)
+                func(**calculation_kwargs(func, connection.send, partial(send_partial_results, connection)))
+        except Exception as err:
+            connection.send(profiler.statistics)
+            send_results(connection, err, None)
+            continue
+        connection.send(profiler.statistics)
+        send_results(connection, "", results, share_arrays_above)
+
+
+def send_results(connection: Connection, debug_message: Exception | str, results: object | None, share_arrays_above: int | None = None) -> None:
+    """
+    This function sends the debug message and the results to the main process.
+    If they can not be pickled, the error is send as a string instead.
+
+    Parameters
+    ----------
+    connection : Connection
+        connection to the main process
+    debug_message : Exception | str
+        error of the calculation or an empty string
+    results : object | None
+        results of the calculation
+    share_arrays_above : int | None
+        minimal size in bytes of the arrays in the results which are shared by memory-mapped files
+        (None to pickle all arrays)
+
+    Returns
+    -------
+    None
+    """
+    try:
+        if share_arrays_above is not None and results is not None:
+            connection.send(SharedResults(debug_message, gui_shared_arrays.dumps(results, share_arrays_above)))
+            return
+        connection.send((debug_message, results))
+    except Exception as err:
+        connection.send((f"{err}" if not debug_message else f"{debug_message}", None))
+
+
+class Worker:
+    """
+    class of a single long-lived worker process
+    """
+
+    def __init__(self, data_2_results_function: Callable[[DataStorage], tuple[object, Callable]]):
+        """
+        This function starts the worker process.
+
+        Parameters
+        ----------
+        data_2_results_function : Callable
+            function to create the results class and a function to be called in the thread
+        """
+        self.connection, child_connection = mp.Pipe()
+        self.process: mp.Process = mp.Process(target=work, args=(data_2_results_function, child_connection))
+        self.process.start()
+        # only the worker should hold its end of the pipe so a crash is noticed as EOFError
+        child_connection.close()
+
+    def terminate(self) -> None:
+        """
+        This function kills the worker process and removes the memory-mapped files which it has written for results
+        that have not been read.
+
+        Returns
+        -------
+        None
+        """
+        self.process.terminate()
+        self.process.join(1)
+        self.connection.close()
+        gui_shared_arrays.remove_files(self.process.pid) if self.process.pid is not None else None
+
+    def close(self) -> None:
+        """
+        This function asks the worker process to finish and kills it if it does not.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):  # pragma: no cover
+            pass
+        self.process.join(1)
+        self.terminate()
+
+
+def shutdown_workers(workers: set[Worker]) -> None:
+    """
+    This function closes all the given workers.
+
+    Parameters
+    ----------
+    workers : set[Worker]
+        workers to be closed
+
+    Returns
+    -------
+    None
+    """
+    for worker in list(workers):
+        worker.close()
+    workers.clear()
+
+
+def shutdown_pools() -> None:
+    """
+    This function closes the workers of all the worker pools. It is called when the application is closed,
+    and it is registered after the exit function of multiprocessing, so it runs before multiprocessing waits for the
+    (idle) worker processes.
+
+    Returns
+    -------
+    None
+    """
+    for pool in list(POOLS):
+        pool.shutdown()
+
+
+POOLS: weakref.WeakSet[WorkerPool] = weakref.WeakSet()
+atexit.register(shutdown_pools)
+
+
+class WorkerPool(ExecutionBackend):
+    """
+    class of a pool of long-lived worker processes which calculate the scenarios.
+    A worker is only recycled (killed and replaced) if its calculation crashed or exceeded the time out.
+    """
+
+    def __init__(
+        self,
+        data_2_results_function: Callable[[DataStorage], tuple[object, Callable]],
+        size: int = 1,
+        share_arrays_above: int | None = None,
+        trace_memory: bool = False,
+    ):
+        """
+        This function initialises the worker pool. The workers are started when they are needed.
+
+        Parameters
+        ----------
+        data_2_results_function : Callable
+            function to create the results class and a function to be called in the thread
+        size : int
+            maximal number of worker processes
+        share_arrays_above : int | None
+            minimal size in bytes of the NumPy arrays in the results which are passed by memory-mapped files
+            instead of being pickled through the pipe (None to pickle all arrays)
+        trace_memory : bool
+            True if the peak memory of the calculations should be traced (which slows down the allocations)
+        """
+        self.data_2_results_function = data_2_results_function
+        self.size: int = max(size, 1)
+        self.share_arrays_above: int | None = share_arrays_above
+        self.trace_memory: bool = trace_memory
+        self._workers: set[Worker] = set()
+        self._idle_workers: list[Worker] = []
+        self._condition = threading.Condition()
+        # make sure no worker keeps the application alive when the pool is deleted or the application is closed
+        weakref.finalize(self, shutdown_workers, self._workers).atexit = False
+        POOLS.add(self)
+
+    @property
+    def n_workers(self) -> int:
+        """number of started worker processes"""
+        return len(self._workers)
+
+    def resize(self, size: int) -> None:
+        """
+        This function sets the maximal number of worker processes.
+        Idle workers above the new size are closed, busy ones are closed when their calculation is finished.
+
+        Parameters
+        ----------
+        size : int
+            maximal number of worker processes
+
+        Returns
+        -------
+        None
+        """
+        with self._condition:
+            self.size = max(size, 1)
+            while self._idle_workers and len(self._workers) > self.size:
+                self._remove(self._idle_workers.pop(), kill=False)
+            self._condition.notify_all()
+
+    def _remove(self, worker: Worker, kill: bool) -> None:
+        self._workers.discard(worker)
+        worker.terminate() if kill else worker.close()
+
+    def _acquire(self, deadline: float | None = None) -> Worker | None:
+        with self._condition:
+            while True:
+                if self._idle_workers:
+                    return self._idle_workers.pop()
+                if len(self._workers) < self.size:
+                    worker = Worker(self.data_2_results_function)
+                    self._workers.add(worker)
+                    return worker
+                if not self._condition.wait(None if deadline is None else max(deadline - time.monotonic(), 0)):
+                    return None
+
+    def _release(self, worker: Worker, recycle: bool = False) -> None:
+        with self._condition:
+            if recycle or len(self._workers) > self.size:
+                self._remove(worker, kill=recycle)
+            else:
+                self._idle_workers.append(worker)
+            self._condition.notify()
+
+    def run(
+        self,
+        d_s: DataStorage,
+        time_out: float | None,
+        progress: Callable[[float], None] | None = None,
+        partial_results: Callable[[object], None] | None = None,
+        statistics: Callable[[RunStatistics], None] | None = None,
+    ) -> tuple[Exception | str, object | None]:
+        """
+        This function calculates the DataStorage in one of the worker processes.
+        It blocks until the results are available, the time out is exceeded or the worker crashed.
+        The time out includes the time waiting for a free worker.
+
+        Parameters
+        ----------
+        d_s : DataStorage
+            DataStorage object with all the date to perform the calculation for
+        time_out : float | None
+            maximal run time in seconds (None for no time out)
+        progress : Callable[[float], None] | None
+            function which is called with the progress reported by the calculation
+        partial_results : Callable[[object], None] | None
+            function which is called with the partial results reported by the calculation
+        statistics : Callable[[RunStatistics], None] | None
+            function which is called with the run statistics measured in the worker process
+
+        Returns
+        -------
+        tuple[Exception | str, object | None]
+            debug message and the results
+        """
+        time_out_message = f"{RuntimeError(f'RuntimeError: run time > {time_out}s')}"
+        deadline = None if time_out is None else time.monotonic() + time_out
+        worker = self._acquire(deadline)
+        if worker is None:
+            return time_out_message, None
+        try:
+            worker.connection.send((d_s, self.share_arrays_above, self.trace_memory))
+            while True:
+                if not worker.connection.poll(None if deadline is None else max(deadline - time.monotonic(), 0)):
+                    self._release(worker, recycle=True)
+                    return time_out_message, None
+                message = worker.connection.recv()
+                if isinstance(message, PartialResults):
+                    partial_results(message.results) if partial_results is not None else None
+                    continue
+                if isinstance(message, RunStatistics):
+                    statistics(message) if statistics is not None else None
+                    continue
+                if not isinstance(message, float):
+                    break
+                progress(message) if progress is not None else None
+        except (EOFError, OSError):
+            worker.process.join(1)
+            self._release(worker, recycle=True)
+            return f"{RuntimeError(f'RuntimeError: calculation process crashed (exit code {worker.process.exitcode})')}", None
+        self._release(worker)
+        if not isinstance(message, SharedResults):
+            return message
+        try:
+            return message.debug_message, gui_shared_arrays.loads(message.payload)
+        except Exception as err:  # pragma: no cover
+            return f"{err}", None
+
+    def shutdown(self) -> None:
+        """
+        This function closes all the worker processes.
+
+        Returns
+        -------
+        None
+        """
+        with self._condition:
+            self._idle_workers.clear()
+            shutdown_workers(self._workers)
@@ -68,6 +68,15 @@ class Translations:  # pragma: no cover
         "label_Continue",
         "label_ContinueText",
         "label_ContinueTitle",
+        "action_parameter_sweep",
+        "label_sweep_columns",
+        "label_sweep_design",
+        "label_sweep_designs",
+        "label_sweep_n_samples",
+        "label_sweep_calculate",
+        "label_sweep_no_option",
+        "action_run_statistics",
+        "label_run_statistics_columns",
     )
 
     def __init__(self):
@@ -154,3 +163,12 @@ class Translations:  # pragma: no cover
             "Möchten Sie das Projekt speichern bevor sie fortfahren?",
         ]
         self.label_ContinueTitle: list[str] = ["Warning", "Warnung"]
+        self.action_parameter_sweep: list[str] = ["Parameter sweep", "Parametervariation"]
+        self.label_sweep_columns: list[str] = ["Option,Values,Minimum,Maximum,Number", "Option,Werte,Minimum,Maximum,Anzahl"]
+        self.label_sweep_design: list[str] = ["Design", "Versuchsplan"]
+        self.label_sweep_designs: list[str] = ["full factorial,Latin hypercube,one-at-a-time", "vollfaktoriell,Latin-Hypercube,einzeln variiert"]
+        self.label_sweep_n_samples: list[str] = ["Number of Latin hypercube scenarios", "Anzahl der Latin-Hypercube-Szenarien"]
+        self.label_sweep_calculate: list[str] = ["Calculate the scenarios", "Szenarien berechnen"]
+        self.label_sweep_no_option: list[str] = ["Select at least one option", "Wählen Sie mindestens eine Option aus"]
+        self.action_run_statistics: list[str] = ["Run statistics", "Laufstatistik"]
+        self.label_run_statistics_columns: list[str] = ["Scenario,Wall time [s],CPU time [s],CPU usage [-],Peak memory [MB],Peak RSS [MB],Scenarios per run", "Szenario,Laufzeit [s],CPU-Zeit [s],CPU-Auslastung [-],Spitzenspeicher [MB],Spitzen-RSS [MB],Szenarien pro Lauf"]
@@ -7,13 +7,50 @@ from platform import system
 import ScenarioGUI.global_settings as globs
 
 
+def find_icon_folder(gui_file: Path, path_2_icons: str) -> Path:
+    """
+    This function finds the folder with the icons folder. The path to the icons is checked relative to the parent
+    folder of the config file first, then relative to the config file itself and last in the ScenarioGUI package.
+    Only if the icons are not found there, the file system is searched.
+
+    Parameters
+    ----------
+    gui_file : Path
+        config file
+    path_2_icons : str
+        path to the folder with the icons folder, which is given in the config file
+
+    Returns
+    -------
+    Path
+        folder with the icons folder
+    """
+    for folder in (gui_file.parent.parent.joinpath(path_2_icons), gui_file.parent.joinpath(path_2_icons), globs.path):
+        if folder.joinpath("icons").is_dir():
+            return folder
+    return globs.get_path_for_file(globs.get_path_for_file(gui_file.parent.parent, path_2_icons).joinpath(path_2_icons), "icons")  # pragma: no cover
+
+
 def load(gui_file: str | Path):
+    """
+    This function loads the settings of the config file.
+    If no VERSION is given, the version is taken from the setup.cfg in the parent folder of the config file or from
+    the metadata of the installed DISTRIBUTION.
+
+    Parameters
+    ----------
+    gui_file : str | Path
+        config file
+
+    Returns
+    -------
+    None
+    """
     config = ConfigParser()
     config.read(gui_file)
+    gui_file = Path(gui_file).absolute()
 
-    globs.FOLDER = globs.get_path_for_file(
-        globs.get_path_for_file(Path(gui_file).parent.parent, config["DEFAULT"]["PATH_2_ICONS"]).joinpath(config["DEFAULT"]["PATH_2_ICONS"]), "icons"
-    )
+    globs.FOLDER = find_icon_folder(gui_file, config["DEFAULT"]["PATH_2_ICONS"])
 
     globs.WHITE = config["COLORS"]["WHITE"]
     globs.LIGHT = config["COLORS"]["LIGHT"]
@@ -32,5 +69,5 @@ def load(gui_file: str | Path):
     try:
         globs.VERSION = config["DEFAULT"]["VERSION"]
     except KeyError:
-        globs.VERSION = globs.find_version(globs.get_path_for_file(Path(gui_file).parent.parent, "setup.cfg"))
+        globs.VERSION = globs.get_version(config["DEFAULT"].get("DISTRIBUTION"), gui_file.parent.parent)
 
@@ -0,0 +1,146 @@
+"""
+script to start a worker server, which calculates scenarios for GUIs on other machines
+(see MainWindow.activate_remote_workers).
+The server receives the DataStorages as dictionaries, calculates them in its worker processes and returns the
+to_dict payloads of the results. The messages are not authenticated, so the server should only be reachable
+in a trusted network.
+
+Examples
+--------
+>>> python -m ScenarioGUI.worker --function my_package.calculation:data_2_results --host 0.0.0.0 --port 8765 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socketserver
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.batch import load_object
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+from ScenarioGUI.gui_classes.gui_execution_backend import receive_message, send_message
+from ScenarioGUI.gui_classes.gui_worker_pool import WorkerPool
+from ScenarioGUI.utils import load as load_config
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+
+class WorkerHandler(socketserver.BaseRequestHandler):
+    """
+    class to handle the connection of a GUI, which sends the scenarios to be calculated one after another
+    """
+
+    server: WorkerServer
+
+    def handle(self) -> None:
+        """
+        This function sends the capacity of the server and calculates the received DataStorages until the connection
+        is closed. In between, the progress of the calculation and its run statistics are sent.
+
+        Returns
+        -------
+        None
+        """
+        send_message(self.request, {"capacity": self.server.pool.size})
+        while True:
+            try:
+                message = receive_message(self.request)
+            except (OSError, ValueError):
+                return
+            debug_message, results = self.server.pool.run(
+                DataStorage.from_values(message["values"]),
+                message["time_out"],
+                lambda progress: send_message(self.request, {"progress": progress}),
+                statistics=lambda statistics: send_message(self.request, {"statistics": statistics.to_dict()}),
+            )
+            try:
+                payload = None if results is None else results.to_dict()  # type: ignore
+                send_message(self.request, {"debug_message": f"{debug_message}", "results": payload})
+            except (TypeError, ValueError) as err:
+                send_message(self.request, {"debug_message": f"{err}", "results": None})
+            except OSError:
+                return
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+    """
+    class of the TCP server with a worker pool, which calculates the scenarios of all connections
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        data_2_results_function: Callable[[DataStorage], tuple[object, Callable[[], None]]],
+        n_workers: int = 1,
+        trace_memory: bool = False,
+    ):
+        """
+        This function initialises the server.
+
+        Parameters
+        ----------
+        address : tuple[str, int]
+            host and port of the server (port 0 for a free port)
+        data_2_results_function : Callable
+            function to create the results class and a function to be called in the worker process
+        n_workers : int
+            number of worker processes, which is the number of scenarios calculated at the same time
+        trace_memory : bool
+            True if the peak memory of the calculations should be traced (which slows down the allocations)
+        """
+        self.pool = WorkerPool(data_2_results_function, n_workers, trace_memory=trace_memory)
+        super().__init__(address, WorkerHandler)
+
+    def server_close(self) -> None:
+        """
+        This function closes the server and its worker processes.
+
+        Returns
+        -------
+        None
+        """
+        super().server_close()
+        self.pool.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    This function starts the worker server from the command line and serves until it is interrupted.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        command line arguments (default: sys.argv)
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(prog="python -m ScenarioGUI.worker", description="Start a worker server which calculates scenarios.")
+    parser.add_argument("-f", "--function", required=True, help="data_2_results_function as 'package.module:name'")
+    parser.add_argument("-c", "--config", help="gui_config.ini of the GUI")
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on (default: 127.0.0.1, use 0.0.0.0 for all interfaces)")
+    parser.add_argument("-p", "--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("-n", "--workers", type=int, default=None, help="number of worker processes (default: number of cores)")
+    parser.add_argument("--trace-memory", action="store_true", help="trace the peak memory of the calculations for the run statistics")
+    args = parser.parse_args(argv)
+    if args.config is not None:
+        load_config(Path(args.config))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with WorkerServer((args.host, args.port), load_object(args.function), args.workers or os.cpu_count() or 1, args.trace_memory) as server:
+        globs.LOGGER.info(f"worker server listening on {server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:  # pragma: no cover
+            return
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
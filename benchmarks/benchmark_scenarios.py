@@ -0,0 +1,306 @@
+"""
+script to benchmark the operations of the GUI which scale with the number of scenarios on a headless Qt platform.
+Every operation is timed with N scenarios in the list (N = 10, 100, 1,000 and 10,000 by default) using the GUI of
+the tests and a calculation model which does nearly nothing, so only the overhead of the GUI is measured.
+The timings can be stored as JSON and compared against a stored baseline to catch regressions.
+
+Examples
+--------
+>>> python -m benchmarks.benchmark_scenarios --output baseline.json
+>>> python -m benchmarks.benchmark_scenarios --baseline baseline.json --tolerance 0.5
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse  # noqa: E402
+import copy  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import platform  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import TYPE_CHECKING, NamedTuple  # noqa: E402
+
+import PySide6.QtWidgets as QtW  # noqa: E402
+from matplotlib import pyplot as plt  # noqa: E402
+
+import ScenarioGUI.global_settings as globs  # noqa: E402
+from ScenarioGUI import load_config  # noqa: E402
+from ScenarioGUI.gui_classes.gui_combine_window import MainWindow  # noqa: E402
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage  # noqa: E402
+from tests.gui_structure_for_tests import GUI  # noqa: E402
+from tests.result_creating_class_for_tests import ResultsClass  # noqa: E402
+from tests.test_translations.translation_class import Translations  # noqa: E402
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000)
+
+
+class Benchmark(NamedTuple):
+    """
+    operation to be timed with the preparation before every timing, which is not timed
+    """
+
+    run: Callable[[], object]
+    setup: Callable[[], object] = lambda: None
+
+
+def no_op_data_2_results(d_s: DataStorage) -> tuple[ResultsClass, Callable[[], None]]:
+    """
+    This function creates the results of the calculation model, which only adds two values.
+
+    Parameters
+    ----------
+    d_s : DataStorage
+        DataStorage of the scenario
+
+    Returns
+    -------
+    tuple[ResultsClass, Callable[[], None]]
+        results and the function to calculate them
+    """
+    results = ResultsClass(d_s.int_a, d_s.float_b)
+    return results, results.adding
+
+
+def create_main_window(n_scenarios: int) -> MainWindow:
+    """
+    This function creates the main window of the test GUI with the given number of calculated scenarios.
+    The scenarios have different inputs, so none of them reuses the results of another one.
+
+    Parameters
+    ----------
+    n_scenarios : int
+        number of scenarios
+
+    Returns
+    -------
+    MainWindow
+    """
+    app = QtW.QApplication.instance() or QtW.QApplication()
+    main_window = MainWindow(
+        QtW.QMainWindow(), app, GUI, Translations, result_creating_class=ResultsClass, data_2_results_function=no_op_data_2_results
+    )
+    main_window.list_widget_scenario.clear()
+    base = DataStorage(main_window.gui_structure)
+    data_storages = []
+    for idx in range(n_scenarios):
+        d_s = copy.copy(base)
+        # values which are not changed by the linked options, so the scenarios are not marked as changed
+        d_s.int_a, d_s.float_b = idx % 10, round(100 + idx // 10 / 100, 2)
+        d_s.results = ResultsClass(d_s.int_a, d_s.float_b)
+        d_s.results.adding()
+        data_storages.append(d_s)
+    main_window.add_scenarios(data_storages, [f"scenario {idx + 1}" for idx in range(n_scenarios)])
+    main_window.list_widget_scenario.setCurrentRow(0)
+    return main_window
+
+
+def close_main_window(main_window: MainWindow) -> None:
+    """
+    This function closes the figures and the worker processes of the main window.
+
+    Parameters
+    ----------
+    main_window : MainWindow
+        main window
+
+    Returns
+    -------
+    None
+    """
+    _ = [d_s.close_figures() for d_s in main_window.list_ds]  # type: ignore
+    main_window.worker_pool.shutdown()
+    plt.close("all")
+
+
+def create_benchmarks(main_window: MainWindow, folder: Path) -> dict[str, Benchmark]:
+    """
+    This function creates the benchmarks of the main window.
+
+    Parameters
+    ----------
+    main_window : MainWindow
+        main window with the scenarios
+    folder : Path
+        folder for the project file
+
+    Returns
+    -------
+    dict[str, Benchmark]
+        benchmarks by their name
+    """
+    gui_structure = main_window.gui_structure
+    file = folder.joinpath(f"benchmark.{globs.FILE_EXTENSION}")
+    rows = [0, max(main_window.list_widget_scenario.count() - 1, 0)]
+
+    def set_values() -> None:
+        main_window.checking = False
+        main_window.list_ds[0].set_values(gui_structure)
+        main_window.checking = True
+
+    def scenario_is_changed() -> None:
+        # switch between the first and the last scenario
+        rows.reverse()
+        main_window.list_widget_scenario.setCurrentRow(rows[0])
+
+    def show_results() -> None:
+        d_s = main_window.list_widget_scenario.currentItem().data(MainWindow.role)
+        d_s.close_figures()
+        d_s.results = ResultsClass(d_s.int_a, d_s.float_b)
+        d_s.results.adding()
+
+    def remove_results() -> None:
+        _ = [setattr(d_s, "results", None) for d_s in main_window.list_ds]  # type: ignore
+        main_window.result_memo.clear()
+
+    def calculate() -> None:
+        main_window.start_multiple_scenarios_calculation()
+        _ = [thread.run() for thread in list(main_window.threads)]  # type: ignore
+
+    return {
+        "save": Benchmark(lambda: main_window._save_to_data(file)),
+        "load": Benchmark(lambda: main_window._load_from_data(file), lambda: file.exists() or main_window._save_to_data(file)),
+        "data_storage_init": Benchmark(lambda: DataStorage(gui_structure)),
+        "set_values": Benchmark(set_values),
+        "scenario_is_changed": Benchmark(scenario_is_changed),
+        "change": Benchmark(main_window.change),
+        "display_results": Benchmark(main_window.display_results, show_results),
+        "change_language": Benchmark(main_window.change_language),
+        "calculation": Benchmark(calculate, remove_results),
+    }
+
+
+def measure(benchmark: Benchmark, repeat: int) -> dict[str, float]:
+    """
+    This function times the benchmark several times.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        benchmark to be timed
+    repeat : int
+        number of timings
+
+    Returns
+    -------
+    dict[str, float]
+        minimal and median time in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        timings.append(time.perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings)}
+
+
+def run_benchmarks(sizes: tuple[int, ...] | list[int] = SIZES, repeat: int = 5, names: list[str] | None = None) -> dict:
+    """
+    This function runs the benchmarks for every number of scenarios.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] | list[int]
+        numbers of scenarios
+    repeat : int
+        number of timings per benchmark
+    names : list[str] | None
+        names of the benchmarks to be run (None for all)
+
+    Returns
+    -------
+    dict
+        JSON serializable report with the timings per benchmark and number of scenarios
+    """
+    # the calculation threads are run directly instead of being started
+    MainWindow.TEST_MODE = True
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for n_scenarios in sizes:
+        main_window = create_main_window(n_scenarios)
+        with tempfile.TemporaryDirectory() as folder:
+            for name, benchmark in create_benchmarks(main_window, Path(folder)).items():
+                if names is not None and name not in names:
+                    continue
+                results.setdefault(name, {})[f"{n_scenarios}"] = measure(benchmark, repeat)
+                globs.LOGGER.info(f"{name:<20} N={n_scenarios:<6} {results[name][f'{n_scenarios}']['min'] * 1_000:10.2f} ms")
+        close_main_window(main_window)
+    return {"version": globs.VERSION, "python": platform.python_version(), "platform": platform.platform(), "repeat": repeat, "results": results}
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.5) -> list[str]:
+    """
+    This function compares the minimal timings of the report with the ones of the baseline.
+
+    Parameters
+    ----------
+    report : dict
+        report of run_benchmarks
+    baseline : dict
+        stored report of run_benchmarks
+    tolerance : float
+        allowed relative increase of the time
+
+    Returns
+    -------
+    list[str]
+        descriptions of the benchmarks which are slower than the baseline
+    """
+    regressions = []
+    for name, timings in report["results"].items():
+        for n_scenarios, timing in timings.items():
+            reference = baseline["results"].get(name, {}).get(n_scenarios)
+            if reference is None:
+                continue
+            if timing["min"] > reference["min"] * (1 + tolerance):
+                regressions.append(f"{name} (N={n_scenarios}): {timing['min'] * 1_000:.2f} ms instead of {reference['min'] * 1_000:.2f} ms")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    This function runs the benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        command line arguments (default: sys.argv)
+
+    Returns
+    -------
+    int
+        exit code, which is 1 if a benchmark is slower than the baseline
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.benchmark_scenarios", description="Benchmark the GUI with many scenarios.")
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=list(SIZES), help="numbers of scenarios (default: 10 100 1000 10000)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of timings per benchmark (default: 5)")
+    parser.add_argument("-b", "--benchmarks", nargs="+", default=None, help="names of the benchmarks to be run (default: all)")
+    parser.add_argument("-o", "--output", help="JSON file to store the timings in")
+    parser.add_argument("--baseline", help="JSON file with the timings to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative increase of the time (default: 0.5)")
+    args = parser.parse_args(argv)
+    load_config(Path(__file__).absolute().parent.parent.joinpath("tests", "gui_config.ini"))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = run_benchmarks(args.sizes, args.repeat, args.benchmarks)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=1)
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as file:
+        regressions = compare(report, json.load(file), args.tolerance)
+    _ = [globs.LOGGER.error(f"regression: {regression}") for regression in regressions]  # type: ignore
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+script to benchmark the startup of the GUI on a headless Qt platform with and without the lazy creation of the pages (Page.LAZY).
+The startup is the creation of the main window of the test GUI. With Page.LAZY, the widgets of a page are only created
+once the page is shown, so the time to show all the pages afterwards is timed as well.
+
+Examples
+--------
+>>> python -m benchmarks.benchmark_startup
+>>> python -m benchmarks.benchmark_startup --repeat 10 --output startup.json
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import platform  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import PySide6.QtWidgets as QtW  # noqa: E402
+
+import ScenarioGUI.global_settings as globs  # noqa: E402
+from ScenarioGUI import load_config  # noqa: E402
+from ScenarioGUI.gui_classes.gui_combine_window import MainWindow  # noqa: E402
+from ScenarioGUI.gui_classes.gui_structure_classes import Page  # noqa: E402
+from tests.gui_structure_for_tests import GUI  # noqa: E402
+from tests.result_creating_class_for_tests import ResultsClass  # noqa: E402
+from tests.test_translations.translation_class import Translations  # noqa: E402
+
+from .benchmark_scenarios import close_main_window, no_op_data_2_results  # noqa: E402
+
+
+def measure_startup(lazy: bool) -> dict[str, float]:
+    """
+    This function times the creation of the main window and showing all its pages afterwards.
+
+    Parameters
+    ----------
+    lazy : bool
+        True if the pages are created lazily (see Page.LAZY)
+
+    Returns
+    -------
+    dict[str, float]
+        time in seconds to create the main window and to show all pages afterwards
+    """
+    app = QtW.QApplication.instance() or QtW.QApplication()
+    Page.LAZY = lazy
+    try:
+        start = time.perf_counter()
+        main_window = MainWindow(
+            QtW.QMainWindow(), app, GUI, Translations, result_creating_class=ResultsClass, data_2_results_function=no_op_data_2_results
+        )
+        startup = time.perf_counter() - start
+        start = time.perf_counter()
+        _ = [page.button.click() for page in main_window.gui_structure.list_of_pages]  # type: ignore
+        all_pages = time.perf_counter() - start
+    finally:
+        Page.LAZY = False
+    close_main_window(main_window)
+    return {"startup": startup, "all_pages": all_pages}
+
+
+def run_benchmarks(repeat: int = 5) -> dict:
+    """
+    This function times the startup with and without the lazy creation of the pages.
+
+    Parameters
+    ----------
+    repeat : int
+        number of timings per mode
+
+    Returns
+    -------
+    dict
+        JSON serializable report with the minimal and median timings per mode
+    """
+    MainWindow.TEST_MODE = True
+    # the first main window also imports and initializes Qt and matplotlib, so it is not timed
+    measure_startup(False)
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        timings = [measure_startup(lazy) for _ in range(repeat)]
+        for name in ("startup", "all_pages"):
+            values = [timing[name] for timing in timings]
+            results.setdefault(name, {})[mode] = {"min": min(values), "median": statistics.median(values)}
+            globs.LOGGER.info(f"{name:<10} {mode:<6} {min(values) * 1_000:10.2f} ms")
+    return {"version": globs.VERSION, "python": platform.python_version(), "platform": platform.platform(), "repeat": repeat, "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    This function runs the startup benchmark from the command line.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        command line arguments (default: sys.argv)
+
+    Returns
+    -------
+    int
+        exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.benchmark_startup", description="Benchmark the startup of the GUI with and without Page.LAZY.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="number of timings per mode (default: 5)")
+    parser.add_argument("-o", "--output", help="JSON file to store the timings in")
+    args = parser.parse_args(argv)
+    load_config(Path(__file__).absolute().parent.parent.joinpath("tests", "gui_config.ini"))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = run_benchmarks(args.repeat)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=1)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
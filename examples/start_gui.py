@@ -70,6 +70,7 @@ def run(path_list=None):  # pragma: no cover
 
     main_window.add_other_version_import_function("v0.0.1", other_version_import)
     main_window.activate_load_as_new_scenarios()
+    main_window.activate_result_cache(model_version="1")
 
     # show window
     window.showMaximized()
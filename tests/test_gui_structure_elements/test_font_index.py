@@ -0,0 +1,49 @@
+import shutil
+from pathlib import Path
+
+import matplotlib
+import matplotlib.font_manager as fm
+import pytest
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.gui_classes.gui_structure_classes.font_index import FONT_INDEX, FontIndex
+
+FONTS = Path(matplotlib.get_data_path()).joinpath("fonts", "ttf")
+
+
+def test_font_index_is_cached(tmp_path, monkeypatch):
+    folder = tmp_path.joinpath("fonts")
+    folder.mkdir()
+    shutil.copy(FONTS.joinpath("DejaVuSans.ttf"), folder)
+    cache_file = tmp_path.joinpath("cache", "fonts.json")
+    font_index = FontIndex(cache_file, [folder])
+    # nothing is searched before the first use
+    assert not cache_file.exists()
+    assert font_index.names == ["DejaVu Sans"]
+    assert font_index.index("dejavu sans") == 0
+    assert font_index.font(0) is font_index.font(0)
+    assert font_index.font(0).get_size() == 12
+    assert cache_file.exists()
+    with pytest.raises(ValueError):
+        font_index.index("not a font")
+
+    # the cache is used if the font folder is unchanged
+    def find_system_fonts(*args, **kwargs):
+        raise AssertionError("the fonts should be loaded from the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(fm, "findSystemFonts", find_system_fonts)
+        assert FontIndex(cache_file, [folder]).names == ["DejaVu Sans"]
+
+    # adding a font invalidates the cache
+    shutil.copy(FONTS.joinpath("DejaVuSerif.ttf"), folder)
+    assert FontIndex(cache_file, [folder]).names == ["DejaVu Sans", "DejaVu Serif"]
+    # a broken cache file is replaced
+    cache_file.write_text("{")
+    assert len(FontIndex(cache_file, [folder])) == 2
+
+
+def test_system_font_index():
+    names = FONT_INDEX.names
+    assert len(names) == len(set(names))
+    assert FONT_INDEX.names_upper[FONT_INDEX.index(globs.FONT)] == globs.FONT.upper()
@@ -0,0 +1,73 @@
+from ScenarioGUI.gui_classes.gui_structure_classes import ButtonBox, Category, FloatBoxWithUnits, IntBox, Page
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_lazy_page(qtbot):
+    Page.LAZY = True
+    try:
+        main_window = start_tests(qtbot)
+        gs = main_window.gui_structure
+        # pages with flexible amount options are created directly
+        assert not gs.page_inputs.can_be_created_lazily()
+        assert gs.page_inputs.categories_created
+        assert gs.page_settings.can_be_created_lazily()
+        assert not gs.page_settings.categories_created
+        created = []
+        gs.page_settings.add_function_called_if_categories_created(lambda: created.append(True))
+        # the values can be used before the categories are created
+        assert gs.option_n_threads.get_value() == 2
+        assert gs.option_toggle_buttons.get_value() == 1
+        gs.option_n_threads.set_value(4)
+        gs.option_auto_saving.set_value(1)
+        gs.category_save_scenario.set_text("Saving")
+        # no widgets are created before the page is shown
+        assert gs.option_n_threads.widget is None
+        assert gs.option_n_threads.frame is None
+        assert gs.option_toggle_buttons.widget is None
+        assert gs.category_save_scenario.label is None
+        assert gs.page_result.can_be_created_lazily()
+        assert gs.figure_results.canvas is None
+        assert gs.figure_results.toolbar is None
+        # the categories are created when the page is shown for the first time
+        gs.page_settings.button.click()
+        assert gs.page_settings.categories_created
+        assert created == [True]
+        assert gs.option_n_threads.widget is not None
+        assert gs.option_n_threads.widget.value() == 4
+        assert gs.option_toggle_buttons.widget[1].isChecked()
+        assert gs.option_n_threads.get_value() == 4
+        assert gs.option_auto_saving.get_value() == 1
+        assert gs.category_save_scenario.label.text() == "Saving"
+        assert gs.figure_results.canvas is None
+        gs.page_result.button.click()
+        assert gs.figure_results.canvas is not None
+        assert gs.figure_results.toolbar is not None
+        gs.page_settings.button.click()
+        assert created == [True]
+        close_tests(main_window, qtbot)
+    finally:
+        Page.LAZY = False
+
+
+def test_widgets_are_only_deferred_on_lazy_pages(qtbot):
+    category = Category("Category", Page("Page", "Page", "Add.svg"))
+    # without Page.LAZY the widgets are created directly after the initialisation of the option
+    option = IntBox(label="Int", default_value=3, category=category)
+    assert option.widget is not None
+    assert option.frame is not None
+    assert option.widget.value() == 3
+    option_units = FloatBoxWithUnits(label="Float", default_value=3.5, category=category, decimal_number=1, units=[("kW", 1), ("W", 0.001)])
+    assert option_units.unit_widget is not None
+    assert option_units.get_value() == (3.5, 0)
+    option_buttons = ButtonBox(label="Buttons", default_index=1, entries=["a", "b"], category=category)
+    assert option_buttons.widget[1].isChecked()
+    assert not option_buttons.is_hidden()
+    Page.LAZY = True
+    try:
+        option = IntBox(label="Int", default_value=3, category=category)
+        assert option.widget is None
+        assert option.frame is None
+        assert option.get_value() == 3
+    finally:
+        Page.LAZY = False
@@ -2,6 +2,7 @@ import pytest
 
 import PySide6.QtWidgets as QtW  # type: ignore
 
+from ScenarioGUI.gui_classes.gui_structure_classes import FontListBox, Page
 from ScenarioGUI.gui_classes.gui_structure_classes.functions import ConditionalVisibilityWarning
 from tests.starting_closing_tests import close_tests, start_tests
 
@@ -51,3 +52,32 @@ def test_list_box(qtbot):
     assert main_window.gui_structure.list_small_2.widget.insertPolicy() == QtW.QComboBox.InsertPolicy.InsertAtBottom
 
     close_tests(main_window, qtbot)
+
+
+def test_font_list_box_lazy_entries(qtbot):
+    # init gui window
+    main_window = start_tests(qtbot)
+    calls = []
+
+    def entries():
+        calls.append("entries")
+        return ["Arial", "Verdana"]
+
+    def default_index():
+        calls.append("default_index")
+        return 1
+
+    Page.LAZY = True
+    try:
+        font_list_box = FontListBox(label="Font", category=main_window.gui_structure.category_grid, entries=entries, default_index=default_index)
+    finally:
+        Page.LAZY = False
+    # the fonts are not searched when the option is created
+    assert calls == []
+    assert font_list_box.get_value() == (1, "Verdana")
+    assert sorted(calls) == ["default_index", "entries"]
+    assert font_list_box.entries == ["Arial", "Verdana"]
+    assert font_list_box.default_value == 1
+    assert len(calls) == 2
+
+    close_tests(main_window, qtbot)
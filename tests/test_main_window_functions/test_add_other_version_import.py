@@ -44,10 +44,7 @@ def test_add_other_version_functions(qtbot):
         get_save_file_name, return_value=(f"{main_window.default_path.joinpath(filename_1)}", f"{global_vars.FILE_EXTENSION} (.{global_vars.FILE_EXTENSION})")
     )
     main_window.fun_save_as()
-    for thread in main_window.saving_threads:
-        thread.start()
-        thread.wait()
-        assert thread.calculated
+    main_window.saver.flush()
     assert filename_1 in main_window.dia.windowTitle()
     old_value = main_window.gui_structure.float_b.get_value()
     qtbot.wait(1000)
@@ -0,0 +1,51 @@
+from ScenarioGUI.gui_classes.gui_background_saver import BackgroundSaver
+
+
+def test_background_saver(qtbot):
+    saver = BackgroundSaver(delay=50)
+    calls: list[int] = []
+    saved: list[str] = []
+    saver.saved.connect(lambda target, duration: saved.append(target))
+    # a burst of saves only writes the latest one
+    for idx in range(50):
+        saver.save("backup", lambda idx=idx: calls.append(idx))
+    assert saver.pending
+    qtbot.waitUntil(lambda: calls == [49] and not saver.running, timeout=2_000)
+    assert saved == ["backup"]
+    assert saver.last_save_time is not None and saver.last_save_duration >= 0
+    # a save without debouncing starts directly together with the pending saves of other targets
+    saver.save("backup", lambda: calls.append(50))
+    saver.save("project", lambda: calls.append(51), debounce=False)
+    qtbot.waitUntil(lambda: calls == [49, 50, 51] and not saver.running, timeout=2_000)
+    # flush writes the pending saves directly and cancel removes them
+    saver.start_threads = False
+    saver.save("backup", lambda: calls.append(52))
+    saver.flush()
+    saver.save("backup", lambda: calls.append(53))
+    saver.cancel()
+    saver.flush()
+    assert calls == [49, 50, 51, 52]
+
+
+def test_background_saver_failed(qtbot, caplog):
+    saver = BackgroundSaver(delay=50, start_threads=False)
+    failed: list[tuple[str, str]] = []
+    saved: list[str] = []
+    saver.failed.connect(lambda target, error: failed.append((target, error)))
+    saver.saved.connect(lambda target, duration: saved.append(target))
+
+    def not_serialisable() -> None:
+        raise TypeError("Object of type set is not JSON serializable")
+
+    def no_file() -> None:
+        raise FileNotFoundError("project")
+
+    # every error of a save is reported and the other saves are still written
+    saver.save("backup", not_serialisable)
+    saver.save("project", no_file)
+    saver.save("other", lambda: None)
+    saver.flush()
+    assert failed == [("backup", "TypeError"), ("project", "FileNotFoundError")]
+    assert saved == ["other"]
+    assert "saving backup failed" in caplog.text
+    assert "saving project failed" not in caplog.text
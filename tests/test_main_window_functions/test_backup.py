@@ -11,9 +11,7 @@ def test_backup(qtbot):
     main_window.gui_structure.int_a.set_value(10)
     main_window.save_scenario()
     list_old = main_window.list_ds.copy()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     main_window.load_backup()
     # check if the imported values are the same
     for ds_old, ds_new in zip(list_old, main_window.list_ds):
@@ -31,9 +29,7 @@ def test_backup(qtbot):
     assert thread.calculated
     main_window.save_scenario()
     list_old = main_window.list_ds.copy()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     main_window.load_backup()
     # check if the imported values are the same
     for ds_old, ds_new in zip(list_old, main_window.list_ds):
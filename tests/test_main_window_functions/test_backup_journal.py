@@ -0,0 +1,99 @@
+import json
+
+import ScenarioGUI.global_settings as globs
+
+from ScenarioGUI.gui_classes.gui_backup_journal import BackupJournal, read_journal
+from ScenarioGUI.gui_classes.gui_project_snapshot import SnapshotCreator
+
+from ..result_creating_class_for_tests import ResultsClass
+from ..starting_closing_tests import close_tests, start_tests
+
+
+class Scenario:
+    def __init__(self, value: int):
+        self.value = value
+        self.results = None
+        self.run_statistics = None
+        self.debug_message = ""
+
+    def to_dict(self) -> dict:
+        return {"value": self.value}
+
+
+META = {"filename": ("", ""), "version": globs.VERSION, "default_path": ""}
+
+
+def expected(names: list[str], scenarios: list[Scenario]) -> dict:
+    return {
+        **META,
+        "filename": list(META["filename"]),
+        "names": names,
+        "values": [d_s.to_dict() for d_s in scenarios],
+        "results": [None if d_s.results is None else d_s.results.to_dict() for d_s in scenarios],
+        "statistics": [None] * len(scenarios),
+    }
+
+
+def test_backup_journal(tmp_path):
+    file = tmp_path.joinpath("backup.guiBackUp")
+    journal = BackupJournal(file, max_records=6)
+    creator = SnapshotCreator()
+    names = [f"scenario {idx}" for idx in range(6)]
+    scenarios = [Scenario(idx) for idx in range(6)]
+
+    def save_and_check(n_lines: int):
+        journal.save(creator.take(names, scenarios, META["filename"], META["default_path"]))
+        assert len(file.read_text().splitlines()) == n_lines
+        assert read_journal(file) == expected(names, scenarios)
+
+    save_and_check(1)
+    # an unchanged project does not write anything
+    save_and_check(1)
+    # only the changed scenario is written
+    names[1] = "renamed"
+    save_and_check(2)
+    assert json.loads(file.read_text().splitlines()[-1]) == {"key": 1, "name": "renamed"}
+    scenarios[2] = Scenario(20)
+    scenarios[0].results = ResultsClass(1, 2)
+    save_and_check(4)
+    names.append("new")
+    scenarios.append(Scenario(6))
+    save_and_check(5)
+    del names[3], scenarios[3]
+    save_and_check(6)
+    names.reverse()
+    scenarios.reverse()
+    save_and_check(7)
+    # an incomplete last record is ignored
+    with open(file, "a") as f:
+        f.write('{"key": 0, "na')
+    assert read_journal(file) == expected(names, scenarios)
+    # the journal is compacted after the maximal number of records
+    names[0] = "compacted"
+    save_and_check(1)
+    # most scenarios changed, so a snapshot is written
+    scenarios = [Scenario(idx) for idx in range(6)]
+    save_and_check(1)
+    # backup files of previous versions are read as well
+    with open(file, "w") as f:
+        json.dump(expected(names, scenarios), f, indent=1)
+    assert read_journal(file) == expected(names, scenarios)
+
+
+def test_auto_save_journal(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.add_scenario()
+    main_window.auto_save()
+    main_window.saver.flush()
+    main_window.add_scenario()
+    main_window.gui_structure.int_a.set_value(5)
+    main_window.save_scenario()
+    main_window.saver.flush()
+    lines = main_window.backup_file.read_text().splitlines()
+    assert len(lines) > 1
+    assert "journal" in json.loads(lines[0])
+    names = [main_window.list_widget_scenario.item(idx).text() for idx in range(main_window.list_widget_scenario.count())]
+    main_window.load_backup()
+    assert [main_window.list_widget_scenario.item(idx).text() for idx in range(main_window.list_widget_scenario.count())] == names
+    assert main_window.list_ds[-1].int_a == 5
+    close_tests(main_window, qtbot)
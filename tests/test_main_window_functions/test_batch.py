@@ -0,0 +1,140 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.batch import calculate_projects, default_values, load_object, main
+from ScenarioGUI.gui_classes.gui_combine_window import normal_import
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+from ScenarioGUI.gui_classes.gui_structure_classes import Page
+
+from ..gui_structure_for_tests import GUI
+from ..result_creating_class_for_tests import ResultsClass, data_2_results
+from ..starting_closing_tests import close_tests, start_tests
+from ..test_translations.translation_class import Translations
+
+
+def create_project(qtbot, filename: str) -> Path:
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.float_b.set_value(102)
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.int_a.set_value(192)
+    gs.aim_sub.widget.click()
+    main_window.save_scenario()
+    # first scenario is already calculated
+    main_window.change_scenario(0)
+    main_window.start_current_scenario_calculation()
+    main_window.threads[-1].run()
+    file = main_window.default_path.joinpath(filename)
+    main_window._save_to_data(file)
+    close_tests(main_window, qtbot)
+    return file
+
+
+def test_from_values(qtbot):
+    main_window = start_tests(qtbot)
+    d_s = main_window.list_ds[0]
+    d_s_headless = DataStorage.from_values(d_s.to_dict())
+    assert d_s_headless == d_s
+    assert d_s_headless.results is None
+    assert all(getattr(d_s_headless, fig) is None for fig in d_s_headless.list_of_figures)
+    close_tests(main_window, qtbot)
+
+
+def test_calculate_projects(qtbot):
+    file = create_project(qtbot, f"batch.{globs.FILE_EXTENSION}")
+    saving = normal_import(file)
+    assert saving["results"][0] is not None
+    assert saving["results"][1] is None
+    result_0 = saving["results"][0]
+
+    assert calculate_projects([file], data_2_results, n_workers=2) == 2
+    saving = normal_import(file)
+    assert saving["results"][0] == result_0
+    assert np.isclose(saving["results"][1]["result"], 104)
+    assert saving["results"][2] is None
+    assert saving["values"][2]["debug_message"] == "Value above 190"
+    assert saving["statistics"][1]["wall_time"] > 0
+    # only the failed scenario is calculated again
+    assert calculate_projects([file], data_2_results, n_workers=2) == 1
+    os.remove(file)
+
+
+def test_calculate_projects_other_version(qtbot):
+    file = create_project(qtbot, f"batch_version.{globs.FILE_EXTENSION}")
+    saving = normal_import(file)
+    saving["version"] = "0.0.1"
+    del saving["values"][1]["int_a"]
+    file.write_text(json.dumps(saving))
+    # without the gui structure, the missing values can not be set
+    with pytest.raises(ValueError, match="0.0.1"):
+        calculate_projects([file], data_2_results, n_workers=1)
+    main_window = start_tests(qtbot)
+    main_window.gui_structure.int_a.set_value(7)
+    assert calculate_projects([file], data_2_results, n_workers=1, gui_structure=main_window.gui_structure) == 2
+    assert np.isclose(normal_import(file)["results"][1]["result"], 109)
+
+    def import_old_version(saving_old: dict) -> dict:
+        saving_old["results"][1] = None
+        saving_old["values"][1]["int_a"] = 3
+        return saving_old
+
+    assert calculate_projects([file], data_2_results, n_workers=1, version_import_functions={"0.0.1": import_old_version}) == 2
+    assert np.isclose(normal_import(file)["results"][1]["result"], 105)
+    close_tests(main_window, qtbot)
+    os.remove(file)
+
+
+def test_batch_command_line(qtbot):
+    file = create_project(qtbot, f"batch_cli.{globs.FILE_EXTENSION}")
+    assert load_object("tests.result_creating_class_for_tests:data_2_results") is data_2_results
+    config = Path(__file__).absolute().parent.parent.joinpath("gui_config.ini")
+    assert main([f"{file}", "--function", "tests.result_creating_class_for_tests:data_2_results", "--config", f"{config}", "-n", "1"]) == 2
+    assert np.isclose(normal_import(file)["results"][1]["result"], 104)
+    os.remove(file)
+
+
+def test_default_values(qtbot):
+    main_window = start_tests(qtbot)
+    defaults = default_values(GUI, Translations)
+    assert not Page.LAZY
+    assert defaults["int_a"] == main_window.gui_structure.int_a.default_value
+    assert DataStorage.from_values(defaults) == DataStorage(main_window.gui_structure)
+    close_tests(main_window, qtbot)
+
+
+def test_batch_command_line_other_version(qtbot):
+    file = create_project(qtbot, f"batch_cli_version.{globs.FILE_EXTENSION}")
+    saving = normal_import(file)
+    saving["version"] = "0.0.1"
+    del saving["values"][1]["int_a"]
+    saving["values"][1]["removed_option"] = 5
+    # results which can not be loaded anymore are calculated again
+    saving["results"][0] = {"wrong": 1}
+    file.write_text(json.dumps(saving))
+    config = Path(__file__).absolute().parent.parent.joinpath("gui_config.ini")
+    argv = [f"{file}", "-f", "tests.result_creating_class_for_tests:data_2_results", "-c", f"{config}", "-n", "1"]
+    with pytest.raises(ValueError, match="--gui-structure"):
+        main(argv)
+    argv += [
+        "--gui-structure",
+        "tests.gui_structure_for_tests:GUI",
+        "--translations",
+        "tests.test_translations.translation_class:Translations",
+        "--result-class",
+        "tests.result_creating_class_for_tests:ResultsClass",
+    ]
+    assert main(argv) == 3
+    saving = normal_import(file)
+    # int_a gets its default value
+    assert np.isclose(saving["results"][1]["result"], 104)
+    assert ResultsClass.from_dict(saving["results"][0])
+    os.remove(file)
@@ -0,0 +1,125 @@
+import numpy as np
+
+from ScenarioGUI.gui_classes.gui_calculation_thread import CalcProblem
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+
+from ..result_creating_class_for_tests import ResultsClass
+from ..starting_closing_tests import close_tests, start_tests
+
+CALLS: list[int] = []
+
+
+def batch_data_2_results(data_storages: list[DataStorage]) -> list[ResultsClass | Exception]:
+    CALLS.append(len(data_storages))
+    a = np.array([d_s.int_a for d_s in data_storages])
+    sums = a + np.array([d_s.float_b for d_s in data_storages])
+    results: list[ResultsClass | Exception] = []
+    for int_a, float_b, result in zip(a, (d_s.float_b for d_s in data_storages), sums):
+        if int_a > 250:
+            results.append(ValueError("int_a is too large"))
+            continue
+        res = ResultsClass(int(int_a), float_b)
+        res.result = float(result)
+        results.append(res)
+    return results
+
+
+def wrong_length(data_storages: list[DataStorage]) -> list[ResultsClass]:
+    return []
+
+
+def add_scenarios(main_window, values: list[int]) -> None:
+    data_storages = []
+    for value in values:
+        d_s = DataStorage(main_window.gui_structure)
+        d_s.int_a = value
+        data_storages.append(d_s)
+    main_window.add_scenarios(data_storages, [f"int_a={value}" for value in values])
+
+
+def run_batches(main_window) -> None:
+    while main_window.threads:
+        batches = {id(thread.batch): thread.batch for thread in main_window.threads if thread.batch is not None and not thread.calculated}
+        if not batches:
+            return
+        _ = [batch.run() for batch in batches.values()]
+
+
+def test_batch_calculation(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.gui_structure.option_n_threads.set_value(2)
+    main_window.activate_batch_calculation(batch_data_2_results, chunk_size=2)
+    assert main_window.scheduler.max_running == 4
+    main_window.save_scenario()
+    add_scenarios(main_window, [3, 4, 260, 6])
+    CALLS.clear()
+    main_window.start_multiple_scenarios_calculation()
+    assert len(main_window.threads) == 5
+    batches = {thread.batch for thread in main_window.threads if thread.batch is not None}
+    assert len(batches) == 2
+    assert all(len(batch.members) == 2 for batch in batches)
+    run_batches(main_window)
+    assert CALLS == [2, 2, 1]
+    assert [d_s.results.result for idx, d_s in enumerate(main_window.list_ds) if idx != 3] == [102, 103, 104, 106]
+    assert main_window.list_ds[3].results is None
+    assert f"{main_window.list_ds[3].debug_message}" == "int_a is too large"
+    assert not main_window.threads
+    close_tests(main_window, qtbot)
+
+
+def test_batch_calculation_in_processes(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.activate_batch_calculation(batch_data_2_results, chunk_size=3)
+    main_window.save_scenario()
+    add_scenarios(main_window, [3, 260])
+    CalcProblem.USE_MULTITHREADING = False
+    try:
+        main_window.start_multiple_scenarios_calculation()
+        run_batches(main_window)
+    finally:
+        CalcProblem.USE_MULTITHREADING = True
+    assert main_window.batch_worker_pool.n_workers == 1
+    assert [d_s.results.result if d_s.results is not None else None for d_s in main_window.list_ds] == [102, 103, None]
+    assert f"{main_window.list_ds[2].debug_message}" == "int_a is too large"
+    # the worker processes of the previous batch calculation are closed if it is activated again
+    worker_pool = main_window.batch_worker_pool
+    main_window.activate_batch_calculation(batch_data_2_results, chunk_size=2)
+    assert worker_pool.n_workers == 0
+    assert main_window.batch_worker_pool is not worker_pool
+    close_tests(main_window, qtbot)
+
+
+def test_wrong_number_of_results(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.activate_batch_calculation(wrong_length)
+    main_window.start_multiple_scenarios_calculation()
+    run_batches(main_window)
+    assert main_window.list_ds[0].results is None
+    assert "returned 0 results for 1 scenarios" in f"{main_window.list_ds[0].debug_message}"
+    close_tests(main_window, qtbot)
+
+
+def test_batch_time_out(qtbot, monkeypatch):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.activate_batch_calculation(batch_data_2_results, chunk_size=2)
+    main_window.save_scenario()
+    add_scenarios(main_window, [3])
+    main_window.start_multiple_scenarios_calculation()
+    (batch,) = {thread.batch for thread in main_window.threads}
+    terminated: list[bool] = []
+    monkeypatch.setattr(batch, "terminate", lambda: terminated.append(True))
+    supervisor = main_window.supervisor
+    # the batch thread keeps running as long as one of its scenarios is not stopped
+    supervisor.start_times[batch.members[0]] -= 10_000
+    supervisor.check()
+    assert batch.members[0].calculated
+    assert not terminated
+    supervisor.start_times[batch.members[1]] -= 10_000
+    supervisor.check()
+    assert terminated == [True]
+    assert "run time" in f"{main_window.list_ds[1].debug_message}"
+    close_tests(main_window, qtbot)
@@ -0,0 +1,30 @@
+import copy
+from pathlib import Path
+
+from benchmarks.benchmark_scenarios import compare, run_benchmarks
+from ScenarioGUI import load_config
+
+load_config(Path(__file__).absolute().parent.parent.joinpath("gui_config.ini"))
+
+
+def test_benchmarks(qtbot):
+    report = run_benchmarks([10], repeat=1)
+    assert set(report["results"]) == {
+        "save",
+        "load",
+        "data_storage_init",
+        "set_values",
+        "scenario_is_changed",
+        "change",
+        "display_results",
+        "change_language",
+        "calculation",
+    }
+    assert all(timings["10"]["min"] > 0 for timings in report["results"].values())
+    assert compare(report, report) == []
+    baseline = copy.deepcopy(report)
+    baseline["results"]["save"]["10"]["min"] /= 10
+    del baseline["results"]["load"]
+    regressions = compare(report, baseline, tolerance=0.5)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("save (N=10)")
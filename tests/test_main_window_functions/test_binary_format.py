@@ -0,0 +1,177 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import PySide6.QtWidgets as QtW
+import pytest
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.batch import calculate_projects
+from ScenarioGUI.convert import convert_project, main
+from ScenarioGUI.gui_classes.gui_binary_format import MAGIC, BinaryFormatError, LazyPayload, decode, encode, read_binary, read_chunks, write_binary
+from ScenarioGUI.gui_classes.gui_combine_window import normal_export, normal_import
+from ScenarioGUI.gui_classes.gui_data_storage import LazyResults, is_equal
+
+from ..result_creating_class_for_tests import ResultsClass, data_2_results
+from ..starting_closing_tests import close_tests, start_tests
+from .test_batch import create_project
+
+
+def test_encode_decode():
+    value = {"a": [1, -2**70, 2.5, "text", None, True, False], "b": ("x", {"c": np.int32(3), "d": np.float32(0.5)}), 1: np.array([1, "a"], dtype=object)}
+    data, arrays = encode(value)
+    assert not arrays
+    assert decode(data) == {"a": [1, -2**70, 2.5, "text", None, True, False], "b": ["x", {"c": 3, "d": 0.5}], "1": [1, "a"]}
+    with pytest.raises(TypeError):
+        encode({"a": object()})
+
+
+def test_binary_format(tmp_path):
+    arrays = {
+        "float": np.linspace(0, 1, 1_001),
+        "fortran": np.asfortranarray(np.arange(6, dtype=">i4").reshape(2, 3)),
+        "empty": np.empty((0, 3)),
+        "scalar": np.array(7),
+        "text": np.array(["a", "bc"]),
+    }
+    data = {"filename": ("", ""), "names": ["scenario 1"], "values": [{"int_a": 1, "option": np.ones(3)}], "results": [arrays], "statistics": [None]}
+    file = tmp_path.joinpath("project.guiBin")
+    write_binary(file, data)
+    for memory_map in (True, False):
+        saving = read_binary(file, memory_map)
+        assert saving["filename"] == ["", ""]
+        assert isinstance(saving["results"][0]["float"], np.memmap) == memory_map
+        for name, array in arrays.items():
+            assert saving["results"][0][name].dtype == array.dtype
+            assert np.array_equal(saving["results"][0][name], array)
+        # the memory-mapped arrays can be changed without changing the file
+        saving["results"][0]["float"][0] = 10
+    assert read_binary(file)["results"][0]["float"][0] == 0
+    # the arrays are aligned, so they can be memory-mapped
+    assert read_binary(file)["results"][0]["float"].offset % 64 == 0
+    # the arrays are stored as raw buffers, which is smaller than JSON
+    normal_export(tmp_path.joinpath("project.gui"), data)
+    assert file.stat().st_size < tmp_path.joinpath("project.gui").stat().st_size
+    assert np.array_equal(normal_import(tmp_path.joinpath("project.gui"))["values"][0]["option"], np.ones(3))
+    with pytest.raises(BinaryFormatError):
+        read_binary(tmp_path.joinpath("project.gui"))
+
+
+def test_damaged_binary_file(qtbot, tmp_path, caplog):
+    data = {"filename": ("", ""), "names": ["scenario 1"], "values": [{"int_a": 1}], "results": [{"array": np.arange(100.0)}], "statistics": [None]}
+    file = tmp_path.joinpath("project.guiBin")
+    write_binary(file, data)
+    content = file.read_bytes()
+    damaged = tmp_path.joinpath(f"damaged.{globs.FILE_EXTENSION}Bin")
+    # every truncated file is rejected
+    for length in range(len(MAGIC), len(content), 7):
+        damaged.write_bytes(content[:length])
+        with pytest.raises(BinaryFormatError):
+            read_binary(damaged, memory_map=False)
+    # as well as corrupt chunk lengths and payloads
+    with open(file, "rb") as opened:
+        chunks = read_chunks(opened)
+    for position in (len(MAGIC) + 8, chunks[b"TREE"][0], chunks[b"ARRS"][0], chunks[b"RIDX"][0]):
+        damaged.write_bytes(content[:position] + b"\xff" * 8 + content[position + 8 :])
+        with pytest.raises(BinaryFormatError):
+            read_binary(damaged, memory_map=False)
+    # the GUI keeps the current project
+    main_window = start_tests(qtbot)
+    names = [main_window.list_widget_scenario.item(idx).text() for idx in range(main_window.list_widget_scenario.count())]
+    main_window._load_from_data(damaged)
+    assert [main_window.list_widget_scenario.item(idx).text() for idx in range(main_window.list_widget_scenario.count())] == names
+    assert damaged.name in caplog.text
+    close_tests(main_window, qtbot)
+
+
+def test_binary_project(qtbot, tmp_path, monkeypatch):
+    main_window = start_tests(qtbot)
+    main_window.add_scenario()
+    main_window.gui_structure.int_a.set_value(5)
+    main_window.save_scenario()
+    # arrays are kept in the values
+    main_window.list_ds[0].array = np.arange(3.0)
+    assert is_equal(main_window.list_ds[0].to_dict()["array"], [0.0, 1.0, 2.0])
+    del main_window.list_ds[0].array
+    file = tmp_path.joinpath(f"project.{globs.FILE_EXTENSION}Bin")
+    # the binary project file becomes the current file
+    monkeypatch.setattr(QtW.QFileDialog, "getSaveFileName", lambda *args, **kwargs: (f"{file}", f"{globs.FILE_EXTENSION}Bin"))
+    main_window.fun_save_as()
+    main_window.saver.flush()
+    main_window._load_from_data(file)
+    assert main_window.list_ds[1].int_a == 5
+    assert Path(main_window.filename[0]) == file
+    close_tests(main_window, qtbot)
+
+
+def test_convert(qtbot):
+    file = create_project(qtbot, f"convert.{globs.FILE_EXTENSION}")
+    config = Path(__file__).absolute().parent.parent.joinpath("gui_config.ini")
+    (file_binary,) = main([f"{file}", "--config", f"{config}"])
+    assert file_binary == file.with_suffix(f".{globs.FILE_EXTENSION}Bin")
+    saving = normal_import(file)
+    assert json.loads(json.dumps(read_binary(file_binary))) == saving
+    # binary project files can be calculated in batch and converted back
+    assert calculate_projects([file_binary], data_2_results, n_workers=1) == 2
+    assert main([f"{file_binary}", "--output", f"{file}"]) == [file]
+    assert np.isclose(normal_import(file)["results"][1]["result"], 104)
+    file.unlink()
+    file_binary.unlink()
+
+
+def test_lazy_results(qtbot, tmp_path):
+    file = create_project(qtbot, f"lazy.{globs.FILE_EXTENSION}")
+    assert calculate_projects([file], data_2_results, n_workers=1) == 2
+    file_binary = convert_project(file, tmp_path.joinpath(f"lazy.{globs.FILE_EXTENSION}Bin"))
+    file.unlink()
+    # the results are separate payloads, which are only decoded when they are loaded
+    saving = read_binary(file_binary, lazy=True)
+    assert isinstance(saving["results"][0], LazyPayload)
+    assert saving["results"][2] is None
+    assert saving["results"][1].load() == read_binary(file_binary)["results"][1]
+    main_window = start_tests(qtbot)
+    main_window._load_from_data(file_binary)
+    assert all(isinstance(d_s.results, LazyResults) for d_s in main_window.list_ds[:2])
+    main_window.auto_save()
+    main_window.saver.flush()
+    n_lines = len(main_window.backup_file.read_text().splitlines())
+    # only the results of the selected scenario are created, while the handle is kept
+    handle = main_window.list_ds[1].results
+    main_window.change_scenario(1)
+    main_window.display_results()
+    assert main_window.list_ds[1].results is handle
+    assert isinstance(main_window.list_ds[1].load_results(), ResultsClass)
+    assert main_window.list_ds[1].load_results() is main_window.list_ds[1].load_results()
+    assert isinstance(main_window.list_ds[0].results, LazyResults)
+    # the loaded results are not written to the backup journal again
+    main_window.auto_save()
+    main_window.saver.flush()
+    assert all("results" not in line for line in main_window.backup_file.read_text().splitlines()[n_lines:])
+    # results which are not loaded are saved from their payload
+    file_json = tmp_path.joinpath(f"lazy.{globs.FILE_EXTENSION}")
+    main_window._save_to_data(file_json)
+    assert isinstance(main_window.list_ds[0].results, LazyResults)
+    assert normal_import(file_json)["results"][:2] == [saving["results"][0].load(), saving["results"][1].load()]
+    assert main_window.list_ds[0].results.result == normal_import(file_json)["results"][0]["result"]
+    close_tests(main_window, qtbot)
+
+
+def test_lazy_results_other_version(qtbot, tmp_path):
+    file = create_project(qtbot, f"lazy_version.{globs.FILE_EXTENSION}")
+    assert calculate_projects([file], data_2_results, n_workers=1) == 2
+    saving = normal_import(file)
+    saving["version"] = "0.0.1"
+    file_binary = tmp_path.joinpath(f"lazy_version.{globs.FILE_EXTENSION}Bin")
+    write_binary(file_binary, saving)
+    file.unlink()
+
+    def import_old_version(saving_old: dict) -> dict:
+        # the import functions of other versions get the decoded results
+        saving_old["results"][0]["result"] += 1
+        return saving_old
+
+    main_window = start_tests(qtbot)
+    main_window.add_other_version_import_function("v0.0.1", import_old_version)
+    main_window._load_from_data(file_binary)
+    assert main_window.list_ds[0].load_results().result == saving["results"][0]["result"] + 1
+    close_tests(main_window, qtbot)
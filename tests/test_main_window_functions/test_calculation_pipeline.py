@@ -0,0 +1,128 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from ScenarioGUI.gui_classes.gui_calculation_pipeline import ArtifactCache, CalculationPipeline
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+
+from ..result_creating_class_for_tests import ResultsClass
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def load(d_s, artifacts):
+    return np.full(10, d_s.int_a)
+
+
+def response(d_s, artifacts):
+    return artifacts["load"] * d_s.float_a
+
+
+def data_2_results(d_s, artifacts):
+    result = ResultsClass(d_s.int_a, d_s.float_b)
+    result.response = artifacts["response"]
+    return result, result.adding
+
+
+def create_pipeline(cache: ArtifactCache | None = None) -> CalculationPipeline:
+    pipeline = CalculationPipeline(data_2_results, cache)
+    pipeline.add_stage("load", load, ["int_a"])
+    pipeline.add_stage("response", response, ["float_a"])
+    return pipeline
+
+
+def test_only_changed_stages_are_calculated(qtbot):
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    pipeline = create_pipeline()
+    with pytest.raises(ValueError):
+        pipeline.add_stage("load", load, [])
+    results, func = pipeline(DataStorage(gs))
+    func()
+    assert np.allclose(results.response, 200)
+    assert pipeline.n_calculations == {"load": 1, "response": 1}
+    # an option of the last stage only reruns the last stage
+    gs.float_a.set_value(10)
+    results, _ = pipeline(DataStorage(gs))
+    assert np.allclose(results.response, 20)
+    assert pipeline.n_calculations == {"load": 1, "response": 2}
+    # an option of the first stage reruns all the stages
+    gs.int_a.set_value(3)
+    results, _ = pipeline(DataStorage(gs))
+    assert np.allclose(results.response, 30)
+    assert pipeline.n_calculations == {"load": 2, "response": 3}
+    # options of no stage do not rerun any stage
+    gs.float_b.set_value(10)
+    pipeline(DataStorage(gs))
+    assert pipeline.n_calculations == {"load": 2, "response": 3}
+    # the output of a stage with an unknown option would never be calculated again
+    pipeline.add_stage("misspelled", load, ["int_aa"])
+    with pytest.raises(ValueError, match="int_aa"):
+        pipeline(DataStorage(gs))
+    # the headless DataStorages of the worker processes know their options as well
+    pipeline.stages.pop()
+    pipeline(DataStorage.from_values(DataStorage(gs).to_dict()))
+    close_tests(main_window, qtbot)
+
+
+def test_artifact_cache(tmp_path):
+    cache = ArtifactCache(memory_size=1500, folder=tmp_path, disk_size=1_000_000)
+    cache.put("a", np.zeros(100))
+    cache.put("b", np.ones(100))
+    # the least recently used artifact is removed from memory, but still on disk
+    assert list(cache._memory) == ["b"]
+    found, artifact = cache.get("a")
+    assert found and np.allclose(artifact, 0)
+    assert list(cache._memory) == ["a"]
+    assert cache.get("c") == (False, None)
+    # no temporary files are left in the folder
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.pkl", "b.pkl"]
+    # the cache can be passed to other processes without its artifacts in memory
+    copy = pickle.loads(pickle.dumps(cache))
+    assert not copy._memory
+    assert copy.get("b")[0]
+    # broken artifacts on disk are calculated again
+    tmp_path.joinpath("truncated.pkl").write_bytes(pickle.dumps(np.ones(100))[:50])
+    tmp_path.joinpath("foreign.pkl").write_bytes(pickle.dumps(np.ones(3)).replace(b"numpy", b"nompy"))
+    assert copy.get("truncated") == (False, None)
+    assert copy.get("foreign") == (False, None)
+    _ = [path.unlink() for path in tmp_path.glob("[tf]*.pkl")]
+    cache.disk_size = 1500
+    cache.evict()
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    cache.clear()
+    assert not list(tmp_path.glob("*.pkl"))
+    assert not cache._memory
+
+
+def test_pipeline_in_main_window(qtbot, tmp_path):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    pipeline = create_pipeline(ArtifactCache(folder=tmp_path))
+    main_window.data_2_results_function = pipeline
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.float_b.set_value(50)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    _ = [thread.run() for thread in list(main_window.threads)]
+    assert [d_s.results.result for d_s in main_window.list_ds] == [102, 52]
+    assert pipeline.n_calculations == {"load": 1, "response": 1}
+    # the artifacts on disk are used by a new pipeline (e.g. in a new session)
+    new_pipeline = create_pipeline(ArtifactCache(folder=tmp_path))
+    new_pipeline(main_window.list_ds[0])
+    assert not new_pipeline.n_calculations
+    # a new version of a stage (and the following stages) is calculated again
+    new_pipeline = CalculationPipeline(data_2_results, ArtifactCache(folder=tmp_path))
+    new_pipeline.add_stage("load", load, ["int_a"], version="2")
+    new_pipeline.add_stage("response", response, ["float_a"])
+    new_pipeline(main_window.list_ds[0])
+    assert new_pipeline.n_calculations == {"load": 1, "response": 1}
+    # as well as a stage with another function
+    new_pipeline = create_pipeline(ArtifactCache(folder=tmp_path))
+    new_pipeline.stages[1] = new_pipeline.stages[1]._replace(function=lambda d_s, artifacts: artifacts["load"])
+    new_pipeline(main_window.list_ds[0])
+    assert new_pipeline.n_calculations == {"response": 1}
+    close_tests(main_window, qtbot)
@@ -0,0 +1,70 @@
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_scheduler_priority_and_resize(qtbot):
+    """
+    test if the selected scenario is calculated first and if the number of parallel calculations can be changed
+    during a calculation
+
+    Parameters
+    ----------
+    qtbot: qtbot
+        bot for the GUI
+    """
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.option_n_threads.set_value(1)
+    main_window.save_scenario()
+    for value in range(101, 104):
+        main_window.add_scenario()
+        gs.float_b.set_value(value)
+        main_window.save_scenario()
+    main_window.list_widget_scenario.setCurrentRow(2)
+    main_window.start_multiple_scenarios_calculation()
+    items = [main_window.list_widget_scenario.item(idx) for idx in range(4)]
+    scheduler = main_window.scheduler
+    assert [thread.item for thread in scheduler.running] == [items[2]]
+    assert not main_window.push_button_start_single.isEnabled()
+    # selecting another scenario moves it to the front of the queue
+    main_window.list_widget_scenario.setCurrentRow(3)
+    scheduler.running[0].run()
+    assert scheduler.n_finished == 1
+    assert [thread.item for thread in scheduler.running] == [items[3]]
+    assert main_window.progress_bar.value() == 25
+    # more parallel threads start the waiting calculations directly
+    gs.option_n_threads.set_value(3)
+    assert [thread.item for thread in scheduler.running] == [items[3], items[0], items[1]]
+    assert len(main_window.supervisor.start_times) == 3
+    _ = [thread.run() for thread in list(scheduler.running)]
+    assert not main_window.threads
+    assert all(d_s.results is not None for d_s in main_window.list_ds)
+    assert main_window.push_button_start_single.isEnabled()
+    close_tests(main_window, qtbot)
+
+
+def test_scheduler_finish_waiting_thread(qtbot):
+    """
+    test if a calculation, which is finished before it has been started, is only counted once
+
+    Parameters
+    ----------
+    qtbot: qtbot
+        bot for the GUI
+    """
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.option_n_threads.set_value(1)
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.float_b.set_value(101)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    scheduler = main_window.scheduler
+    waiting = [thread for thread in main_window.threads if thread not in scheduler.running][0]
+    waiting.run()
+    assert scheduler.n_finished == 1
+    assert not scheduler.finish(waiting)
+    assert not scheduler.next_threads()
+    scheduler.running[0].run()
+    assert not main_window.threads
+    close_tests(main_window, qtbot)
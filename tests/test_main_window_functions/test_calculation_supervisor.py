@@ -0,0 +1,50 @@
+import math
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_supervisor_status(qtbot):
+    """
+    test if the supervisor reports the elapsed and remaining time and removes finished calculations
+
+    Parameters
+    ----------
+    qtbot: qtbot
+        bot for the GUI
+    """
+    main_window = start_tests(qtbot)
+    main_window.gui_structure.time_out.set_value(100)
+    main_window.save_scenario()
+    main_window.add_scenario()
+    main_window.gui_structure.float_b.set_value(102)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    supervisor = main_window.supervisor
+    assert len(supervisor.start_times) == 2
+    assert supervisor.timer.isActive()
+    for thread, elapsed, remaining in supervisor.status():
+        assert 0 <= elapsed < 100
+        assert 0 < remaining <= 100
+    # calculations in a process are stopped by the worker pool, not by the supervisor
+    thread = main_window.threads[0]
+    thread.USE_MULTITHREADING = False
+    supervisor.start_times[thread] -= 200
+    supervisor.check()
+    assert not thread.calculated
+    assert thread in supervisor.start_times
+    main_window.show_calculation_status(supervisor.status())
+    assert main_window.threads[1].item.text() in main_window.progress_bar.toolTip()
+    # calculations without a time out have an infinite remaining time
+    main_window.threads[1].d_s.time_out = None
+    assert [remaining for thread, _, remaining in supervisor.status() if thread is main_window.threads[1]] == [math.inf]
+    supervisor.check()
+    assert main_window.threads[1] in supervisor.start_times
+    main_window.show_calculation_status(supervisor.status())
+    lines = main_window.progress_bar.toolTip().splitlines()
+    assert [line for line in lines if line.startswith(main_window.threads[1].item.text())][0].endswith("elapsed")
+    # finished calculations are removed and the later threads are supervised as well
+    _ = [thread.run() for thread in list(main_window.threads)]
+    supervisor.check()
+    assert not supervisor.start_times
+    assert not supervisor.timer.isActive()
+    close_tests(main_window, qtbot)
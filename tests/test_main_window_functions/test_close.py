@@ -46,16 +46,14 @@ def test_close(qtbot):
     response = QtW.QMessageBox.Save
     main_window.close()
 
-    assert len(main_window.saving_threads) == 0
+    assert not main_window.saver.pending
 
     QtW.QFileDialog.getSaveFileName = partial(get_save_file_name, return_value=(f"{main_window.default_path.joinpath(filename_1)}", f"{main_window.filename_default[1]}"))
     response = QtW.QMessageBox.Save
     main_window.close()
     assert filename_1 in main_window.filename[0]
     assert filename_1 in main_window.dia.windowTitle()
-    for thread in main_window.saving_threads:
-        assert thread.isFinished()
-        assert thread.calculated
+    assert not main_window.saver.pending
 
     response = QtW.QMessageBox.Close
     main_window.close()
@@ -0,0 +1,78 @@
+from matplotlib import pyplot as plt
+
+from ScenarioGUI.gui_classes.gui_figure_cache import FigureCache, estimate_size
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+class Storage:
+    fig_1 = None
+    fig_2 = None
+
+
+def add_figure(cache: FigureCache, storage: Storage, name: str) -> plt.Figure:
+    fig = plt.figure()
+    setattr(storage, name, fig)
+    cache.add(storage, name, fig)
+    return fig
+
+
+def test_figure_cache():
+    cache = FigureCache(max_figures=2)
+    storage_1, storage_2 = Storage(), Storage()
+    fig_1 = add_figure(cache, storage_1, "fig_1")
+    add_figure(cache, storage_1, "fig_2")
+    # the figures of the storage which is shown are never closed
+    add_figure(cache, storage_1, "fig_2")
+    assert storage_1.fig_1 is fig_1
+    fig_3 = add_figure(cache, storage_2, "fig_1")
+    assert len(cache) == 2
+    assert storage_1.fig_1 is None
+    assert not plt.fignum_exists(fig_1.number)
+    # the least recently viewed figure is closed first
+    cache.touch(storage_2, "fig_1")
+    add_figure(cache, storage_2, "fig_2")
+    assert storage_2.fig_1 is fig_3
+    assert storage_1.fig_2 is None
+    # figures which have been closed elsewhere are removed
+    plt.close(storage_2.fig_1)
+    storage_2.fig_1 = None
+    add_figure(cache, storage_1, "fig_1")
+    assert storage_2.fig_2 is not None
+    # memory budget
+    cache.max_figures = None
+    cache.max_memory = estimate_size(storage_1.fig_1)
+    add_figure(cache, storage_2, "fig_1")
+    assert len(cache) == 2
+    assert storage_1.fig_1 is None
+    plt.close("all")
+
+
+def test_figures_are_recreated(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.float_b.set_value(50)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    _ = [thread.run() for thread in list(main_window.threads)]
+    figure_names = [name for fig, name in gs.list_of_result_figures if not fig.is_hidden()]
+    main_window.figure_cache.max_figures = len(figure_names)
+    main_window.change_scenario(0)
+    main_window.display_results()
+    figures = [getattr(main_window.list_ds[0], name) for name in figure_names]
+    assert all(fig is not None for fig in figures)
+    main_window.change_scenario(1)
+    main_window.display_results()
+    assert all(getattr(main_window.list_ds[1], name) is not None for name in figure_names)
+    assert all(getattr(main_window.list_ds[0], name) is None for name in figure_names)
+    assert len(main_window.figure_cache) == len(figure_names)
+    # the figures are created again when the scenario is viewed again
+    main_window.change_scenario(0)
+    main_window.display_results()
+    assert all(getattr(main_window.list_ds[0], name) is not None for name in figure_names)
+    assert all(getattr(main_window.list_ds[0], name) is not fig for name, fig in zip(figure_names, figures))
+    close_tests(main_window, qtbot)
@@ -49,25 +49,19 @@ def test_save_load_new(qtbot):  # noqa: PLR0915
 
     QtW.QFileDialog.getSaveFileName = partial(get_save_file_name, return_value=(f"{main_window.filename_default[0]}", f"{main_window.filename_default[1]}"))
     main_window.action_save.trigger()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     assert (Path(main_window.filename[0]), main_window.filename[1]) == (Path(main_window.filename_default[0]), main_window.filename_default[1])
     # trigger save action and add filename
     QtW.QFileDialog.getSaveFileName = partial(
         get_save_file_name, return_value=(f"{filename_1}", f"{global_vars.FILE_EXTENSION} (*.{global_vars.FILE_EXTENSION})")
     )
     main_window.action_save.trigger()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     # check if filename is set correctly
     assert (Path(main_window.filename[0]), main_window.filename[1]) == (filename_1, f"{global_vars.FILE_EXTENSION} (*.{global_vars.FILE_EXTENSION})")
     assert f"{filename_1.parent}" == f"{main_window.default_path}"
     main_window.action_save.trigger()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     # check if filename is set correctly
     assert (Path(main_window.filename[0]), main_window.filename[1]) == (filename_1, f"{global_vars.FILE_EXTENSION} (*.{global_vars.FILE_EXTENSION})")
     # get old list and add a new scenario
@@ -80,9 +74,7 @@ def test_save_load_new(qtbot):  # noqa: PLR0915
         get_save_file_name, return_value=(f"{filename_2}", f"{global_vars.FILE_EXTENSION} (*.{global_vars.FILE_EXTENSION})")
     )
     main_window.action_save_as.trigger()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     # check if filename is set correctly
     assert (Path(main_window.filename[0]), main_window.filename[1]) == (filename_2, f"{global_vars.FILE_EXTENSION} (*.{global_vars.FILE_EXTENSION})")
     assert f"{filename_2.parent}" == f"{main_window.default_path}"
@@ -0,0 +1,87 @@
+import numpy as np
+import PySide6.QtCore as QtC
+import pytest
+
+from ScenarioGUI.gui_classes.gui_parameter_sweep import ParameterSweep, ParameterSweepDialog
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_designs(qtbot):
+    main_window = start_tests(qtbot)
+    sweep = ParameterSweep(main_window.gui_structure)
+    with pytest.raises(ValueError):
+        sweep.add("float_b", [-1, 10])
+    with pytest.raises(ValueError):
+        sweep.add("list_box", [4])
+    with pytest.raises(ValueError):
+        sweep.add("text_box", ["a"])
+    sweep.add("float_b", low=10, high=20, n=3)
+    sweep.add("list_box", [1, 3])
+    full_factorial = sweep.full_factorial()
+    assert len(full_factorial) == 6
+    assert {point["float_b"] for point in full_factorial} == {10, 15, 20}
+
+    one_at_a_time = sweep.one_at_a_time()
+    assert one_at_a_time[0] == {"float_b": 100, "list_box": 0}
+    assert len(one_at_a_time) == 1 + 3 + 2
+
+    latin_hypercube = sweep.latin_hypercube(10, seed=1)
+    assert len(latin_hypercube) == 10
+    values = sorted(point["float_b"] for point in latin_hypercube)
+    # every stratum is sampled exactly once
+    assert all(10 + idx <= value <= 11 + idx for idx, value in enumerate(values))
+    assert {point["list_box"] for point in latin_hypercube} == {1, 3}
+    # the values are rounded to the decimals of the FloatBox
+    assert all(round(point["float_b"], 2) == point["float_b"] for point in latin_hypercube)
+    sweep_rounded = ParameterSweep(main_window.gui_structure)
+    sweep_rounded.add("float_b", [10.123, 10.5])
+    sweep_rounded.add("int_a", low=0, high=1, n=3)
+    assert sweep_rounded.full_factorial() == [{"float_b": 10.12, "int_a": 0}, {"float_b": 10.12, "int_a": 1}, {"float_b": 10.5, "int_a": 0}, {"float_b": 10.5, "int_a": 1}]
+
+    scenarios = sweep.create_data_storages(full_factorial)
+    name, d_s = scenarios[-1]
+    assert name == "float_b=20.0, list_box=3"
+    assert d_s.float_b == 20
+    assert d_s.list_box == (3, "3")
+    assert d_s.list_box_text == "3"
+    close_tests(main_window, qtbot)
+
+
+def test_dialog(qtbot):
+    main_window = start_tests(qtbot)
+    sweep = ParameterSweep(main_window.gui_structure)
+    # the dialog uses the translations of the current language
+    dialog = ParameterSweepDialog(sweep, main_window.translations, 1, main_window.dia)
+    assert dialog.windowTitle() == main_window.translations.action_parameter_sweep[1]
+    assert dialog.table.horizontalHeaderItem(1).text() == "Werte"
+    assert [dialog.design.itemText(idx) for idx in range(dialog.design.count())] == main_window.translations.label_sweep_designs[1].split(",")
+    dialog.accept()
+    assert dialog.label_error.text() == main_window.translations.label_sweep_no_option[1]
+    dialog.table.item(0, 0).setCheckState(QtC.Qt.Checked)
+    dialog.accept()
+    assert len(sweep.parameters) == 1
+    close_tests(main_window, qtbot)
+
+
+def test_add_scenarios_and_calculate(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.activate_parameter_sweep()
+    assert main_window.action_parameter_sweep in main_window.menu_calculation.actions()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    sweep = ParameterSweep(gs)
+    sweep.add("int_a", low=0, high=2, n=3)
+    names, data_storages = zip(*sweep.create_data_storages(sweep.full_factorial()))
+    main_window.add_scenarios(list(data_storages), ["int_a=0", "int_a=1", "int_a=0"], calculate=True)
+    assert main_window.list_widget_scenario.count() == 4
+    assert main_window.list_widget_scenario.item(3).text() == "int_a=0(2)"
+    assert main_window.changedFile
+    # the last sweep scenario has the same inputs as the first scenario and reuses its calculation
+    assert len(main_window.threads) == 3
+    _ = [thread.run() for thread in list(main_window.threads)]
+    assert [d_s.results.result for d_s in main_window.list_ds[1:]] == [100, 101, 102]
+    assert np.isclose(main_window.list_ds[0].results.result, 102)
+    close_tests(main_window, qtbot)
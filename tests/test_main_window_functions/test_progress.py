@@ -0,0 +1,100 @@
+from ScenarioGUI.gui_classes.gui_worker_pool import calculation_kwargs, throttle_partial_results, throttle_progress
+
+from ..result_creating_class_for_tests import ResultsClass
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_throttle_progress():
+    reported = []
+    progress = throttle_progress(reported.append, 0.1)
+    for value in (-1, 0.05, 0.1, 0.15, 0.3, 2):
+        progress(value)
+    assert reported == [0.0, 0.1, 0.3, 1.0]
+    partial_results = throttle_partial_results(reported.append, 100)
+    partial_results(1)
+    partial_results(2)
+    assert reported[-1] == 1
+    assert list(calculation_kwargs(lambda progress, partial_results: None, print, print)) == ["progress", "partial_results"]
+    assert not calculation_kwargs(lambda: None, print, print)
+
+
+def test_progress_bar(qtbot):
+    """
+    test if the progress reported by the calculations is shown in the progress bar
+
+    Parameters
+    ----------
+    qtbot: qtbot
+        bot for the GUI
+    """
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.option_n_threads.set_value(1)
+    progress_bar = []
+
+    def data_2_results(data):
+        result = ResultsClass(data.int_a, data.float_b)
+
+        def func(progress):
+            progress(0.5)
+            progress_bar.append((main_window.progress_bar.value(), main_window.progress_bar.format()))
+            result.adding()
+
+        return result, func
+
+    main_window.data_2_results_function = data_2_results
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.float_b.set_value(101)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    assert main_window.progress_bar.format() == "%p%"
+    main_window.scheduler.running[0].run()
+    assert main_window.progress_bar.value() == 50
+    main_window.scheduler.running[0].run()
+    assert progress_bar[0][0] == 25
+    assert progress_bar[1][0] == 75
+    assert all("remaining" in text for _, text in progress_bar)
+    assert main_window.progress_bar.format() == "%p%"
+    assert all(d_s.debug_message is None for d_s in main_window.list_ds)
+    close_tests(main_window, qtbot)
+
+
+def test_partial_results(qtbot):
+    """
+    test if the partial results of the selected scenario are shown while it is calculated
+
+    Parameters
+    ----------
+    qtbot: qtbot
+        bot for the GUI
+    """
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    texts = []
+
+    def data_2_results(data):
+        result = ResultsClass(data.int_a, data.float_b)
+
+        def func(partial_results):
+            snapshot = ResultsClass(data.int_a, data.float_b)
+            snapshot.result = 50
+            partial_results(snapshot)
+            texts.append((gs.result_text_add.label.text(), len(main_window.partial_figures)))
+            result.adding()
+
+        return result, func
+
+    main_window.data_2_results_function = data_2_results
+    main_window.save_scenario()
+    main_window.start_current_scenario_calculation()
+    thread = main_window.threads[-1]
+    thread.run()
+    assert texts[0][0] == "Result: 50m"
+    # the figures of the partial results are not stored in the DataStorage
+    assert texts[0][1] > 0
+    main_window.display_results()
+    assert gs.result_text_add.label.text() == "Result: 102.0m"
+    assert not main_window.partial_figures
+    close_tests(main_window, qtbot)
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.gui_classes.gui_project_snapshot import write_atomic
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_write_atomic(tmp_path):
+    file = tmp_path.joinpath("file.txt")
+    write_atomic(file, lambda location: location.write_text("first"))
+    assert file.read_text() == "first"
+
+    def interrupted(location):
+        location.write_text("sec")
+        raise KeyboardInterrupt
+
+    # an interrupted write leaves the previous file
+    with pytest.raises(KeyboardInterrupt):
+        write_atomic(file, interrupted)
+    assert file.read_text() == "first"
+    assert [path.name for path in tmp_path.iterdir()] == ["file.txt"]
+
+    # every write uses its own temporary file, so a second writer of the same file does not interfere
+    def nested(location):
+        write_atomic(file, lambda other: other.write_text("other"))
+        assert file.read_text() == "other"
+        location.write_text("last")
+
+    write_atomic(file, nested)
+    assert file.read_text() == "last"
+    assert [path.name for path in tmp_path.iterdir()] == ["file.txt"]
+
+
+def test_project_snapshot(qtbot, tmp_path):
+    main_window = start_tests(qtbot)
+    main_window.add_scenario()
+    main_window.add_scenario()
+    snapshot = main_window.create_snapshot()
+    assert len(snapshot.scenarios) == 3
+    # the values of unchanged scenarios are shared between the snapshots
+    main_window.gui_structure.int_a.set_value(5)
+    main_window.save_scenario()
+    snapshot_new = main_window.create_snapshot()
+    assert snapshot_new.scenarios[0].values is snapshot.scenarios[0].values
+    assert snapshot_new.scenarios[2].values is not snapshot.scenarios[2].values
+    assert snapshot.scenarios[2].values["int_a"] != 5
+    assert snapshot_new.scenarios[2].values["int_a"] == 5
+    # the file contains the scenarios of the time of saving, even if they are changed before the file is written
+    file = tmp_path.joinpath(f"test.{globs.FILE_EXTENSION}")
+    main_window.fun_save((f"{file}", ""))
+    main_window.gui_structure.int_a.set_value(6)
+    main_window.save_scenario()
+    main_window.saver.flush()
+    with open(file) as f:
+        assert json.load(f)["values"][2]["int_a"] == 5
+    close_tests(main_window, qtbot)
@@ -0,0 +1,135 @@
+import socket
+import threading
+
+import numpy as np
+
+from ScenarioGUI.gui_classes.gui_execution_backend import RemoteBackend, receive_message, send_message
+from ScenarioGUI.worker import WorkerServer
+
+from ..result_creating_class_for_tests import ResultsClass, data_2_results
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def start_server(port: int = 0) -> WorkerServer:
+    server = WorkerServer(("127.0.0.1", port), data_2_results, 2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def stop_server(server: WorkerServer) -> None:
+    server.shutdown()
+    server.server_close()
+
+
+def test_remote_workers(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    server = start_server()
+    port = server.server_address[1]
+    try:
+        # the first worker can not be reached, so the calculations are sent to the second one
+        main_window.activate_remote_workers(["127.0.0.1:1", f"127.0.0.1:{port}"])
+        main_window.save_scenario()
+        main_window.add_scenario()
+        gs.float_b.set_value(50)
+        main_window.save_scenario()
+        main_window.start_multiple_scenarios_calculation()
+        assert all(thread.backend is main_window.execution_backend for thread in main_window.threads)
+        _ = [thread.run() for thread in list(main_window.threads)]
+        assert [d_s.results.result for d_s in main_window.list_ds] == [102, 52]
+        assert isinstance(main_window.list_ds[0].results, ResultsClass)
+        assert main_window.list_ds[0].run_statistics.cpu_time is not None
+        unreachable, worker = main_window.execution_backend.workers
+        assert unreachable.failures == 1
+        assert worker.capacity == 2
+        assert worker.running == 0
+        assert len(worker.idle_connections) == 1
+
+        # the idle connection is replaced by a new one after the server is restarted
+        stop_server(server)
+        server = start_server(port)
+        main_window.add_scenario()
+        gs.float_b.set_value(60)
+        main_window.start_current_scenario_calculation()
+        main_window.threads[-1].run()
+        assert main_window.list_ds[2].results.result == 62
+    finally:
+        stop_server(server)
+    close_tests(main_window, qtbot)
+
+
+def test_no_remote_worker_reachable(qtbot):
+    main_window = start_tests(qtbot)
+    backend = RemoteBackend(["127.0.0.1:1"], ResultsClass.from_dict)
+    backend.RETRY_DELAY = 0.01
+    debug_message, results = backend.run(main_window.list_ds[0], None)
+    assert results is None
+    assert "no remote worker reachable" in debug_message
+    assert backend.workers[0].failures == 2
+    close_tests(main_window, qtbot)
+
+
+def test_send_numpy_message():
+    sender, receiver = socket.socketpair()
+    try:
+        send_message(sender, {"array": np.arange(3), "value": np.float64(1.5)})
+        assert receive_message(receiver) == {"array": [0, 1, 2], "value": 1.5}
+    finally:
+        sender.close()
+        receiver.close()
+
+
+def test_remote_worker_not_serializable(qtbot):
+    main_window = start_tests(qtbot)
+    server = start_server()
+    try:
+        backend = RemoteBackend([f"127.0.0.1:{server.server_address[1]}"], ResultsClass.from_dict)
+        d_s = main_window.list_ds[0]
+        d_s.to_dict = lambda: {"values": {1, 2}}
+        debug_message, results = backend.run(d_s, None)
+        assert results is None
+        assert "not JSON serializable" in debug_message
+        # the worker slot is released and the worker is not marked as failed
+        worker = backend.workers[0]
+        assert worker.running == 0
+        assert worker.failures == 0
+        assert len(worker.idle_connections) == 1
+        backend.shutdown()
+    finally:
+        stop_server(server)
+    close_tests(main_window, qtbot)
+
+
+def test_remote_worker_time_out(qtbot):
+    main_window = start_tests(qtbot)
+    listener = socket.create_server(("127.0.0.1", 0))
+    connections = []
+
+    def serve() -> None:
+        # the server accepts the calculations but never answers
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            connections.append(connection)
+            send_message(connection, {"capacity": 1})
+
+    threading.Thread(target=serve, daemon=True).start()
+    try:
+        backend = RemoteBackend([f"127.0.0.1:{listener.getsockname()[1]}"], ResultsClass.from_dict, grace_time=0.1)
+        debug_message, results = backend.run(main_window.list_ds[0], 0.1)
+        assert results is None
+        assert "run time > 0.1s" in debug_message
+        # the calculation is not repeated and the worker is not marked as failed
+        assert len(connections) == 1
+        worker = backend.workers[0]
+        assert worker.running == 0
+        assert worker.failures == 0
+        assert not worker.idle_connections
+    finally:
+        listener.close()
+        _ = [connection.close() for connection in connections]
+    close_tests(main_window, qtbot)
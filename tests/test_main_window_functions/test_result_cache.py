@@ -0,0 +1,84 @@
+import numpy as np
+
+from ScenarioGUI.gui_classes.gui_combine_window import normal_export, normal_import
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage, LazyResults
+from ScenarioGUI.gui_classes.gui_result_cache import ResultCache
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_result_cache(qtbot, tmp_path):
+    main_window = start_tests(qtbot)
+    main_window.default_path = tmp_path
+    main_window.activate_result_cache("1")
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    main_window.start_current_scenario_calculation()
+    main_window.threads[-1].run()
+    # the results are written by the background saver
+    assert not list(tmp_path.joinpath("result_cache").iterdir())
+    main_window.saver.flush()
+    assert len(list(tmp_path.joinpath("result_cache").iterdir())) == 1
+    # project without results is filled from the cache
+    file = tmp_path.joinpath("project.scenario")
+    main_window._save_to_data(file)
+    saving = normal_import(file)
+    saving["results"] = [None for _ in saving["results"]]
+    normal_export(file, saving)
+    main_window._load_from_data(file)
+    assert np.isclose(main_window.list_ds[0].results.result, 102)
+    assert main_window.result_cache.hits == 1
+    assert main_window.status_bar.label.text() == f"{main_window.result_cache}"
+    # the results object is only created when the results are needed
+    d_s = DataStorage(gs)
+    assert main_window._load_cached_results(d_s)
+    assert isinstance(d_s.results, LazyResults)
+    assert main_window.result_cache.hits == 2
+    # added scenarios without a cached result are calculated
+    main_window.add_scenario()
+    gs.float_b.set_value(102)
+    main_window.save_scenario()
+    main_window.list_ds[0].results = None
+    main_window.start_multiple_scenarios_calculation()
+    assert main_window.list_ds[0].results is not None
+    assert len(main_window.threads) == 1
+    assert main_window.result_cache.misses == 1
+    main_window.threads[-1].run()
+    # results of another model version are not used
+    main_window.activate_result_cache("2")
+    main_window._load_from_data(file)
+    assert main_window.list_ds[0].results is None
+    assert main_window.result_cache.misses == 1
+    # the cache file is only read when the results are loaded, so a removed file leaves the scenario without results
+    main_window.activate_result_cache("1")
+    main_window._load_from_data(file)
+    d_s = DataStorage(gs)
+    assert main_window._load_cached_results(d_s)
+    main_window.result_cache.clear()
+    assert d_s.load_results() is None
+    assert d_s.results is None
+    close_tests(main_window, qtbot)
+
+
+def test_result_cache_eviction(qtbot, tmp_path):
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    cache = ResultCache(tmp_path, max_size=1)
+    main_window.save_scenario()
+    d_s = main_window.list_ds[0]
+    d_s.results = main_window.result_creating_class(1, 2)
+    cache.put(d_s)
+    assert not list(tmp_path.iterdir())
+    assert cache.size == 0
+    cache.max_size = 10_000
+    cache.put(d_s)
+    assert cache.get(d_s) == d_s.results.to_dict()
+    # the size of the folder is tracked, so it is not scanned by every put
+    assert cache.size == cache.file(d_s).stat().st_size
+    assert ResultCache(tmp_path).size == cache.size
+    cache.clear()
+    assert cache.get(d_s) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    close_tests(main_window, qtbot)
@@ -0,0 +1,53 @@
+import numpy as np
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def calculate(main_window) -> None:
+    main_window.start_current_scenario_calculation()
+    _ = [thread.run() for thread in list(main_window.threads)]
+
+
+def test_cosmetic_changes_keep_results(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    gs.text_box.set_dependent_aims()
+    gs.float_a.set_dependent_aims(gs.aim_sub)
+    main_window.save_scenario()
+    calculate(main_window)
+    results = main_window.list_ds[0].results
+    assert np.isclose(results.result, 102)
+
+    # the text box does not influence any results
+    gs.text_box.set_value("new text")
+    assert main_window.list_ds[0].results is results
+    assert main_window.list_widget_scenario.item(0).text()[-1] == "*"
+    main_window.save_scenario()
+    assert main_window.list_ds[0].text_box == "new text"
+    assert main_window.list_ds[0].results is results
+
+    # float_a only influences the results of the subtraction
+    gs.float_a.set_value(10)
+    main_window.save_scenario()
+    assert main_window.list_ds[0].results is results
+
+    # float_b influences the results of all aims
+    gs.float_b.set_value(10)
+    assert main_window.list_ds[0].results is None
+    close_tests(main_window, qtbot)
+
+
+def test_results_depend_on_aims_of_linked_options(qtbot):
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    assert gs.results_depend_on(gs.int_small_1)
+    gs.aim_sub.add_link_2_show(gs.category_grid)
+    assert not gs.results_depend_on(gs.int_small_1)
+    gs.aim_sub.widget.click()
+    assert gs.results_depend_on(gs.int_small_1)
+    gs.int_a.set_dependent_aims(gs.aim_add)
+    assert not gs.results_depend_on(gs.int_a)
+    close_tests(main_window, qtbot)
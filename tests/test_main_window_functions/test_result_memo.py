@@ -0,0 +1,72 @@
+import numpy as np
+
+from ScenarioGUI.gui_classes.gui_data_storage import DataStorage
+from ScenarioGUI.gui_classes.gui_result_memo import ResultMemo
+
+from ..starting_closing_tests import close_tests, start_tests
+
+
+def test_fingerprint(qtbot):
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    d_s = DataStorage(gs)
+    assert d_s.fingerprint() == DataStorage(gs).fingerprint()
+    assert d_s.fingerprint() == DataStorage.from_values(d_s.to_dict()).fingerprint()
+    gs.float_b.set_value(gs.float_b.get_value() + 1)
+    assert d_s.fingerprint() != DataStorage(gs).fingerprint()
+    close_tests(main_window, qtbot)
+
+
+def test_duplicated_scenarios_are_calculated_once(qtbot):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    # only renamed scenario
+    main_window.add_scenario()
+    main_window.fun_rename_scenario("copy")
+    main_window.add_scenario()
+    gs.float_b.set_value(102)
+    main_window.save_scenario()
+
+    main_window.start_multiple_scenarios_calculation()
+    assert len(main_window.threads) == 2
+    assert main_window.threads[0].item is main_window.list_widget_scenario.item(0)
+    # the renamed scenario is attached to the running calculation
+    assert main_window.list_ds[1].results is None
+    _ = [thread.run() for thread in list(main_window.threads)]
+    assert np.isclose(main_window.list_ds[0].results.result, 102)
+    assert main_window.list_ds[1].results is main_window.list_ds[0].results
+    assert np.isclose(main_window.list_ds[2].results.result, 104)
+
+    # a duplicate of an already calculated scenario reuses the results without a calculation
+    main_window.change_scenario(2)
+    main_window.add_scenario()
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    assert not main_window.threads
+    assert main_window.list_ds[3].results is main_window.list_ds[2].results
+    close_tests(main_window, qtbot)
+
+
+def test_result_memo_limit(qtbot):
+    main_window = start_tests(qtbot)
+    gs = main_window.gui_structure
+    memo = ResultMemo(max_results=2)
+    list_ds = []
+    for value in range(3):
+        gs.float_b.set_value(value)
+        d_s = DataStorage(gs)
+        d_s.results = value
+        list_ds.append(d_s)
+    memo.add(list_ds[0])
+    memo.add(list_ds[1])
+    # the used results are kept, the least recently used ones are removed
+    d_s = DataStorage.from_values(list_ds[0].to_dict())
+    assert memo.lookup(d_s)
+    memo.add(list_ds[2])
+    assert len(memo.results) == 2
+    assert not memo.lookup(DataStorage.from_values(list_ds[1].to_dict()))
+    assert memo.lookup(DataStorage.from_values(list_ds[2].to_dict()))
+    close_tests(main_window, qtbot)
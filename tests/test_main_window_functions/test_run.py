@@ -36,9 +36,7 @@ def test_run(qtbot):  # noqa: PLR0915
     assert main_window.list_ds[main_window.list_widget_scenario.currentRow()].results is not None
     main_window.check_results()
     main_window.auto_save()
-    thread = main_window.saving_threads[0]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     main_window.load_backup()
     assert np.isclose(main_window.list_ds[main_window.list_widget_scenario.currentRow()].results.result, 102)
     main_window.list_ds[main_window.list_widget_scenario.currentRow()].results.adding()
@@ -160,6 +158,9 @@ def test_max_run_time(qtbot):
             self.role = role
             self.ds = data
 
+        def text(self):
+            return "Item"
+
     class Signal:
         def emit(self, *args):
             pass
@@ -172,24 +173,30 @@ def test_max_run_time(qtbot):
             self.results = ""
 
     class Thread:
+        USE_MULTITHREADING = True
 
         def __init__(self):
             self.d_s = Data()
             self.calculated = False
+            self.progress = 0.0
+            self.backend = None
+            self.batch = None
             self.item = Item()
             self.any_signal = Signal()
 
         def terminate(self):
             pass
 
-        def wait(self, time: int):
-            return False
-
     main_window.start_current_scenario_calculation()
     thread = Thread()
-    main_window.wait_2_terminate(thread)
+    main_window.supervisor.add(thread)
+    main_window.supervisor.check()
+    assert not thread.calculated
+    main_window.supervisor.start_times[thread] -= 2
+    main_window.supervisor.check()
     assert thread.calculated
     assert thread.d_s.results is None
+    assert thread not in main_window.supervisor.start_times
 
 
 def test_calculate():
@@ -0,0 +1,89 @@
+import numpy as np
+import PySide6.QtCore as QtC
+
+import ScenarioGUI.global_settings as globs
+from ScenarioGUI.gui_classes.gui_run_statistics import RunProfiler, RunStatistics
+from ScenarioGUI.gui_classes.gui_worker_pool import WorkerPool
+
+from ..result_creating_class_for_tests import data_2_results
+from ..starting_closing_tests import close_tests, start_tests
+from .test_worker_pool import Data
+
+
+def test_run_profiler():
+    with RunProfiler(trace_memory=True) as profiler:
+        array = np.ones(1_000_000)
+    del array
+    statistics = profiler.statistics
+    assert statistics.wall_time > 0
+    assert statistics.cpu_time is not None
+    assert statistics.peak_memory >= 8_000_000
+    # the peak resident set size of the process is measured as well
+    with RunProfiler(trace_memory=True) as profiler:
+        array = np.empty(20_000_000)
+        array.fill(1)
+    del array
+    assert profiler.statistics.peak_rss >= 160_000_000
+    assert RunStatistics.from_dict(statistics.to_dict()).to_dict() == statistics.to_dict()
+    assert RunStatistics(2, 1).cpu_usage == 0.5
+    assert RunStatistics(2).cpu_usage is None
+
+
+def test_worker_pool_statistics():
+    pool = WorkerPool(data_2_results, 1, trace_memory=True)
+    statistics: list[RunStatistics] = []
+    debug_message, results = pool.run(Data(), 10, statistics=statistics.append)
+    assert np.isclose(results.result, 102)
+    assert len(statistics) == 1
+    assert statistics[0].peak_memory is not None
+    assert statistics[0].peak_rss is not None
+    assert statistics[0].scenarios == 1
+    # the time out is not measured by the worker
+    pool.run(Data(0, aim_add=False), 1, statistics=statistics.append)
+    assert len(statistics) == 1
+    pool.shutdown()
+
+
+def test_run_statistics(qtbot, tmp_path):
+    main_window = start_tests(qtbot)
+    main_window.remove_previous_calculated_results()
+    main_window.activate_run_statistics()
+    assert main_window.action_run_statistics in main_window.menu_calculation.actions()
+    gs = main_window.gui_structure
+    gs.aim_add.widget.click() if not gs.aim_add.widget.isChecked() else None
+    main_window.save_scenario()
+    main_window.add_scenario()
+    gs.aim_sub.widget.click()
+    gs.int_a.set_value(0)
+    main_window.save_scenario()
+    main_window.start_multiple_scenarios_calculation()
+    _ = [thread.run() for thread in list(main_window.threads)]
+    statistics_add, statistics_sub = [d_s.run_statistics for d_s in main_window.list_ds]
+    # the subtraction sleeps for 5 seconds
+    assert statistics_sub.wall_time > 4 > statistics_add.wall_time
+    assert statistics_sub.cpu_time < 4
+    assert statistics_add.peak_memory is None
+    assert statistics_add.peak_rss is None
+
+    main_window.fun_run_statistics()
+    table = main_window.run_statistics_dialog.table
+    assert table.rowCount() == 2
+    table.sortItems(1, QtC.Qt.DescendingOrder)
+    assert table.item(0, 0).text() == main_window.list_widget_scenario.item(1).text()
+
+    # the statistics are saved in the project file
+    main_window._save_to_data(tmp_path.joinpath(f"test.{globs.FILE_EXTENSION}"))
+    main_window._load_from_data(tmp_path.joinpath(f"test.{globs.FILE_EXTENSION}"))
+    assert main_window.list_ds[1].run_statistics.to_dict() == statistics_sub.to_dict()
+    # the statistics are removed together with the results
+    main_window.list_widget_scenario.setCurrentRow(1)
+    gs.int_a.set_value(1)
+    assert main_window.list_ds[1].run_statistics is None
+    # the dialog and the menu action are translated
+    assert table.horizontalHeaderItem(1).text() == "Wall time [s]"
+    main_window.menu_language.actions()[1].trigger()
+    assert main_window.run_statistics_dialog.windowTitle() == main_window.translations.action_run_statistics[1]
+    assert main_window.action_run_statistics.text() == main_window.translations.action_run_statistics[1]
+    assert table.horizontalHeaderItem(1).text() == "Laufzeit [s]"
+    main_window.menu_language.actions()[0].trigger()
+    close_tests(main_window, qtbot)
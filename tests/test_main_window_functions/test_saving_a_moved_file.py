@@ -31,9 +31,7 @@ def test_saving_a_moved_fie(qtbot):
     )
     main_window.action_save_as.trigger()
     assert Path(main_window.filename[0]) == filename1
-    thread = main_window.saving_threads[-1]
-    thread.run()
-    assert thread.calculated
+    main_window.saver.flush()
     os.replace(filename1, filename2)
     main_window.action_open.trigger()
     main_window.fun_save()
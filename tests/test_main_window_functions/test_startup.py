@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# budget of the import of ScenarioGUI (including PySide6, matplotlib and pandas) in milliseconds
+IMPORT_TIME_BUDGET: int = 4000
+
+path = Path(__file__).parent.parent
+
+
+def run_python(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=path.parent).stdout
+
+
+def test_no_file_system_search():
+    # the file system is not searched recursively by the import and the loading of the config
+    code = (
+        "import pathlib\n"
+        "original_glob = pathlib.Path.glob\n"
+        "def glob(self, pattern, *args, **kwargs):\n"
+        "    assert '**' not in pattern, 'file system searched'\n"
+        "    return original_glob(self, pattern, *args, **kwargs)\n"
+        "pathlib.Path.glob = glob\n"
+        "import ScenarioGUI\n"
+        "import ScenarioGUI.global_settings as globs\n"
+        f"ScenarioGUI.load_config(r'{path.joinpath('gui_config.ini')}')\n"
+        "print(globs.VERSION, globs.FOLDER)\n"
+    )
+    version, folder = run_python(code).split()
+    assert Path(folder) == path.parent.joinpath("ScenarioGUI")
+    assert version != "0.0.0"
+
+
+def test_import_time():
+    code = "import time\nstart = time.perf_counter()\nimport ScenarioGUI\nprint(time.perf_counter() - start)\n"
+    # the fastest of three imports is used, so a busy machine does not fail the test
+    import_time = min(float(run_python(code)) for _ in range(3))
+    assert import_time * 1_000 < IMPORT_TIME_BUDGET
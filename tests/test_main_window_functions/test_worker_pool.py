@@ -0,0 +1,173 @@
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from ScenarioGUI.gui_classes import gui_shared_arrays
+from ScenarioGUI.gui_classes.gui_worker_pool import WorkerPool
+
+from ..result_creating_class_for_tests import ResultsClass, data_2_results
+from ..starting_closing_tests import close_tests, start_tests
+
+
+class Data:
+    def __init__(self, int_a: int = 2, float_b: float = 100, aim_add: bool = True):
+        self.int_a = int_a
+        self.float_b = float_b
+        self.aim_add = aim_add
+
+
+def crashing_data_2_results(data: Data):
+    result = ResultsClass(data.int_a, data.float_b)
+    return result, os.abort if data.int_a == 0 else result.adding
+
+
+def get_pids(pool: WorkerPool) -> set[int]:
+    return {worker.process.pid for worker in pool._workers}
+
+
+def test_worker_pool_reuses_workers():
+    pool = WorkerPool(data_2_results, 2)
+    assert pool.n_workers == 0
+    debug_message, results = pool.run(Data(), 10)
+    assert debug_message == ""
+    assert np.isclose(results.result, 102)
+    pids = get_pids(pool)
+    for value in range(3, 6):
+        debug_message, results = pool.run(Data(value), 10)
+        assert np.isclose(results.result, value + 100)
+    assert pool.n_workers == 1
+    assert get_pids(pool) == pids
+    # errors of the calculation do not recycle the worker
+    debug_message, results = pool.run(Data(200, aim_add=False), 10)
+    assert f"{debug_message}" == "Value above 190"
+    assert results is None
+    assert get_pids(pool) == pids
+    pool.shutdown()
+    assert pool.n_workers == 0
+
+
+def test_worker_pool_time_out():
+    pool = WorkerPool(data_2_results, 1)
+    pool.run(Data(), 10)
+    pids = get_pids(pool)
+    debug_message, results = pool.run(Data(aim_add=False), 0.5)
+    assert "run time > 0.5s" in debug_message
+    assert results is None
+    assert pool.n_workers == 0
+    debug_message, results = pool.run(Data(), 10)
+    assert np.isclose(results.result, 102)
+    assert get_pids(pool) != pids
+    pool.shutdown()
+
+
+def test_worker_pool_time_out_includes_waiting():
+    pool = WorkerPool(data_2_results, 1)
+    thread = threading.Thread(target=pool.run, args=(Data(aim_add=False), 1))
+    thread.start()
+    time.sleep(0.2)
+    # the only worker is busy, so the time out is exceeded while waiting for it
+    start = time.monotonic()
+    debug_message, results = pool.run(Data(), 0.3)
+    assert "run time > 0.3s" in debug_message
+    assert results is None
+    assert time.monotonic() - start < 0.8
+    thread.join()
+    pool.shutdown()
+
+
+def test_worker_pool_crash():
+    pool = WorkerPool(crashing_data_2_results, 1)
+    debug_message, results = pool.run(Data(0), 10)
+    assert "crashed" in debug_message
+    assert results is None
+    assert pool.n_workers == 0
+    debug_message, results = pool.run(Data(), 10)
+    assert np.isclose(results.result, 102)
+    pool.shutdown()
+
+
+def test_worker_pool_resize():
+    pool = WorkerPool(data_2_results, 3)
+    pool.run(Data(), 10)
+    assert pool.n_workers == 1
+    pool.resize(0)
+    assert pool.size == 1
+    assert pool.n_workers == 1
+    pool.resize(4)
+    assert pool.size == 4
+    pool.shutdown()
+
+
+def progress_data_2_results(data: Data):
+    result = ResultsClass(data.int_a, data.float_b)
+
+    def func(progress, partial_results):
+        for i in range(1, 5):
+            progress(i / 4)
+        partial_results(ResultsClass(data.int_a, 0))
+        result.adding()
+
+    return result, func
+
+
+def test_worker_pool_progress_and_partial_results():
+    pool = WorkerPool(progress_data_2_results, 1)
+    progress, partial_results = [], []
+    debug_message, results = pool.run(Data(), None, progress.append, partial_results.append)
+    assert debug_message == ""
+    assert np.isclose(results.result, 102)
+    assert progress == [0.25, 0.5, 0.75, 1.0]
+    assert [(res.a, res.b) for res in partial_results] == [(2, 0)]
+    # the progress is ignored if no function is given
+    debug_message, results = pool.run(Data(), 10)
+    assert np.isclose(results.result, 102)
+    pool.shutdown()
+
+
+class ArrayResults:
+    def __init__(self, size: int):
+        self.size = size
+        self.small = np.arange(10)
+        self.large = None
+
+    def calculate(self):
+        self.large = np.arange(self.size, dtype=float)
+
+
+def array_data_2_results(data: Data):
+    result = ArrayResults(data.int_a)
+    return result, result.calculate
+
+
+def test_worker_pool_shared_arrays():
+    pool = WorkerPool(array_data_2_results, 1, share_arrays_above=1_000)
+    debug_message, results = pool.run(Data(100_000), 10)
+    assert debug_message == ""
+    assert isinstance(results.large, np.memmap)
+    assert np.array_equal(results.large, np.arange(100_000, dtype=float))
+    assert not os.path.exists(results.large.filename)
+    # the arrays are mapped copy-on-write
+    results.large[0] = 5
+    assert results.large[0] == 5
+    assert not isinstance(results.small, np.memmap)
+    # without sharing, all arrays are pickled
+    pool.share_arrays_above = None
+    debug_message, results = pool.run(Data(100_000), 10)
+    assert not isinstance(results.large, np.memmap)
+    # files of results which have not been read (e.g. because of a time out) are removed with the worker
+    (pid,) = get_pids(pool)
+    leftover = os.path.join(tempfile.gettempdir(), f"{gui_shared_arrays.PREFIX}{pid}_leftover.npy")
+    np.save(leftover, np.arange(3))
+    pool.shutdown()
+    assert not os.path.exists(leftover)
+
+
+def test_activate_shared_memory_results(qtbot):
+    main_window = start_tests(qtbot)
+    assert main_window.worker_pool.share_arrays_above is None
+    main_window.activate_shared_memory_results(5_000)
+    assert main_window.worker_pool.share_arrays_above == 5_000
+    close_tests(main_window, qtbot)